@@ -0,0 +1,51 @@
+# encoding: utf-8
+
+"""Timing benchmarks for adding charts and replacing their data."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from pptx import Presentation
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.util import Inches
+
+from .common import chart_data_for
+
+
+class AddChartSuite(object):
+    """Adding a three-series chart of each type and point count."""
+
+    params = (
+        ["COLUMN_CLUSTERED", "LINE_MARKERS", "PIE", "XY_SCATTER"],
+        [10, 1000],
+    )
+    param_names = ["chart_type", "point_count"]
+
+    def setup(self, chart_type, point_count):
+        self.chart_type = getattr(XL_CHART_TYPE, chart_type)
+        self.chart_data = chart_data_for(self.chart_type, point_count)
+        prs = Presentation()
+        self.shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+
+    def time_add_chart(self, chart_type, point_count):
+        self.shapes.add_chart(
+            self.chart_type, 0, 0, Inches(6), Inches(4), self.chart_data
+        )
+
+
+class ReplaceDataSuite(object):
+    """Replacing the data of an existing chart."""
+
+    params = (["COLUMN_CLUSTERED", "XY_SCATTER"], [10, 1000])
+    param_names = ["chart_type", "point_count"]
+
+    def setup(self, chart_type, point_count):
+        chart_type = getattr(XL_CHART_TYPE, chart_type)
+        prs = Presentation()
+        shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+        self.chart = shapes.add_chart(
+            chart_type, 0, 0, Inches(6), Inches(4), chart_data_for(chart_type, 10)
+        ).chart
+        self.chart_data = chart_data_for(chart_type, point_count)
+
+    def time_replace_data(self, chart_type, point_count):
+        self.chart.replace_data(self.chart_data)
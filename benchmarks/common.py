@@ -0,0 +1,128 @@
+# encoding: utf-8
+
+"""Synthetic inputs shared by the benchmark suites."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import struct
+import zlib
+
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData, XyChartData
+from pptx.compat import BytesIO
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.util import Inches, Pt
+
+FONT_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "test_files", "calibriz.ttf"
+)
+
+
+def category_chart_data(point_count, series_count=3):
+    """Return category chart data having *series_count* series of *point_count*."""
+    chart_data = CategoryChartData()
+    chart_data.categories = ["Cat %d" % idx for idx in range(point_count)]
+    for series_idx in range(series_count):
+        chart_data.add_series(
+            "Series %d" % series_idx,
+            [(idx * (series_idx + 7)) % 101 for idx in range(point_count)],
+        )
+    return chart_data
+
+
+def chart_data_for(chart_type, point_count):
+    """Return chart data suitable for *chart_type* having *point_count* points."""
+    if chart_type in (XL_CHART_TYPE.XY_SCATTER, XL_CHART_TYPE.XY_SCATTER_LINES):
+        chart_data = XyChartData()
+        for series_idx in range(3):
+            series = chart_data.add_series("Series %d" % series_idx)
+            for idx in range(point_count):
+                series.add_data_point(idx, (idx * (series_idx + 7)) % 101)
+        return chart_data
+    return category_chart_data(point_count)
+
+
+def png_bytes(seed, size=16):
+    """
+    Return the bytes of a *size* x *size* pixel RGB PNG image. Images having
+    a different *seed* have different content and so are not de-duplicated.
+    """
+
+    def chunk(tag, data):
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    pixel = struct.pack(">BBB", seed % 256, (seed // 256) % 256, (seed * 7) % 256)
+    raw = (b"\x00" + pixel * size) * size
+    return b"".join(
+        (
+            b"\x89PNG\r\n\x1a\n",
+            chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)),
+            chunk(b"IDAT", zlib.compress(raw)),
+            chunk(b"IEND", b""),
+        )
+    )
+
+
+def synthetic_deck(slide_count, image_count=5):
+    """
+    Return the bytes of a .pptx package having *slide_count* slides typical
+    of a generated report. Each slide has a title, a text box of bullet-like
+    paragraphs, a picture drawn from *image_count* distinct images, and
+    a small table; every fifth slide also has a chart.
+    """
+    prs = Presentation()
+    layout = prs.slide_layouts[5]
+    images = [png_bytes(idx) for idx in range(image_count)]
+    for slide_idx in range(slide_count):
+        slide = prs.slides.add_slide(layout)
+        shapes = slide.shapes
+        shapes.title.text = "Slide %d" % slide_idx
+
+        text_frame = shapes.add_textbox(
+            Inches(0.5), Inches(1.5), Inches(4), Inches(2)
+        ).text_frame
+        text_frame.text = "Summary for slide %d" % slide_idx
+        for idx in range(4):
+            text_frame.add_paragraph().text = "Point %d of slide %d" % (idx, slide_idx)
+
+        shapes.add_picture(
+            BytesIO(images[slide_idx % image_count]),
+            Inches(5),
+            Inches(1.5),
+            Inches(2),
+        )
+
+        table = shapes.add_table(
+            5, 4, Inches(0.5), Inches(4), Inches(6), Inches(2)
+        ).table
+        table.set_values(
+            [["R%dC%d" % (row, col) for col in range(4)] for row in range(5)]
+        )
+
+        if slide_idx % 5 == 0:
+            shapes.add_chart(
+                XL_CHART_TYPE.COLUMN_CLUSTERED,
+                Inches(7),
+                Inches(4),
+                Inches(2.5),
+                Inches(2),
+                category_chart_data(12),
+            )
+    return save(prs)
+
+
+def save(prs):
+    """Return the bytes of *prs* saved as a .pptx package."""
+    stream = BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
+
+
+def text_box(slide, text, font_size=Pt(18)):
+    """Return a new text box on *slide* containing *text*."""
+    shape = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(2))
+    shape.text_frame.text = text
+    shape.text_frame.paragraphs[0].font.size = font_size
+    return shape
@@ -0,0 +1,100 @@
+# encoding: utf-8
+
+"""Memory benchmarks for high-cardinality python-pptx objects.
+
+Each ``track_*`` benchmark reports the average number of bytes allocated per
+instance, so growth in the footprint of these objects shows up as
+a regression between commits.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import tracemalloc
+
+from pptx.chart.data import (
+    BubbleChartData,
+    Category,
+    CategoryChartData,
+    CategoryDataPoint,
+    XyChartData,
+    XyDataPoint,
+)
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import _Relationship
+from pptx.opc.packuri import PackURI
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.table import _Cell
+
+N = 10000
+
+
+def _bytes_per_object(factory, n=N):
+    """Return average bytes allocated by each of *n* calls to *factory*."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [factory(i) for i in range(n)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # ---exclude the list holding the objects---
+    return (after - before - objects.__sizeof__()) / n
+
+
+class ChartDataSuite(object):
+    """Per-point footprint of chart data objects."""
+
+    def setup(self):
+        self.category_series = CategoryChartData().add_series("S1")
+        self.xy_series = XyChartData().add_series("S1")
+        self.bubble_series = BubbleChartData().add_series("S1")
+        self.categories = CategoryChartData().categories
+
+    def track_category_data_point(self):
+        series = self.category_series
+        return _bytes_per_object(lambda i: CategoryDataPoint(series, 1.0, None))
+
+    track_category_data_point.unit = "bytes"
+
+    def track_xy_data_point(self):
+        series = self.xy_series
+        return _bytes_per_object(lambda i: XyDataPoint(series, 1.0, 2.0, None))
+
+    track_xy_data_point.unit = "bytes"
+
+    def track_category(self):
+        categories = self.categories
+        return _bytes_per_object(lambda i: Category("label", categories))
+
+    track_category.unit = "bytes"
+
+
+class OpcSuite(object):
+    """Per-instance footprint of package-level value objects."""
+
+    def track_relationship(self):
+        baseURI = "/ppt/slides"
+        return _bytes_per_object(
+            lambda i: _Relationship("rId%d" % i, RT.IMAGE, None, baseURI)
+        )
+
+    track_relationship.unit = "bytes"
+
+    def track_packuri(self):
+        return _bytes_per_object(lambda i: PackURI("/ppt/slides/slide%d.xml" % i))
+
+    track_packuri.unit = "bytes"
+
+
+class ProxySuite(object):
+    """Per-instance footprint of shape and table proxy objects."""
+
+    def setup(self):
+        self.tc = parse_xml("<a:tc %s/>" % nsdecls("a"))
+
+    def track_cell(self):
+        tc = self.tc
+        return _bytes_per_object(lambda i: _Cell(tc, None))
+
+    track_cell.unit = "bytes"
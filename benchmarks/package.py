@@ -0,0 +1,88 @@
+# encoding: utf-8
+
+"""Timing benchmarks for opening, saving, and adding slides to a package."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import shutil
+import tempfile
+
+from pptx import Presentation
+from pptx.compat import BytesIO
+from pptx.split import split
+
+from .common import save, synthetic_deck
+
+
+class ImportSuite(object):
+    """Time taken to import the package in a fresh interpreter."""
+
+    def timeraw_import_pptx(self):
+        return "import pptx"
+
+
+class OpenSuite(object):
+    """Loading a package of each size."""
+
+    params = [10, 100]
+    param_names = ["slide_count"]
+
+    def setup(self, slide_count):
+        self.blob = synthetic_deck(slide_count)
+
+    def time_open(self, slide_count):
+        Presentation(BytesIO(self.blob))
+
+    def time_open_4_workers(self, slide_count):
+        Presentation(BytesIO(self.blob), workers=4)
+
+
+class SaveSuite(object):
+    """Saving a loaded package of each size."""
+
+    params = [10, 100]
+    param_names = ["slide_count"]
+
+    def setup(self, slide_count):
+        self.prs = Presentation(BytesIO(synthetic_deck(slide_count)))
+
+    def time_save(self, slide_count):
+        save(self.prs)
+
+
+class SplitSuite(object):
+    """Writing each slide of a package to its own package."""
+
+    number = 1
+    params = [10, 100]
+    param_names = ["slide_count"]
+
+    def setup(self, slide_count):
+        self.blob = synthetic_deck(slide_count)
+        self.out_dir = tempfile.mkdtemp()
+
+    def teardown(self, slide_count):
+        shutil.rmtree(self.out_dir)
+
+    def time_split(self, slide_count):
+        split(BytesIO(self.blob), self.out_dir)
+
+    def time_split_dropping_unused_layouts(self, slide_count):
+        split(BytesIO(self.blob), self.out_dir, drop_unused_layouts=True)
+
+
+class AddSlideSuite(object):
+    """Adding slides to a presentation that already has some."""
+
+    number = 1
+    params = [0, 100]
+    param_names = ["existing_slide_count"]
+
+    def setup(self, existing_slide_count):
+        self.prs = Presentation(BytesIO(synthetic_deck(existing_slide_count)))
+        self.layout = self.prs.slide_layouts[1]
+
+    def time_add_20_slides(self, existing_slide_count):
+        slides, layout = self.prs.slides, self.layout
+        for _ in range(20):
+            slides.add_slide(layout)
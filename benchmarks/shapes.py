@@ -0,0 +1,135 @@
+# encoding: utf-8
+
+"""Timing benchmarks for adding, filling, and cloning shapes."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+
+from pptx import Presentation
+from pptx.compat import BytesIO
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.util import Inches
+
+from .common import FONT_FILE, category_chart_data, png_bytes, text_box
+
+
+class AddPictureSuite(object):
+    """Adding 20 pictures, either all new or all already in the package."""
+
+    number = 1
+    params = ["new", "duplicate"]
+    param_names = ["image"]
+
+    def setup(self, image):
+        prs = Presentation()
+        self.shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+        self.images = [png_bytes(idx) for idx in range(20)]
+        if image == "duplicate":
+            for blob in self.images:
+                self.shapes.add_picture(BytesIO(blob), 0, 0)
+
+    def time_add_20_pictures(self, image):
+        shapes = self.shapes
+        for blob in self.images:
+            shapes.add_picture(BytesIO(blob), 0, 0)
+
+
+class TableSuite(object):
+    """Adding a 20-column table and filling its cells."""
+
+    params = [10, 200]
+    param_names = ["row_count"]
+
+    def setup(self, row_count):
+        prs = Presentation()
+        self.shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+        self.table = self._add_table(row_count)
+        self.values = [
+            ["%d.%d" % (row, col) for col in range(20)] for row in range(row_count)
+        ]
+
+    def time_add_table(self, row_count):
+        self._add_table(row_count)
+
+    def time_fill_cell_by_cell(self, row_count):
+        cell = self.table.cell
+        for row_idx, row in enumerate(self.values):
+            for col_idx, value in enumerate(row):
+                cell(row_idx, col_idx).text = value
+
+    def time_set_values(self, row_count):
+        self.table.set_values(self.values)
+
+    def _add_table(self, row_count):
+        return self.shapes.add_table(row_count, 20, 0, 0, Inches(9), Inches(6)).table
+
+
+class FitTextSuite(object):
+    """Fitting a paragraph of text to its text box."""
+
+    def setup(self):
+        if not os.path.exists(FONT_FILE):
+            raise NotImplementedError("font file not available")
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        self.text_frame = text_box(slide, " ".join(["lorem ipsum"] * 40)).text_frame
+
+    def time_fit_text(self):
+        self.text_frame.fit_text(max_size=40, font_file=FONT_FILE)
+
+
+class CloneShapeSuite(object):
+    """Cloning a shape of each kind to another slide."""
+
+    params = ["autoshape", "picture", "chart", "table"]
+    param_names = ["shape"]
+
+    def setup(self, shape):
+        prs = Presentation()
+        layout = prs.slide_layouts[6]
+        shapes = prs.slides.add_slide(layout).shapes
+        self.shape = {
+            "autoshape": lambda: text_box(shapes.parent, "Clone me"),
+            "picture": lambda: shapes.add_picture(BytesIO(png_bytes(0)), 0, 0),
+            "chart": lambda: shapes.add_chart(
+                XL_CHART_TYPE.COLUMN_CLUSTERED,
+                0,
+                0,
+                Inches(4),
+                Inches(3),
+                category_chart_data(12),
+            ),
+            "table": lambda: shapes.add_table(5, 4, 0, 0, Inches(4), Inches(2)),
+        }[shape]()
+        self.target_shapes = prs.slides.add_slide(layout).shapes
+
+    def time_clone_shape(self, shape):
+        self.target_shapes.clone_shape(self.shape)
+
+
+class ThemeColorSuite(object):
+    """Resolving the RGB fill color of 100 slides of theme-colored shapes."""
+
+    def setup(self):
+        prs = Presentation()
+        layout = prs.slide_layouts[6]
+        for _ in range(100):
+            shapes = prs.slides.add_slide(layout).shapes
+            for idx in range(10):
+                fill = shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, 1, 1).fill
+                fill.solid()
+                fill.fore_color.theme_color = MSO_THEME_COLOR.ACCENT_1 + idx % 6
+                fill.fore_color.brightness = -0.25
+        stream = BytesIO()
+        prs.save(stream)
+        self.blob = stream.getvalue()
+
+    def time_resolve_fill_colors(self):
+        prs = Presentation(BytesIO(self.blob))
+        for slide in prs.slides:
+            theme_colors = slide.theme_colors
+            for shape in slide.shapes:
+                theme_colors.rgb(shape.fill.fore_color)
@@ -0,0 +1,36 @@
+# encoding: utf-8
+
+"""Timing benchmarks for reading the text of a presentation."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from pptx import Presentation
+from pptx.compat import BytesIO
+
+from .common import synthetic_deck
+
+
+class ExtractTextSuite(object):
+    """Reading every paragraph of a 100-slide presentation."""
+
+    def setup(self):
+        self.prs = Presentation(BytesIO(synthetic_deck(100)))
+
+    def time_extract_text(self):
+        list(self.prs.extract_text())
+
+
+class EffectiveFontSuite(object):
+    """Resolving the effective font of every run of a 100-slide presentation."""
+
+    def setup(self):
+        self.prs = Presentation(BytesIO(synthetic_deck(100)))
+
+    def time_effective_fonts(self):
+        for slide in self.prs.slides:
+            for shape in slide.shapes:
+                if not shape.has_text_frame:
+                    continue
+                for paragraph in shape.text_frame.paragraphs:
+                    for run in paragraph.runs:
+                        run.font.effective.size
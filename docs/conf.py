@@ -166,6 +166,8 @@ rst_epilog = """
 
 .. |_ColumnCollection| replace:: :class:`_ColumnCollection`
 
+.. |ColumnFormat| replace:: :class:`.ColumnFormat`
+
 .. |Connector| replace:: :class:`.Connector`
 
 .. |CoreProperties| replace:: :class:`.CoreProperties`
@@ -182,6 +184,10 @@ rst_epilog = """
 
 .. |DrawingOperations| replace:: :class:`.DrawingOperations`
 
+.. |EffectiveFont| replace:: :class:`.EffectiveFont`
+
+.. |EffectiveParagraphProperties| replace:: :class:`.EffectiveParagraphProperties`
+
 .. |Emu| replace:: :class:`.Emu`
 
 .. |False| replace:: :class:`False`
@@ -346,6 +352,8 @@ rst_epilog = """
 
 .. |TextFrame| replace:: :class:`.TextFrame`
 
+.. |ThemeColors| replace:: :class:`.ThemeColors`
+
 .. |TickLabels| replace:: :class:`.TickLabels`
 
 .. |True| replace:: :class:`True`
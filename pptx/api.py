@@ -15,17 +15,30 @@ from .opc.constants import CONTENT_TYPE as CT
 from .package import Package
 
 
-def Presentation(pptx=None):
+def Presentation(pptx=None, workers=None, slides=None):
     """
     Return a |Presentation| object loaded from *pptx*, where *pptx* can be
     either a path to a ``.pptx`` file (a string) or a file-like object. If
     *pptx* is missing or ``None``, the built-in default presentation
     "template" is loaded.
+
+    When *workers* is greater than 1, the parts of the package are
+    decompressed and parsed using that many threads, which can shorten the
+    time to open a presentation having many slides. The result is the same
+    as when loaded in a single thread.
+
+    When *slides* is not |None|, only the slides it selects are loaded, so
+    a few slides of a large presentation can be opened quickly. *slides* is
+    either a sequence of zero-based slide indices, like ``[3, 7]``, or
+    a callable taking such an index and returning |True| for each slide to be
+    loaded. Only the loaded slides then appear in ``Presentation.slides``.
+    The other slides, and the charts, images, and other parts only they
+    refer to, are kept unparsed and saved unchanged.
     """
     if pptx is None:
         pptx = _default_pptx_path()
 
-    presentation_part = Package.open(pptx).main_document_part
+    presentation_part = Package.open(pptx, workers, slides).main_document_part
 
     if not _is_pptx_package(presentation_part):
         tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
@@ -173,6 +173,32 @@ class Chart(PartElementProxy):
         rewriter.replace_series_data(self._chartSpace)
         self._workbook.update_from_xlsx_blob(chart_data.xlsx_blob)
 
+    def update_values(self, series_idx, values):
+        """
+        Change selected values of the series at *series_idx* in place.
+        *values* is a mapping of zero-based data point index to new value,
+        for example `{3: 42.0}`; a value of |None| clears that data point.
+        Only the affected points in the chart XML and the matching cells of
+        the embedded Excel workbook are changed, which is much faster than
+        :meth:`replace_data` when few values change. The number of series,
+        categories, and data points is unchanged; |IndexError| is raised for
+        a point index outside the series. Literal series values, which have
+        no workbook cells, are changed in the chart XML only. |ValueError| is
+        raised for a series having neither cached nor literal values.
+        """
+        ser = self._chartSpace.plotArea.sers[series_idx]
+        values_src = ser.val if ser.val is not None else ser.yVal
+        if values_src is None or values_src.pt_container is None:
+            raise ValueError("series has no cached or literal numeric values")
+        point_count = values_src.ptCount_val
+        for idx in values:
+            if not 0 <= idx < point_count:
+                raise IndexError("point index %d out of range" % idx)
+        values_src.set_pt_values(values)
+        range_ref = values_src.numRef_f
+        if range_ref is not None:
+            self._workbook.update_values(range_ref, values)
+
     @lazyproperty
     def series(self):
         """
@@ -7,8 +7,10 @@ ChartData and related objects.
 from __future__ import absolute_import, print_function, unicode_literals
 
 import datetime
+from array import array
 from numbers import Number
 
+from pptx.chart.downsample import lttb, min_max
 from pptx.chart.xlsx import (
     BubbleWorkbookWriter,
     CategoryWorkbookWriter,
@@ -143,16 +145,27 @@ class _BaseSeriesData(Sequence):
         self._chart_data = chart_data
         self._name = name
         self._number_format = number_format
-        self._data_points = []
+        self._point_number_formats = {}
 
     def __getitem__(self, index):
-        return self._data_points.__getitem__(index)
+        if isinstance(index, slice):
+            return [self._data_point(idx) for idx in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("data point index out of range")
+        return self._data_point(index)
 
     def __len__(self):
-        return self._data_points.__len__()
+        raise NotImplementedError("must be implemented by all subclasses")
 
     def append(self, data_point):
-        return self._data_points.append(data_point)
+        """
+        Append the values of *data_point*, a data point object of the kind
+        contained in this series, to this series. The values are stored;
+        *data_point* itself is not.
+        """
+        raise NotImplementedError("must be implemented by all subclasses")
 
     @property
     def data_point_offset(self):
@@ -206,7 +219,7 @@ class _BaseSeriesData(Sequence):
         A sequence containing the X value of each datapoint in this series,
         in data point order.
         """
-        return [dp.x for dp in self._data_points]
+        return [data_point.x for data_point in self]
 
     @property
     def x_values_ref(self):
@@ -222,7 +235,7 @@ class _BaseSeriesData(Sequence):
         A sequence containing the Y value of each datapoint in this series,
         in data point order.
         """
-        return [dp.y for dp in self._data_points]
+        return [data_point.y for data_point in self]
 
     @property
     def y_values_ref(self):
@@ -232,12 +245,28 @@ class _BaseSeriesData(Sequence):
         """
         return self._chart_data.y_values_ref(self)
 
+    def _data_point(self, idx):
+        """
+        Return a data point object for the values at *idx* in this series.
+        """
+        raise NotImplementedError("must be implemented by all subclasses")
+
+    def _point_number_format(self, idx, number_format):
+        """
+        Record *number_format* as specific to the data point at *idx*. Only
+        data points having their own number format are recorded.
+        """
+        if number_format is not None:
+            self._point_number_formats[idx] = number_format
+
 
 class _BaseDataPoint(object):
     """
     Base class providing common members for data point objects.
     """
 
+    __slots__ = ("_series_data", "_number_format")
+
     def __init__(self, series_data, number_format):
         super(_BaseDataPoint, self).__init__()
         self._series_data = series_data
@@ -291,13 +320,30 @@ class CategoryChartData(_BaseChartData):
         *number_format* specifies how the series values will be displayed,
         and may be a string, e.g. '#,##0' corresponding to an Excel number
         format.
+
+        When *values* is an `array.array` or NumPy array it is stored as-is,
+        without copying, and its items are converted to Python numbers only
+        when the chart XML and workbook are written. A NaN item in such an
+        array is treated as a missing value, like |None|.
         """
-        series_data = CategorySeriesData(self, name, number_format)
+        series_data = CategorySeriesData(self, name, number_format, values)
         self.append(series_data)
-        for value in values:
-            series_data.add_data_point(value)
         return series_data
 
+    @classmethod
+    def from_dataframe(cls, df, number_format="General"):
+        """
+        Return a new chart data object populated from the pandas DataFrame
+        *df*. The index of *df* provides the category labels and each column
+        becomes a series named for its column label. Column values are taken
+        as NumPy arrays, so they are not copied until the chart is written.
+        """
+        chart_data = cls(number_format)
+        chart_data.categories = df.index.tolist()
+        for column_label in df.columns:
+            chart_data.add_series(str(column_label), df[column_label].to_numpy())
+        return chart_data
+
     @lazyproperty
     def categories(self):
         """
@@ -517,6 +563,8 @@ class Category(object):
     of multi-level category charts.
     """
 
+    __slots__ = ("_label", "_parent", "_sub_categories")
+
     def __init__(self, label, parent):
         super(Category, self).__init__()
         self._label = label
@@ -641,16 +689,32 @@ class CategorySeriesData(_BaseSeriesData):
     access to the series label, the series data points, and an optional
     number format to be applied to each data point not having a specified
     number format.
+
+    Values are stored as a single column rather than as a data point object
+    per value; data point objects are created on access.
     """
 
+    def __init__(self, chart_data, name, number_format, values=()):
+        super(CategorySeriesData, self).__init__(chart_data, name, number_format)
+        self._values = _column(values)
+
+    def __len__(self):
+        return len(self._values)
+
     def add_data_point(self, value, number_format=None):
         """
         Return a CategoryDataPoint object newly created with value *value*,
         an optional *number_format*, and appended to this sequence.
         """
-        data_point = CategoryDataPoint(self, value, number_format)
-        self.append(data_point)
-        return data_point
+        self._append_value(value, number_format)
+        return CategoryDataPoint(self, value, number_format)
+
+    def append(self, data_point):
+        """
+        Append the value and number format of |CategoryDataPoint| object
+        *data_point* to this series.
+        """
+        self._append_value(data_point.value, data_point._number_format)
 
     @property
     def categories(self):
@@ -674,7 +738,7 @@ class CategorySeriesData(_BaseSeriesData):
         A sequence containing the (Y) value of each datapoint in this series,
         in data point order.
         """
-        return [dp.value for dp in self._data_points]
+        return _values_copy(self._values)
 
     @property
     def values_ref(self):
@@ -684,6 +748,19 @@ class CategorySeriesData(_BaseSeriesData):
         """
         return self._chart_data.values_ref(self)
 
+    def _append_value(self, value, number_format):
+        """
+        Append *value* to the value column of this series.
+        """
+        self._values = _appendable(self._values)
+        self._point_number_format(len(self._values), number_format)
+        self._values.append(value)
+
+    def _data_point(self, idx):
+        return CategoryDataPoint(
+            self, self._values[idx], self._point_number_formats.get(idx)
+        )
+
 
 class XyChartData(_BaseChartData):
     """
@@ -702,6 +779,19 @@ class XyChartData(_BaseChartData):
         self.append(series_data)
         return series_data
 
+    def add_series_arrays(self, name, x_values, y_values, number_format=None):
+        """
+        Return an |XySeriesData| object newly created and added at the end of
+        this sequence, identified by *name* and having the data points
+        specified by the equal-length sequences *x_values* and *y_values*.
+        An `array.array` or NumPy array is stored without copying; see
+        :meth:`CategoryChartData.add_series`.
+        """
+        _check_lengths(x_values, y_values)
+        series_data = XySeriesData(self, name, number_format, x_values, y_values)
+        self.append(series_data)
+        return series_data
+
     @lazyproperty
     def _workbook_writer(self):
         """
@@ -728,6 +818,23 @@ class BubbleChartData(XyChartData):
         self.append(series_data)
         return series_data
 
+    def add_series_arrays(
+        self, name, x_values, y_values, bubble_sizes, number_format=None
+    ):
+        """
+        Return a |BubbleSeriesData| object newly created and added at the end
+        of this sequence, named *name* and having the data points specified
+        by the equal-length sequences *x_values*, *y_values*, and
+        *bubble_sizes*. An `array.array` or NumPy array is stored without
+        copying; see :meth:`CategoryChartData.add_series`.
+        """
+        _check_lengths(x_values, y_values, bubble_sizes)
+        series_data = BubbleSeriesData(
+            self, name, number_format, x_values, y_values, bubble_sizes
+        )
+        self.append(series_data)
+        return series_data
+
     def bubble_sizes_ref(self, series):
         """
         The Excel worksheet reference for the range containing the bubble
@@ -756,14 +863,141 @@ class XySeriesData(_BaseSeriesData):
     points are not automatically sorted into increasing order by X value.
     """
 
+    _column_names = ("_x_values", "_y_values")
+
+    def __init__(self, chart_data, name, number_format, x_values=(), y_values=()):
+        super(XySeriesData, self).__init__(chart_data, name, number_format)
+        self._x_values = _column(x_values)
+        self._y_values = _column(y_values)
+        self._worksheet_columns = None
+
+    def __len__(self):
+        return len(self._y_values)
+
     def add_data_point(self, x, y, number_format=None):
         """
         Return an XyDataPoint object newly created with values *x* and *y*,
         and appended to this sequence.
         """
-        data_point = XyDataPoint(self, x, y, number_format)
-        self.append(data_point)
-        return data_point
+        self._append_values(x, y, number_format)
+        return XyDataPoint(self, x, y, number_format)
+
+    def append(self, data_point):
+        """
+        Append the values and number format of |XyDataPoint| object
+        *data_point* to this series.
+        """
+        self._append_values(data_point.x, data_point.y, data_point._number_format)
+
+    def downsample(self, point_count, method="lttb", keep_full_resolution=False):
+        """
+        Reduce this series to at most *point_count* data points chosen to
+        preserve the appearance of the plotted line. *method* is either
+        'lttb' (Largest-Triangle-Three-Buckets, the default), which keeps the
+        overall shape, or 'min_max', which keeps the lowest and highest Y
+        value in each of `point_count // 2` buckets. Data points missing an
+        X or Y value are dropped.
+
+        The reduced data points are used for both the chart XML and the
+        embedded Excel workbook unless *keep_full_resolution* is |True|, in
+        which case the workbook retains every original data point.
+        """
+        if method not in _DOWNSAMPLERS:
+            raise ValueError("unsupported downsampling method %r" % method)
+        columns = [_values(getattr(self, name)) for name in self._column_names]
+        x_values, y_values = columns[:2]
+        present = [
+            idx
+            for idx in range(len(y_values))
+            if x_values[idx] is not None and y_values[idx] is not None
+        ]
+        selected = _DOWNSAMPLERS[method](
+            [x_values[idx] for idx in present],
+            [y_values[idx] for idx in present],
+            point_count,
+        )
+        kept = [present[idx] for idx in selected]
+
+        if keep_full_resolution and self._worksheet_columns is None:
+            self._worksheet_columns = columns
+        for name, column in zip(self._column_names, columns):
+            setattr(self, name, [column[idx] for idx in kept])
+        number_formats = self._point_number_formats
+        self._point_number_formats = dict(
+            (new_idx, number_formats[idx])
+            for new_idx, idx in enumerate(kept)
+            if idx in number_formats
+        )
+
+    @property
+    def worksheet_point_count(self):
+        """
+        The number of data points written to the Excel worksheet for this
+        series. This is the number of data points in the series except when
+        it has been downsampled keeping full resolution in the worksheet.
+        """
+        if self._worksheet_columns is None:
+            return len(self._y_values)
+        return len(self._worksheet_columns[1])
+
+    @property
+    def worksheet_x_values(self):
+        """
+        A sequence containing the X values written to the Excel worksheet for
+        this series. See :attr:`worksheet_point_count`.
+        """
+        return self._worksheet_values(0)
+
+    @property
+    def worksheet_y_values(self):
+        """
+        A sequence containing the Y values written to the Excel worksheet for
+        this series. See :attr:`worksheet_point_count`.
+        """
+        return self._worksheet_values(1)
+
+    @property
+    def x_values(self):
+        """
+        A sequence containing the X value of each datapoint in this series,
+        in data point order.
+        """
+        return _values_copy(self._x_values)
+
+    @property
+    def y_values(self):
+        """
+        A sequence containing the Y value of each datapoint in this series,
+        in data point order.
+        """
+        return _values_copy(self._y_values)
+
+    def _append_values(self, x, y, number_format):
+        """
+        Append *x* and *y* to the value columns of this series.
+        """
+        self._x_values = _appendable(self._x_values)
+        self._y_values = _appendable(self._y_values)
+        self._point_number_format(len(self._y_values), number_format)
+        self._x_values.append(x)
+        self._y_values.append(y)
+
+    def _data_point(self, idx):
+        return XyDataPoint(
+            self,
+            self._x_values[idx],
+            self._y_values[idx],
+            self._point_number_formats.get(idx),
+        )
+
+    def _worksheet_values(self, column_idx):
+        """
+        Return the values of the column at *column_idx* in `_column_names`
+        as written to the Excel worksheet.
+        """
+        if self._worksheet_columns is None:
+            return _values_copy(getattr(self, self._column_names[column_idx]))
+        return list(self._worksheet_columns[column_idx])
 
 
 class BubbleSeriesData(XySeriesData):
@@ -778,15 +1012,42 @@ class BubbleSeriesData(XySeriesData):
     identifier and can only be retrieved by index.
     """
 
+    _column_names = ("_x_values", "_y_values", "_bubble_sizes")
+
+    def __init__(
+        self,
+        chart_data,
+        name,
+        number_format,
+        x_values=(),
+        y_values=(),
+        bubble_sizes=(),
+    ):
+        super(BubbleSeriesData, self).__init__(
+            chart_data, name, number_format, x_values, y_values
+        )
+        self._bubble_sizes = _column(bubble_sizes)
+
     def add_data_point(self, x, y, size, number_format=None):
         """
         Append a new BubbleDataPoint object having the values *x*, *y*, and
         *size*. The optional *number_format* is used to format the Y value.
         If not provided, the number format is inherited from the series data.
         """
-        data_point = BubbleDataPoint(self, x, y, size, number_format)
-        self.append(data_point)
-        return data_point
+        self._append_bubble_values(x, y, size, number_format)
+        return BubbleDataPoint(self, x, y, size, number_format)
+
+    def append(self, data_point):
+        """
+        Append the values and number format of |BubbleDataPoint| object
+        *data_point* to this series.
+        """
+        self._append_bubble_values(
+            data_point.x,
+            data_point.y,
+            data_point.bubble_size,
+            data_point._number_format,
+        )
 
     @property
     def bubble_sizes(self):
@@ -794,7 +1055,7 @@ class BubbleSeriesData(XySeriesData):
         A sequence containing the bubble size for each datapoint in this
         series, in data point order.
         """
-        return [dp.bubble_size for dp in self._data_points]
+        return _values_copy(self._bubble_sizes)
 
     @property
     def bubble_sizes_ref(self):
@@ -804,6 +1065,31 @@ class BubbleSeriesData(XySeriesData):
         """
         return self._chart_data.bubble_sizes_ref(self)
 
+    @property
+    def worksheet_bubble_sizes(self):
+        """
+        A sequence containing the bubble sizes written to the Excel worksheet
+        for this series. See :attr:`XySeriesData.worksheet_point_count`.
+        """
+        return self._worksheet_values(2)
+
+    def _append_bubble_values(self, x, y, size, number_format):
+        """
+        Append *x*, *y*, and *size* to the value columns of this series.
+        """
+        self._append_values(x, y, number_format)
+        self._bubble_sizes = _appendable(self._bubble_sizes)
+        self._bubble_sizes.append(size)
+
+    def _data_point(self, idx):
+        return BubbleDataPoint(
+            self,
+            self._x_values[idx],
+            self._y_values[idx],
+            self._bubble_sizes[idx],
+            self._point_number_formats.get(idx),
+        )
+
 
 class CategoryDataPoint(_BaseDataPoint):
     """
@@ -812,6 +1098,8 @@ class CategoryDataPoint(_BaseDataPoint):
     Excel file.
     """
 
+    __slots__ = ("_value",)
+
     def __init__(self, series_data, value, number_format):
         super(CategoryDataPoint, self).__init__(series_data, number_format)
         self._value = value
@@ -830,6 +1118,8 @@ class XyDataPoint(_BaseDataPoint):
     of the datapoint.
     """
 
+    __slots__ = ("_x", "_y")
+
     def __init__(self, series_data, x, y, number_format):
         super(XyDataPoint, self).__init__(series_data, number_format)
         self._x = x
@@ -856,6 +1146,8 @@ class BubbleDataPoint(XyDataPoint):
     size values of the datapoint.
     """
 
+    __slots__ = ("_size",)
+
     def __init__(self, series_data, x, y, size, number_format):
         super(BubbleDataPoint, self).__init__(series_data, x, y, number_format)
         self._size = size
@@ -866,3 +1158,58 @@ class BubbleDataPoint(XyDataPoint):
         The value representing the size of the bubble for this data point.
         """
         return self._size
+
+
+_DOWNSAMPLERS = {"lttb": lttb, "min_max": min_max}
+
+
+def _appendable(column):
+    """
+    Return *column* as a list that further values can be appended to. An
+    array-backed column is converted; a list is returned unchanged.
+    """
+    if isinstance(column, list):
+        return column
+    return _values(column)
+
+
+def _check_lengths(*columns):
+    """
+    Raise |ValueError| if the sequences in *columns* differ in length.
+    """
+    if len(set(len(column) for column in columns)) > 1:
+        raise ValueError("value sequences must all be the same length")
+
+
+def _column(values):
+    """
+    Return *values* in a form suitable for storage as a series value column.
+    An `array.array` or NumPy array (or anything else exposing the NumPy
+    array interface) is returned as-is so it is not copied; any other
+    iterable is collected into a list.
+    """
+    if isinstance(values, array) or hasattr(values, "__array_interface__"):
+        return values
+    return list(values)
+
+
+def _values(column):
+    """
+    Return the items of *column* as a list of Python values. The items of an
+    array-backed column are converted to Python numbers, with NaN items
+    becoming |None|. A list column is returned unchanged.
+    """
+    if isinstance(column, list):
+        return column
+    return [value if value == value else None for value in column.tolist()]
+
+
+def _values_copy(column):
+    """
+    Return the items of *column* as a new list of Python values, like
+    :func:`_values` but never the list *column* itself, so a caller can
+    change it without affecting the series.
+    """
+    if isinstance(column, list):
+        return list(column)
+    return _values(column)
@@ -0,0 +1,101 @@
+# encoding: utf-8
+
+"""
+Point-count reduction for dense chart series.
+
+Each function takes the X and Y values of a series and a target point count
+and returns the ascending indices of the data points to keep. Both run in
+time linear in the number of data points.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+
+
+def lttb(x_values, y_values, point_count):
+    """
+    Return the indices of *point_count* data points selected using the
+    Largest-Triangle-Three-Buckets algorithm, which preserves the visual
+    shape of a line. The first and last data points are always kept. All
+    indices are returned when *point_count* is not less than the number of
+    data points. Date and datetime X values are compared by their distance
+    in days.
+    """
+    count = len(y_values)
+    if point_count >= count:
+        return list(range(count))
+    if point_count < 3:
+        raise ValueError("LTTB requires a point count of at least 3")
+    if isinstance(x_values[0], datetime.date):
+        x_values = [_day_number(x) for x in x_values]
+
+    bucket_size = (count - 2) / (point_count - 2)
+    idxs = [0]
+    a = 0
+    for bucket_idx in range(point_count - 2):
+        # ---average of the following bucket is the third triangle vertex---
+        avg_start = int((bucket_idx + 1) * bucket_size) + 1
+        avg_end = min(int((bucket_idx + 2) * bucket_size) + 1, count)
+        avg_len = avg_end - avg_start
+        avg_x = sum(x_values[avg_start:avg_end]) / avg_len
+        avg_y = sum(y_values[avg_start:avg_end]) / avg_len
+
+        # ---keep the point in this bucket forming the largest triangle---
+        ax, ay = x_values[a], y_values[a]
+        max_area, next_a = -1.0, a
+        start = int(bucket_idx * bucket_size) + 1
+        end = int((bucket_idx + 1) * bucket_size) + 1
+        for idx in range(start, end):
+            area = abs(
+                (ax - avg_x) * (y_values[idx] - ay)
+                - (ax - x_values[idx]) * (avg_y - ay)
+            )
+            if area > max_area:
+                max_area, next_a = area, idx
+        idxs.append(next_a)
+        a = next_a
+    idxs.append(count - 1)
+    return idxs
+
+
+def min_max(x_values, y_values, point_count):
+    """
+    Return the indices of at most *point_count* data points, being those
+    having the minimum and maximum Y value in each of `point_count // 2`
+    equal-size buckets. This preserves the extremes of a noisy series. All
+    indices are returned when *point_count* is not less than the number of
+    data points.
+    """
+    count = len(y_values)
+    if point_count >= count:
+        return list(range(count))
+    if point_count < 2:
+        raise ValueError("min/max requires a point count of at least 2")
+
+    bucket_count = point_count // 2
+    idxs = []
+    for bucket_idx in range(bucket_count):
+        start = bucket_idx * count // bucket_count
+        end = (bucket_idx + 1) * count // bucket_count
+        min_idx = max_idx = start
+        for idx in range(start + 1, end):
+            y = y_values[idx]
+            if y < y_values[min_idx]:
+                min_idx = idx
+            elif y > y_values[max_idx]:
+                max_idx = idx
+        idxs.extend(sorted(set((min_idx, max_idx))))
+    return idxs
+
+
+def _day_number(value):
+    """
+    Return *value*, a date or datetime, as a float number of days since the
+    start of the proleptic Gregorian calendar.
+    """
+    day_number = float(value.toordinal())
+    if isinstance(value, datetime.datetime):
+        midnight = datetime.datetime.combine(value.date(), datetime.time())
+        day_number += (value.replace(tzinfo=None) - midnight).total_seconds() / 86400
+    return day_number
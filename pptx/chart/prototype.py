@@ -0,0 +1,82 @@
+# encoding: utf-8
+
+"""ChartPrototype object, a reusable parsed chart skeleton."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import copy
+
+from pptx.chart.xmlwriter import SeriesXmlRewriterFactory
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+
+
+class ChartPrototype(object):
+    """
+    A parsed chart from which any number of charts that differ only in their
+    data can be added cheaply using :meth:`SlideShapes.add_chart_from`.
+
+    Each new chart starts as a copy of the prototype's chart XML with only its
+    series replaced, which avoids rendering and parsing the chart XML for
+    every chart. Formatting applied to the prototype, such as series colors
+    and axis settings, carries over to each chart stamped from it.
+    """
+
+    def __init__(self, chart_type, chartSpace, rels=()):
+        super(ChartPrototype, self).__init__()
+        self._chart_type = chart_type
+        self._chartSpace = chartSpace
+        self._rels = tuple(rels)
+
+    @classmethod
+    def from_chart(cls, chart):
+        """
+        Return a prototype based on existing |Chart| object *chart*, for
+        example one styled in PowerPoint. Parts the chart depends on other
+        than its embedded workbook, such as its chart style and color style
+        parts, are shared by the charts stamped from the prototype into the
+        same presentation. Each chart stamped into another presentation gets
+        its own copy of them.
+        """
+        chart_part = chart.part
+        rels = [rel for rel in chart_part.rels.values() if rel.reltype != RT.PACKAGE]
+        return cls(chart.chart_type, parse_xml(chart_part.blob), rels)
+
+    @classmethod
+    def from_chart_data(cls, chart_type, chart_data):
+        """
+        Return a prototype for a default chart of *chart_type* depicting
+        *chart_data*. The prototype's own data is replaced in each chart
+        stamped from it.
+        """
+        return cls(chart_type, parse_xml(chart_data.xml_bytes(chart_type)))
+
+    @property
+    def chart_type(self):
+        """
+        Member of :ref:`XlChartType` enumeration specifying the type of
+        charts stamped from this prototype.
+        """
+        return self._chart_type
+
+    def new_chartSpace(self, chart_data):
+        """
+        Return a new `c:chartSpace` element copied from this prototype and
+        depicting *chart_data*. The copy has no `c:externalData` element; its
+        other relationship ids are those of the prototype and are remapped
+        by the caller.
+        """
+        chartSpace = copy.deepcopy(self._chartSpace)
+        chartSpace._remove_externalData()
+        rewriter = SeriesXmlRewriterFactory(self._chart_type, chart_data)
+        rewriter.replace_series_data(chartSpace)
+        return chartSpace
+
+    @property
+    def rels(self):
+        """
+        Sequence of |_Relationship| objects, each a relationship other than
+        to the embedded workbook that a chart stamped from this prototype
+        must also have.
+        """
+        return self._rels
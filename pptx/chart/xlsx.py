@@ -6,8 +6,12 @@ Chart builder and related objects.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import posixpath
+import re
 from contextlib import contextmanager
+from zipfile import ZIP_DEFLATED, ZipFile
 
+from lxml import etree
 from xlsxwriter import Workbook
 
 from ..compat import BytesIO
@@ -205,8 +209,11 @@ class XyWorkbookWriter(_BaseWorkbookWriter):
         Return the number of rows preceding the data table for *series* in
         the Excel worksheet.
         """
-        title_and_spacer_rows = series.index * 2
-        data_point_rows = series.data_point_offset
+        series_idx = series.index
+        title_and_spacer_rows = series_idx * 2
+        data_point_rows = sum(
+            s.worksheet_point_count for s in self._chart_data[:series_idx]
+        )
         return title_and_spacer_rows + data_point_rows
 
     def x_values_ref(self, series):
@@ -215,7 +222,7 @@ class XyWorkbookWriter(_BaseWorkbookWriter):
         including the column label).
         """
         top_row = self.series_table_row_offset(series) + 2
-        bottom_row = top_row + len(series) - 1
+        bottom_row = top_row + series.worksheet_point_count - 1
         return "Sheet1!$A$%d:$A$%d" % (top_row, bottom_row)
 
     def y_values_ref(self, series):
@@ -224,7 +231,7 @@ class XyWorkbookWriter(_BaseWorkbookWriter):
         including the column label).
         """
         top_row = self.series_table_row_offset(series) + 2
-        bottom_row = top_row + len(series) - 1
+        bottom_row = top_row + series.worksheet_point_count - 1
         return "Sheet1!$B$%d:$B$%d" % (top_row, bottom_row)
 
     def _populate_worksheet(self, workbook, worksheet):
@@ -243,10 +250,14 @@ class XyWorkbookWriter(_BaseWorkbookWriter):
             )
             offset = self.series_table_row_offset(series)
             # write X values
-            worksheet.write_column(offset + 1, 0, series.x_values, chart_num_format)
+            worksheet.write_column(
+                offset + 1, 0, series.worksheet_x_values, chart_num_format
+            )
             # write Y values
             worksheet.write(offset, 1, series.name)
-            worksheet.write_column(offset + 1, 1, series.y_values, series_num_format)
+            worksheet.write_column(
+                offset + 1, 1, series.worksheet_y_values, series_num_format
+            )
 
 
 class BubbleWorkbookWriter(XyWorkbookWriter):
@@ -261,7 +272,7 @@ class BubbleWorkbookWriter(XyWorkbookWriter):
         sizes for *series* (not including the column heading cell).
         """
         top_row = self.series_table_row_offset(series) + 2
-        bottom_row = top_row + len(series) - 1
+        bottom_row = top_row + series.worksheet_point_count - 1
         return "Sheet1!$C$%d:$C$%d" % (top_row, bottom_row)
 
     def _populate_worksheet(self, workbook, worksheet):
@@ -281,10 +292,166 @@ class BubbleWorkbookWriter(XyWorkbookWriter):
             )
             offset = self.series_table_row_offset(series)
             # write X values
-            worksheet.write_column(offset + 1, 0, series.x_values, chart_num_format)
+            worksheet.write_column(
+                offset + 1, 0, series.worksheet_x_values, chart_num_format
+            )
             # write Y values
             worksheet.write(offset, 1, series.name)
-            worksheet.write_column(offset + 1, 1, series.y_values, series_num_format)
+            worksheet.write_column(
+                offset + 1, 1, series.worksheet_y_values, series_num_format
+            )
             # write bubble sizes
             worksheet.write(offset, 2, "Size")
-            worksheet.write_column(offset + 1, 2, series.bubble_sizes, chart_num_format)
+            worksheet.write_column(
+                offset + 1, 2, series.worksheet_bubble_sizes, chart_num_format
+            )
+
+
+class WorksheetCellUpdater(object):
+    """
+    Changes the values of individual cells in one worksheet of an Excel
+    workbook blob, leaving every other part of the workbook untouched. Used
+    to keep an embedded chart workbook in sync when only a few values change.
+    """
+
+    _main = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+    _rel_id = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+    _cell_ref_re = re.compile(r"\$?([A-Z]+)\$?(\d+)$")
+
+    def __init__(self, xlsx_blob):
+        super(WorksheetCellUpdater, self).__init__()
+        self._xlsx_blob = xlsx_blob
+
+    @classmethod
+    def range_origin(cls, range_ref):
+        """
+        Return a (sheet_name, column_letters, row_number) 3-tuple for the
+        top-left cell of *range_ref*, e.g. ('Sheet1', 'B', 2) for
+        "Sheet1!$B$2:$B$9".
+        """
+        sheet_name, _, cells = range_ref.rpartition("!")
+        top_left = cells.split(":")[0]
+        match = cls._cell_ref_re.match(top_left)
+        if match is None:
+            raise ValueError("unsupported range reference %r" % range_ref)
+        column, row = match.groups()
+        return sheet_name.strip("'"), column, int(row)
+
+    def update(self, sheet_name, values):
+        """
+        Return a new workbook blob in which the cells of worksheet
+        *sheet_name* identified in *values* have the numeric values mapped to
+        them, e.g. ``{"B3": 42.0}``. A value of |None| clears the cell value
+        but keeps its formatting. Cells and rows are added as required.
+        """
+        with ZipFile(BytesIO(self._xlsx_blob)) as zipf:
+            sheet_path = self._sheet_path(zipf, sheet_name)
+            sheet = _parse_xml(zipf.read(sheet_path))
+            self._set_values(sheet, values)
+            sheet_xml = etree.tostring(sheet, encoding="UTF-8", standalone=True)
+            return self._rewrite(zipf, sheet_path, sheet_xml)
+
+    @classmethod
+    def _cell(cls, sheet, cell_ref, rows):
+        """
+        Return the `c` element for *cell_ref* in *sheet*, newly added in
+        column order if not present. *rows* maps row number to `row` element
+        and is updated when a row is added.
+        """
+        column, row_number = cls._cell_ref_re.match(cell_ref).groups()
+        row_number = int(row_number)
+        row = rows.get(row_number)
+        if row is None:
+            row = rows[row_number] = etree.Element(cls._main + "row", r=str(row_number))
+            later_rows = [r for r in rows if r > row_number]
+            if later_rows:
+                rows[min(later_rows)].addprevious(row)
+            else:
+                sheet.find(cls._main + "sheetData").append(row)
+
+        key = _column_key(column)
+        cell_ref = "%s%d" % (column, row_number)
+        for c in row.iterchildren(cls._main + "c"):
+            c_column = cls._cell_ref_re.match(c.get("r")).group(1)
+            if c.get("r") == cell_ref:
+                return c
+            if _column_key(c_column) > key:
+                cell = etree.Element(cls._main + "c", r=cell_ref)
+                c.addprevious(cell)
+                return cell
+        return etree.SubElement(row, cls._main + "c", r=cell_ref)
+
+    def _rewrite(self, zipf, replaced_path, replacement):
+        """
+        Return a workbook blob having the same entries as *zipf*, except that
+        the member at *replaced_path* contains *replacement*. The content of
+        each other member is unchanged, although it is compressed again
+        using its original compression type.
+        """
+        xlsx_file = BytesIO()
+        with ZipFile(xlsx_file, "w", ZIP_DEFLATED) as out:
+            for info in zipf.infolist():
+                if info.filename == replaced_path:
+                    out.writestr(info, replacement, ZIP_DEFLATED)
+                else:
+                    out.writestr(info, zipf.read(info), info.compress_type)
+        return xlsx_file.getvalue()
+
+    @classmethod
+    def _set_values(cls, sheet, values):
+        """
+        Set the values of the cells in *sheet*, the root element of
+        a worksheet, as specified in the *values* mapping.
+        """
+        sheetData = sheet.find(cls._main + "sheetData")
+        rows = dict(
+            (int(row.get("r")), row)
+            for row in sheetData.iterchildren(cls._main + "row")
+        )
+        for cell_ref, value in values.items():
+            cell = cls._cell(sheet, cell_ref, rows)
+            for child in list(cell):
+                cell.remove(child)
+            cell.attrib.pop("t", None)
+            if value is not None:
+                etree.SubElement(cell, cls._main + "v").text = str(value)
+
+    def _sheet_path(self, zipf, sheet_name):
+        """
+        Return the package member name of the worksheet named *sheet_name*.
+        """
+        workbook = _parse_xml(zipf.read("xl/workbook.xml"))
+        sheets = workbook.iter(self._main + "sheet")
+        rIds = [
+            sheet.get(self._rel_id)
+            for sheet in sheets
+            if sheet.get("name") == sheet_name
+        ]
+        if not rIds:
+            raise KeyError("no worksheet named %r" % sheet_name)
+        rels = _parse_xml(zipf.read("xl/_rels/workbook.xml.rels"))
+        for rel in rels:
+            if rel.get("Id") == rIds[0]:
+                target = rel.get("Target")
+                if target.startswith("/"):
+                    return target[1:]
+                return posixpath.normpath(posixpath.join("xl", target))
+        raise KeyError("no relationship %r in workbook" % rIds[0])
+
+
+def _parse_xml(xml):
+    """
+    Return the root element of *xml*, a member of a workbook, parsed without
+    resolving entities, since the workbook may come from an untrusted file.
+    A new parser is used for each call because a parser must not be shared
+    between threads.
+    """
+    return etree.fromstring(xml, etree.XMLParser(resolve_entities=False))
+
+
+def _column_key(column):
+    """
+    Return a sort key placing column letters, e.g. 'B' or 'AA', in worksheet
+    column order.
+    """
+    return len(column), column
@@ -1825,6 +1825,21 @@ class _CategorySeriesXmlRewriter(_BaseSeriesXmlRewriter):
     A series rewriter suitable for category charts.
     """
 
+    def __init__(self, chart_data):
+        super(_CategorySeriesXmlRewriter, self).__init__(chart_data)
+        self._cats = {}
+
+    def _cat(self, xml_writer, date_1904):
+        """
+        Return a new ``<c:cat>`` element for the series of *xml_writer*.
+        All series in a category chart share the same categories, so the
+        element is generated once and copied for each subsequent series.
+        """
+        cat = self._cats.get(date_1904)
+        if cat is None:
+            cat = self._cats[date_1904] = xml_writer.cat
+        return deepcopy(cat)
+
     def _rewrite_ser_data(self, ser, series_data, date_1904):
         """
         Rewrite the ``<c:tx>``, ``<c:cat>`` and ``<c:val>`` child elements
@@ -1837,7 +1852,7 @@ class _CategorySeriesXmlRewriter(_BaseSeriesXmlRewriter):
         xml_writer = _CategorySeriesXmlWriter(series_data, date_1904)
 
         ser._insert_tx(xml_writer.tx)
-        ser._insert_cat(xml_writer.cat)
+        ser._insert_cat(self._cat(xml_writer, date_1904))
         ser._insert_val(xml_writer.val)
 
 
@@ -6,6 +6,8 @@ DrawingML objects related to color, ColorFormat being the most prominent.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import colorsys
+
 from ..enum.dml import MSO_COLOR_TYPE, MSO_THEME_COLOR
 from ..oxml.dml.color import (
     CT_HslColor,
@@ -15,6 +17,13 @@ from ..oxml.dml.color import (
     CT_SRgbColor,
     CT_SystemColor,
 )
+from ..oxml.ns import qn
+from ..oxml.simpletypes import ST_Percentage
+
+# ---color transforms applied by ThemeColors, in the order they appear---
+_TRANSFORM_TAGS = frozenset(
+    (qn("a:lumMod"), qn("a:lumOff"), qn("a:tint"), qn("a:shade"))
+)
 
 
 class ColorFormat(object):
@@ -303,3 +312,124 @@ class RGBColor(tuple):
         g = int(rgb_hex_str[2:4], 16)
         b = int(rgb_hex_str[4:], 16)
         return cls(r, g, b)
+
+
+class ThemeColors(object):
+    """
+    Resolves a color to the RGB color it is rendered with, looking up a theme
+    color in the color scheme of a theme by way of the color map of a slide
+    master and applying any luminance, tint, and shade transforms. Obtained
+    from the :attr:`theme_colors` property of a slide, layout, or master,
+    each of which shares the one computed for its master.
+    """
+
+    def __init__(self, scheme_colors, color_map):
+        super(ThemeColors, self).__init__()
+        self._scheme_colors = scheme_colors
+        self._color_map = color_map
+
+    @classmethod
+    def from_elements(cls, clrScheme, clrMap):
+        """
+        Return a |ThemeColors| object for the colors of the `a:clrScheme`
+        element *clrScheme* as mapped by the `p:clrMap` element *clrMap*.
+        Either can be |None|, as when a master has no theme.
+        """
+        scheme_colors = {}
+        if clrScheme is not None:
+            for color_elm in clrScheme:
+                rgb = _base_rgb(color_elm.find("*"))
+                if rgb is not None:
+                    scheme_colors[color_elm.tag.rpartition("}")[2]] = rgb
+        return cls(scheme_colors, _color_map(clrMap))
+
+    def remapped(self, clrMap):
+        """
+        Return a |ThemeColors| object for the same color scheme as mapped by
+        *clrMap*, like the `a:overrideClrMapping` element of a slide.
+        """
+        return ThemeColors(self._scheme_colors, _color_map(clrMap))
+
+    def rgb(self, color_format):
+        """
+        Return the |RGBColor| *color_format*, a |ColorFormat| object, is
+        rendered with, or |None| when it has no color or the color is of
+        a type not resolved, such as a preset color.
+        """
+        xClr = color_format._xFill.eg_colorChoice
+        if xClr is None:
+            return None
+        if isinstance(xClr, CT_SchemeColor):
+            name = xClr.get("val")
+            rgb = self._scheme_colors.get(self._color_map.get(name, name))
+        else:
+            rgb = _base_rgb(xClr)
+        if rgb is None:
+            return None
+        return _transformed(rgb, xClr)
+
+
+def _base_rgb(xClr):
+    """
+    Return the |RGBColor| of *xClr*, an `a:srgbClr` or `a:sysClr` element,
+    before any transform, or |None| for any other color element.
+    """
+    if isinstance(xClr, CT_SRgbColor):
+        return RGBColor.from_string(xClr.val)
+    if isinstance(xClr, CT_SystemColor) and xClr.get("lastClr"):
+        return RGBColor.from_string(xClr.get("lastClr"))
+    return None
+
+
+def _color_map(clrMap):
+    """
+    Return a dict mapping each color name in *clrMap*, like 'bg1', to the
+    name of the color scheme entry it refers to, like 'lt1'.
+    """
+    if clrMap is None:
+        return {}
+    return dict((str(name), str(value)) for name, value in clrMap.attrib.items())
+
+
+def _transformed(rgb, xClr):
+    """
+    Return *rgb* after the luminance, tint, and shade transforms that are
+    children of *xClr*, applied in document order. Luminance is adjusted in
+    HSL space; tint and shade are applied to the linear RGB components.
+    """
+    r, g, b = (component / 255.0 for component in rgb)
+    transformed = False
+    for transform in xClr:
+        if transform.tag not in _TRANSFORM_TAGS:
+            continue
+        transformed = True
+        tag = transform.tag.rpartition("}")[2]
+        value = ST_Percentage.convert_from_xml(transform.get("val"))
+        if tag in ("lumMod", "lumOff"):
+            h, lum, sat = colorsys.rgb_to_hls(r, g, b)
+            lum = lum * value if tag == "lumMod" else lum + value
+            r, g, b = colorsys.hls_to_rgb(h, min(max(lum, 0.0), 1.0), sat)
+        else:
+            linear = [_linear(c) for c in (r, g, b)]
+            if tag == "tint":
+                linear = [1.0 - (1.0 - c) * value for c in linear]
+            else:
+                linear = [c * value for c in linear]
+            r, g, b = (_gamma(min(max(c, 0.0), 1.0)) for c in linear)
+    if not transformed:
+        return rgb
+    return RGBColor(*(int(round(c * 255)) for c in (r, g, b)))
+
+
+def _gamma(c):
+    """Return the sRGB component for linear RGB component *c*."""
+    if c <= 0.0031308:
+        return c * 12.92
+    return 1.055 * c ** (1 / 2.4) - 0.055
+
+
+def _linear(c):
+    """Return the linear RGB component for sRGB component *c*."""
+    if c <= 0.04045:
+        return c / 12.92
+    return ((c + 0.055) / 1.055) ** 2.4
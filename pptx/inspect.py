@@ -0,0 +1,329 @@
+# encoding: utf-8
+
+"""
+Size and memory report for the parts of a .pptx package.
+
+:func:`inspect_package` reports the size of each part, compressed and not,
+and how many relationships refer to it, using only the zip archive's central
+directory and the small XML items describing the package. Parts are read
+only to confirm duplicate content and, on request, to estimate the memory
+their XML would take once parsed.
+
+Run as a script to print the report for a file::
+
+    python -m pptx.inspect deck.pptx [--parse] [--top N]
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import argparse
+import hashlib
+import posixpath
+import sys
+from zipfile import ZipFile
+
+from lxml import etree
+
+from .compat import BytesIO
+from .opc.packuri import CONTENT_TYPES_URI, PackURI
+from .opc.pkgreader import _ContentTypeMap, _SerializedRelationshipCollection
+
+# ---approximate bytes held by libxml2 for a parsed node, on a 64-bit build---
+_NODE_BYTES = 120
+_ATTRIBUTE_BYTES = 96
+
+
+def inspect_package(pkg_file, parse=False):
+    """
+    Return a |PackageReport| for the package in *pkg_file*, a path to a .pptx
+    file (a string) or a file-like object. The element count and memory
+    estimate of each XML part are included only when *parse* is |True|, since
+    each XML part must then be read and parsed.
+    """
+    zipf = ZipFile(pkg_file, "r")
+    try:
+        infos = [info for info in zipf.infolist() if not info.filename.endswith("/")]
+        content_types = _ContentTypeMap.from_xml(
+            zipf.read(CONTENT_TYPES_URI.membername)
+        )
+        reference_counts = _reference_counts(zipf, infos)
+
+        part_infos = []
+        for info in infos:
+            if _is_package_item(info.filename):
+                continue
+            partname = PackURI("/%s" % info.filename)
+            part_info = PartInfo(
+                partname,
+                _content_type(content_types, partname),
+                info.file_size,
+                info.compress_size,
+                reference_counts.get(partname, 0),
+            )
+            content_type = part_info.content_type
+            if parse and content_type is not None and content_type.endswith("xml"):
+                part_info._set_xml_stats(*_xml_stats(zipf.read(info.filename)))
+            part_infos.append(part_info)
+
+        duplicate_groups = _duplicate_groups(zipf, part_infos)
+    finally:
+        zipf.close()
+    return PackageReport(part_infos, duplicate_groups)
+
+
+class PackageReport(object):
+    """Sizes and duplicate content of the parts of a package."""
+
+    def __init__(self, parts, duplicate_groups):
+        super(PackageReport, self).__init__()
+        self._parts = parts
+        self._duplicate_groups = duplicate_groups
+
+    @property
+    def compressed_size(self):
+        """Total compressed size in bytes of the parts in the package."""
+        return sum(part.compressed_size for part in self._parts)
+
+    @property
+    def duplicate_groups(self):
+        """
+        List of groups of parts having identical content, each a list of
+        partnames in package order. Only groups of two or more parts appear.
+        """
+        return [list(group) for group in self._duplicate_groups]
+
+    @property
+    def parts(self):
+        """List of |PartInfo| objects, one for each part, in package order."""
+        return list(self._parts)
+
+    @property
+    def size(self):
+        """Total uncompressed size in bytes of the parts in the package."""
+        return sum(part.size for part in self._parts)
+
+    def format(self, top=None):
+        """
+        Return the report as lines of text, with the parts ordered largest
+        first and limited to the *top* largest when *top* is not |None|.
+        """
+        parts = sorted(self._parts, key=lambda part: part.size, reverse=True)
+        if top is not None:
+            parts = parts[:top]
+        parsed = any(part.element_count is not None for part in parts)
+
+        lines = [
+            "%12s %12s %5s %10s %12s  %s"
+            % ("size", "compressed", "refs", "elements", "est. memory", "partname")
+        ]
+        for part in parts:
+            lines.append(
+                "%12d %12d %5d %10s %12s  %s"
+                % (
+                    part.size,
+                    part.compressed_size,
+                    part.reference_count,
+                    "" if part.element_count is None else part.element_count,
+                    "" if part.memory_estimate is None else part.memory_estimate,
+                    part.partname,
+                )
+            )
+        lines.append(
+            "%12d %12d  total of %d parts"
+            % (self.size, self.compressed_size, len(self._parts))
+        )
+        if not parsed:
+            lines.append("(use --parse to estimate element count and memory)")
+
+        for group in self._duplicate_groups:
+            lines.append("")
+            lines.append("identical content:")
+            lines.extend("  %s" % partname for partname in group)
+        return "\n".join(lines)
+
+
+class PartInfo(object):
+    """Size and reference count of a single part of a package."""
+
+    __slots__ = (
+        "_partname",
+        "_content_type",
+        "_size",
+        "_compressed_size",
+        "_reference_count",
+        "_element_count",
+        "_memory_estimate",
+    )
+
+    def __init__(self, partname, content_type, size, compressed_size, ref_count):
+        super(PartInfo, self).__init__()
+        self._partname = partname
+        self._content_type = content_type
+        self._size = size
+        self._compressed_size = compressed_size
+        self._reference_count = ref_count
+        self._element_count = None
+        self._memory_estimate = None
+
+    @property
+    def compressed_size(self):
+        """Size in bytes of this part as compressed in the zip archive."""
+        return self._compressed_size
+
+    @property
+    def content_type(self):
+        """
+        Content type of this part, e.g. 'image/png', or |None| when
+        `[Content_Types].xml` has no entry for it, as for a stray member of
+        the zip archive like '[trash]/0001.dat'.
+        """
+        return self._content_type
+
+    @property
+    def element_count(self):
+        """
+        Number of XML elements in this part, or |None| when the part was not
+        parsed or is not XML.
+        """
+        return self._element_count
+
+    @property
+    def memory_estimate(self):
+        """
+        Rough number of bytes the parsed XML of this part takes in memory, or
+        |None| when the part was not parsed or is not XML.
+        """
+        return self._memory_estimate
+
+    @property
+    def partname(self):
+        """Partname of this part, e.g. '/ppt/slides/slide1.xml'."""
+        return self._partname
+
+    @property
+    def reference_count(self):
+        """Number of relationships in the package that target this part."""
+        return self._reference_count
+
+    @property
+    def size(self):
+        """Uncompressed size in bytes of this part."""
+        return self._size
+
+    def _set_xml_stats(self, element_count, memory_estimate):
+        self._element_count = element_count
+        self._memory_estimate = memory_estimate
+
+
+def _content_type(content_types, partname):
+    """
+    Return the content type of *partname* in *content_types*, or |None|
+    when it has none.
+    """
+    try:
+        return content_types[partname]
+    except KeyError:
+        return None
+
+
+def _duplicate_groups(zipf, part_infos):
+    """
+    Return a list of lists of the partnames of parts having identical
+    content. Only parts matching another in both size and CRC, as recorded
+    in the central directory, are read to compare their SHA1 hash.
+    """
+    candidates = {}
+    for info in zipf.infolist():
+        candidates.setdefault((info.file_size, info.CRC), []).append(info.filename)
+
+    partnames = set(part_info.partname for part_info in part_infos)
+    groups = []
+    for membernames in candidates.values():
+        membernames = [m for m in membernames if "/%s" % m in partnames]
+        if len(membernames) < 2:
+            continue
+        by_sha1 = {}
+        for membername in membernames:
+            sha1 = hashlib.sha1(zipf.read(membername)).hexdigest()
+            by_sha1.setdefault(sha1, []).append("/%s" % membername)
+        groups.extend(group for group in by_sha1.values() if len(group) > 1)
+    order = dict((p.partname, idx) for idx, p in enumerate(part_infos))
+    return sorted(groups, key=lambda group: order[group[0]])
+
+
+def _is_package_item(membername):
+    """
+    True if *membername* is the content types item or a relationships item
+    rather than a part.
+    """
+    return membername == CONTENT_TYPES_URI.membername or membername.endswith(".rels")
+
+
+def _reference_counts(zipf, infos):
+    """
+    Return a dict mapping partname to the number of internal relationships
+    in the package targeting that part.
+    """
+    reference_counts = {}
+    for info in infos:
+        membername = info.filename
+        if not membername.endswith(".rels"):
+            continue
+        # ---e.g. 'ppt/slides/_rels/slide1.xml.rels' has base URI '/ppt/slides'---
+        baseURI = posixpath.dirname(posixpath.dirname("/%s" % membername))
+        srels = _SerializedRelationshipCollection.load_from_xml(
+            baseURI, zipf.read(membername)
+        )
+        for srel in srels:
+            if srel.is_external:
+                continue
+            partname = srel.target_partname
+            reference_counts[partname] = reference_counts.get(partname, 0) + 1
+    return reference_counts
+
+
+def _xml_stats(blob):
+    """
+    Return an (element_count, memory_estimate) pair for the XML in *blob*,
+    counted without keeping the parsed tree. Entities are not resolved, so
+    a part from an untrusted file can neither read other files nor expand
+    into a huge document.
+    """
+    element_count = attribute_count = text_bytes = 0
+    events = etree.iterparse(BytesIO(blob), events=("end",), resolve_entities=False)
+    for _, element in events:
+        element_count += 1
+        attribute_count += len(element.attrib)
+        if element.text:
+            text_bytes += _NODE_BYTES + len(element.text)
+        element.clear()
+    memory_estimate = (
+        element_count * _NODE_BYTES
+        + attribute_count * (_ATTRIBUTE_BYTES + _NODE_BYTES)
+        + text_bytes
+    )
+    return element_count, memory_estimate
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m pptx.inspect",
+        description="Report the size of each part of a .pptx package.",
+    )
+    parser.add_argument("path", help="path to a .pptx file")
+    parser.add_argument(
+        "--parse",
+        action="store_true",
+        help="parse each XML part to estimate its element count and memory",
+    )
+    parser.add_argument(
+        "--top", type=int, default=None, help="show only the N largest parts"
+    )
+    args = parser.parse_args(argv)
+    report = inspect_package(args.path, parse=args.parse)
+    print(report.format(top=args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+# encoding: utf-8
+
+"""
+Opt-in timing and counting of the phases of loading, saving, and generating
+a presentation.
+
+Instrumentation is disabled until a listener is set using
+:func:`set_listener` or :func:`listening`. While enabled, the end of each
+instrumented phase, or span, is reported by calling the listener with the
+span name, its elapsed time in seconds, and a detail value such as the
+partname the span applies to. Counters of frequent events like XPath
+evaluations accumulate only while enabled and are read using
+:func:`counters`.
+
+The spans reported are:
+
+* ``"PackageReader.from_file"``, reading the zip archive
+* ``"Unmarshaller.unmarshal"``, constructing the parts and relationships
+* ``"parse_xml"``, parsing the XML of a part, with its partname
+* ``"PackageWriter.write"``, writing the whole package
+* ``"serialize"``, serializing a part to be written, with its partname
+* ``"compress"``, compressing a part into the archive, with its partname
+* ``"ChartPart.new"``, generating the XML and workbook of a new chart
+* ``"TextFitter"``, finding the best-fit font size for text
+
+The counters are ``"xpath"``, the number of XPath evaluations, and
+``"parts_parsed"``. When disabled, each instrumented phase costs only
+a module attribute check.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import contextlib
+import time
+
+# ---True while a listener is set; checked by the instrumented code---
+enabled = False
+
+_listener = None
+_counters = {}
+_clock = getattr(time, "perf_counter", time.time)
+
+
+def count(name, n=1):
+    """Add *n* to the counter *name* when instrumentation is enabled."""
+    if enabled:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def counters():
+    """Return a dict mapping each counter name to its current count."""
+    return dict(_counters)
+
+
+@contextlib.contextmanager
+def listening(listener):
+    """
+    Return a context manager that sets *listener* for the duration of the
+    `with` block and then restores the listener set previously, if any.
+    """
+    previous_listener = _listener
+    set_listener(listener)
+    try:
+        yield listener
+    finally:
+        set_listener(previous_listener)
+
+
+def reset_counters():
+    """Set all counters back to zero."""
+    _counters.clear()
+
+
+def set_listener(listener):
+    """
+    Enable instrumentation, reporting each span to *listener*, a callable
+    taking `(name, elapsed, detail)` arguments. Assigning |None| disables
+    instrumentation.
+    """
+    global enabled, _listener
+    _listener = listener
+    enabled = listener is not None
+
+
+def span(name, detail=None):
+    """
+    Return a context manager that reports span *name* and the elapsed time
+    of its `with` block to the listener. It does nothing when
+    instrumentation is disabled.
+    """
+    if not enabled:
+        return _null_span
+    return _Span(name, detail)
+
+
+class Recorder(object):
+    """
+    A listener that keeps each span reported to it, for example::
+
+        recorder = Recorder()
+        with instrumentation.listening(recorder):
+            prs.save("deck.pptx")
+        for name, (span_count, elapsed) in recorder.totals().items():
+            print(name, span_count, elapsed)
+    """
+
+    def __init__(self):
+        super(Recorder, self).__init__()
+        self._spans = []
+
+    def __call__(self, name, elapsed, detail):
+        self._spans.append((name, elapsed, detail))
+
+    @property
+    def spans(self):
+        """
+        List of `(name, elapsed, detail)` 3-tuples, one for each span
+        reported, in the order each span ended.
+        """
+        return list(self._spans)
+
+    def totals(self):
+        """
+        Return a dict mapping each span name to a `(count, elapsed)` 2-tuple
+        of the number of such spans and their total elapsed seconds.
+        """
+        totals = {}
+        for name, elapsed, _ in self._spans:
+            span_count, total = totals.get(name, (0, 0.0))
+            totals[name] = (span_count + 1, total + elapsed)
+        return totals
+
+
+class _NullSpan(object):
+    """Span context manager that does nothing, used while disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_null_span = _NullSpan()
+
+
+class _Span(object):
+    """Context manager timing a span and reporting it to the listener."""
+
+    __slots__ = ("_name", "_detail", "_start")
+
+    def __init__(self, name, detail):
+        self._name = name
+        self._detail = detail
+
+    def __enter__(self):
+        self._start = _clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = _clock() - self._start
+        listener = _listener
+        if listener is not None:
+            listener(self._name, elapsed, self._detail)
+        return False
@@ -7,6 +7,9 @@ writing presentations to and from a .pptx file.
 
 from __future__ import absolute_import
 
+from multiprocessing.pool import ThreadPool
+
+from pptx import instrumentation
 from pptx.util import lazyproperty
 
 from .constants import RELATIONSHIP_TYPE as RT
@@ -26,6 +29,7 @@ class OpcPackage(object):
 
     def __init__(self):
         super(OpcPackage, self).__init__()
+        self._raw_entries = ()
 
     def after_unmarshal(self):
         """
@@ -42,20 +46,20 @@ class OpcPackage(object):
         performing a depth-first traversal of the rels graph.
         """
 
-        def walk_parts(source, visited=list()):
+        def walk_parts(source, visited):
             for rel in source.rels.values():
                 if rel.is_external:
                     continue
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 yield part
                 new_source = part
                 for part in walk_parts(new_source, visited):
                     yield part
 
-        for part in walk_parts(self):
+        for part in walk_parts(self, set()):
             yield part
 
     def iter_rels(self):
@@ -64,8 +68,7 @@ class OpcPackage(object):
         performing a depth-first traversal of the rels graph.
         """
 
-        def walk_rels(source, visited=None):
-            visited = [] if visited is None else visited
+        def walk_rels(source, visited):
             for rel in source.rels.values():
                 yield rel
                 if rel.is_external:
@@ -73,12 +76,12 @@ class OpcPackage(object):
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 new_source = part
                 for rel in walk_rels(new_source, visited):
                     yield rel
 
-        for rel in walk_rels(self):
+        for rel in walk_rels(self, set()):
             yield rel
 
     def load_rel(self, reltype, target, rId, is_external=False):
@@ -109,7 +112,7 @@ class OpcPackage(object):
         containing a single replacement item, a '%d' to be used to insert the
         integer portion of the partname. Example: '/ppt/slides/slide%d.xml'
         """
-        partnames = [part.partname for part in self.iter_parts()]
+        partnames = set(self.iter_partnames())
         for n in range(1, len(partnames) + 2):
             candidate_partname = tmpl % n
             if candidate_partname not in partnames:
@@ -117,15 +120,39 @@ class OpcPackage(object):
         raise Exception("ProgrammingError: ran out of candidate_partnames")
 
     @classmethod
-    def open(cls, pkg_file):
+    def open(cls, pkg_file, workers=None, prune=None):
         """
         Return an |OpcPackage| instance loaded with the contents of
-        *pkg_file*.
+        *pkg_file*. When *workers* is greater than 1, the parts are
+        decompressed and their XML parsed using that many threads.
+
+        *prune*, when not |None|, is called with the physical package reader
+        and the package relationships and returns a set of partnames. Each
+        part so named is loaded as a plain |Part| object, its blob and rels
+        item kept unparsed, and the parts reachable only through such parts
+        are kept as raw entries rather than loaded. Both are saved unchanged.
         """
-        pkg_reader = PackageReader.from_file(pkg_file)
-        package = cls()
-        Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
-        return package
+        if workers is None or workers <= 1:
+            pkg_reader = PackageReader.from_file(pkg_file, prune=prune)
+            return cls._unmarshal(pkg_reader)
+
+        pool = ThreadPool(workers)
+        try:
+            pkg_reader = PackageReader.from_file(pkg_file, pool, prune)
+            return cls._unmarshal(pkg_reader, pool)
+        finally:
+            pool.close()
+            pool.join()
+
+    def iter_partnames(self):
+        """
+        Generate the partname of each part in this package followed by that
+        of each raw entry kept from a pruned load, see :meth:`open`.
+        """
+        for part in self.iter_parts():
+            yield part.partname
+        for partname, _, _ in self._raw_entries:
+            yield partname
 
     def part_related_by(self, reltype):
         """
@@ -166,7 +193,23 @@ class OpcPackage(object):
         """
         for part in self.parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        PackageWriter.write(pkg_file, self.rels, self.parts, self._raw_entries)
+
+    @classmethod
+    def _unmarshal(cls, pkg_reader, pool=None):
+        """
+        Return a new instance of this package class loaded from
+        *pkg_reader*. A part read without its relationships because it was
+        pruned is loaded as a plain |Part| object.
+        """
+        raw_entries = tuple(pkg_reader.iter_raw_entries())
+        part_factory = PartFactory
+        if raw_entries:
+            part_factory = _unparsed_part_factory(pkg_reader.pruned_partnames)
+        package = cls()
+        Unmarshaller.unmarshal(pkg_reader, package, part_factory, pool)
+        package._raw_entries = raw_entries
+        return package
 
 
 class Part(object):
@@ -350,7 +393,9 @@ class XmlPart(Part):
 
     @classmethod
     def load(cls, partname, content_type, blob, package):
-        element = parse_xml(blob)
+        with instrumentation.span("parse_xml", partname):
+            element = parse_xml(blob)
+        instrumentation.count("parts_parsed")
         return cls(partname, content_type, element, package)
 
     @property
@@ -408,6 +453,25 @@ class RelationshipCollection(dict):
             self._target_parts_by_rId[rId] = target
         return rel
 
+    def add_relationships(self, reltype, target_parts):
+        """
+        Return a list of the rIds of newly added relationships of *reltype*,
+        one to each part in *target_parts*, in that order. Unlike
+        :meth:`get_or_add`, no existing relationship is reused and the
+        available rIds are found in a single pass, so relating many new parts
+        takes time linear in their number.
+        """
+        rIds = []
+        n = 0
+        for target_part in target_parts:
+            n += 1
+            while "rId%d" % n in self:
+                n += 1
+            rId = "rId%d" % n
+            self.add_relationship(reltype, target_part, rId)
+            rIds.append(rId)
+        return rIds
+
     def get_or_add(self, reltype, target_part):
         """
         Return relationship of *reltype* to *target_part*, newly added if not
@@ -513,17 +577,24 @@ class Unmarshaller(object):
     """
 
     @staticmethod
-    def unmarshal(pkg_reader, package, part_factory):
+    def unmarshal(pkg_reader, package, part_factory, pool=None):
         """
         Construct graph of parts and realized relationships based on the
         contents of *pkg_reader*, delegating construction of each part to
-        *part_factory*. Package relationships are added to *pkg*.
-        """
-        parts = Unmarshaller._unmarshal_parts(pkg_reader, package, part_factory)
-        Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
-        for part in parts.values():
-            part.after_unmarshal()
-        package.after_unmarshal()
+        *part_factory*. Package relationships are added to *pkg*. When *pool*
+        is a thread pool, the parts are constructed using its threads.
+        """
+        with instrumentation.span("Unmarshaller.unmarshal"):
+            if pool is None:
+                parts = Unmarshaller._unmarshal_parts(pkg_reader, package, part_factory)
+            else:
+                parts = Unmarshaller._unmarshal_parts_concurrently(
+                    pkg_reader, package, part_factory, pool
+                )
+            Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
+            for part in parts.values():
+                part.after_unmarshal()
+            package.after_unmarshal()
 
     @staticmethod
     def _unmarshal_parts(pkg_reader, package, part_factory):
@@ -537,6 +608,24 @@ class Unmarshaller(object):
             parts[partname] = part_factory(partname, content_type, blob, package)
         return parts
 
+    @staticmethod
+    def _unmarshal_parts_concurrently(pkg_reader, package, part_factory, pool):
+        """
+        Return a dictionary of |Part| instances like :meth:`_unmarshal_parts`,
+        but with each part constructed, including parsing its XML, by
+        a thread of *pool*. Relationships are added afterward, in the calling
+        thread, so each part is still constructed exactly once.
+        """
+        sparts = list(pkg_reader.iter_sparts())
+
+        def construct(spart):
+            partname, content_type, blob = spart
+            return part_factory(partname, content_type, blob, package)
+
+        return dict(
+            (spart[0], part) for spart, part in zip(sparts, pool.map(construct, sparts))
+        )
+
     @staticmethod
     def _unmarshal_relationships(pkg_reader, package, parts):
         """
@@ -552,11 +641,27 @@ class Unmarshaller(object):
             source.load_rel(srel.reltype, target, srel.rId, srel.is_external)
 
 
+def _unparsed_part_factory(partnames):
+    """
+    Return a part factory that constructs the parts named in *partnames* as
+    plain |Part| objects and every other part using |PartFactory|.
+    """
+
+    def part_factory(partname, content_type, blob, package):
+        if partname in partnames:
+            return Part.load(partname, content_type, blob, package)
+        return PartFactory(partname, content_type, blob, package)
+
+    return part_factory
+
+
 class _Relationship(object):
     """
     Value object for relationship to part.
     """
 
+    __slots__ = ("_rId", "_reltype", "_target", "_baseURI", "_is_external")
+
     def __init__(self, rId, reltype, target, baseURI, external=False):
         super(_Relationship, self).__init__()
         self._rId = rId
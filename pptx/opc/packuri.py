@@ -15,6 +15,8 @@ class PackURI(str):
     filename slice. Behaves as |str| otherwise.
     """
 
+    __slots__ = ()
+
     _filename_re = re.compile("([a-zA-Z]+)([0-9][0-9]*)?")
 
     def __new__(cls, pack_uri_str):
@@ -82,6 +82,22 @@ class _DirPkgReader(PhysPkgReader):
         """
         return self.blob_for(CONTENT_TYPES_URI)
 
+    @property
+    def membernames(self):
+        """
+        List of the membername of each file in the package directory, like
+        'ppt/slides/slide1.xml'.
+        """
+        membernames = []
+        for dirpath, _, filenames in os.walk(self._path):
+            reldir = os.path.relpath(dirpath, self._path)
+            for filename in filenames:
+                path = (
+                    filename if reldir == os.curdir else os.path.join(reldir, filename)
+                )
+                membernames.append(path.replace(os.sep, "/"))
+        return membernames
+
     def rels_xml_for(self, source_uri):
         """
         Return rels item XML for source with *source_uri*, or None if the
@@ -123,6 +139,14 @@ class _ZipPkgReader(PhysPkgReader):
         """
         return self.blob_for(CONTENT_TYPES_URI)
 
+    @property
+    def membernames(self):
+        """
+        List of the membername of each item in the zip archive, like
+        'ppt/slides/slide1.xml', in archive order.
+        """
+        return [name for name in self._zipf.namelist() if not name.endswith("/")]
+
     def rels_xml_for(self, source_uri):
         """
         Return rels item XML for source with *source_uri* or None if no rels
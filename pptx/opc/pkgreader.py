@@ -7,12 +7,19 @@ Provides a low-level, read-only API to a serialized Open Packaging Convention
 
 from __future__ import absolute_import
 
+import sys
+
+from .. import instrumentation
 from .constants import RELATIONSHIP_TARGET_MODE as RTM
 from .oxml import parse_xml
-from .packuri import PACKAGE_URI, PackURI
+from .packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
 from .phys_pkg import PhysPkgReader
 from .shared import CaseInsensitiveDict
 
+# ---zipfile supports reading members from more than one thread at once only
+# ---on Python 3
+_concurrent_reads = sys.version_info >= (3, 0)
+
 
 class PackageReader(object):
     """
@@ -20,24 +27,68 @@ class PackageReader(object):
     :attr:`serialized_parts` and :attr:`pkg_srels` attributes.
     """
 
-    def __init__(self, content_types, pkg_srels, sparts):
+    def __init__(
+        self, content_types, pkg_srels, sparts, raw_entries=(), pruned=frozenset()
+    ):
         super(PackageReader, self).__init__()
         self._pkg_srels = pkg_srels
         self._sparts = sparts
+        self._raw_entries = raw_entries
+        self._pruned = pruned
 
     @staticmethod
-    def from_file(pkg_file):
+    def from_file(pkg_file, pool=None, prune=None):
         """
         Return a |PackageReader| instance loaded with contents of *pkg_file*.
+        When *pool* is a thread pool, the parts are decompressed using its
+        threads.
+
+        *prune*, when not |None|, is called with the physical package reader
+        and the package relationships, and returns a set of partnames. Each
+        part so named is read without its relationships, and the parts
+        reachable only through them are not read as parts at all. Those
+        parts, and the rels items not read, are instead kept as raw entries
+        available from :meth:`iter_raw_entries`.
+        """
+        with instrumentation.span("PackageReader.from_file"):
+            phys_reader = PhysPkgReader(pkg_file)
+            content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
+            pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+            pruned = frozenset() if prune is None else prune(phys_reader, pkg_srels)
+            if pool is None or not _concurrent_reads:
+                sparts = PackageReader._load_serialized_parts(
+                    phys_reader, pkg_srels, content_types, pruned
+                )
+            else:
+                sparts = PackageReader._read_serialized_parts(
+                    phys_reader, pkg_srels, content_types, pool, pruned
+                )
+            raw_entries = (
+                PackageReader._read_raw_entries(
+                    phys_reader, content_types, sparts, pruned
+                )
+                if pruned
+                else ()
+            )
+            phys_reader.close()
+        return PackageReader(content_types, pkg_srels, sparts, raw_entries, pruned)
+
+    @property
+    def pruned_partnames(self):
         """
-        phys_reader = PhysPkgReader(pkg_file)
-        content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
-        pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
-        sparts = PackageReader._load_serialized_parts(
-            phys_reader, pkg_srels, content_types
-        )
-        phys_reader.close()
-        return PackageReader(content_types, pkg_srels, sparts)
+        Set of the partnames of the parts read without their relationships,
+        as chosen by the *prune* argument to :meth:`from_file`.
+        """
+        return self._pruned
+
+    def iter_raw_entries(self):
+        """
+        Generate a 3-tuple `(partname, content_type, blob)` for each of the
+        items in the package kept unread by pruning, including rels items.
+        *content_type* is |None| for an item having no content type.
+        """
+        for raw_entry in self._raw_entries:
+            yield raw_entry
 
     def iter_sparts(self):
         """
@@ -59,20 +110,66 @@ class PackageReader(object):
                 yield (spart.partname, srel)
 
     @staticmethod
-    def _load_serialized_parts(phys_reader, pkg_srels, content_types):
+    def _load_serialized_parts(phys_reader, pkg_srels, content_types, pruned=()):
         """
         Return a list of |_SerializedPart| instances corresponding to the
         parts in *phys_reader* accessible by walking the relationship graph
-        starting with *pkg_srels*.
+        starting with *pkg_srels*, without passing through a part named in
+        *pruned*.
         """
         sparts = []
-        part_walker = PackageReader._walk_phys_parts(phys_reader, pkg_srels)
+        part_walker = PackageReader._walk_phys_parts(phys_reader, pkg_srels, pruned)
         for partname, blob, srels in part_walker:
             content_type = content_types[partname]
             spart = _SerializedPart(partname, content_type, blob, srels)
             sparts.append(spart)
         return tuple(sparts)
 
+    @staticmethod
+    def _read_raw_entries(phys_reader, content_types, sparts, pruned):
+        """
+        Return a tuple of `(partname, content_type, blob)` 3-tuples, one for
+        each item in *phys_reader* other than the content types item, the
+        package rels item, the parts in *sparts* and the rels items of those
+        not named in *pruned*.
+        """
+        read_membernames = set(
+            [CONTENT_TYPES_URI.membername, PACKAGE_URI.rels_uri.membername]
+        )
+        for spart in sparts:
+            read_membernames.add(spart.partname.membername)
+            if spart.partname not in pruned:
+                read_membernames.add(spart.partname.rels_uri.membername)
+
+        raw_entries = []
+        for membername in phys_reader.membernames:
+            if membername in read_membernames:
+                continue
+            partname = PackURI("/%s" % membername)
+            try:
+                content_type = content_types[partname]
+            except KeyError:
+                content_type = None
+            raw_entries.append((partname, content_type, phys_reader.blob_for(partname)))
+        return tuple(raw_entries)
+
+    @staticmethod
+    def _read_serialized_parts(phys_reader, pkg_srels, content_types, pool, pruned=()):
+        """
+        Return a list of |_SerializedPart| instances like
+        :meth:`_load_serialized_parts`, but with the blob of each part read
+        by a thread of *pool*. Only the relationship graph is walked in the
+        calling thread.
+        """
+        part_srels = list(
+            PackageReader._walk_part_srels(phys_reader, pkg_srels, pruned)
+        )
+        blobs = pool.map(phys_reader.blob_for, [partname for partname, _ in part_srels])
+        return tuple(
+            _SerializedPart(partname, content_types[partname], blob, srels)
+            for (partname, srels), blob in zip(part_srels, blobs)
+        )
+
     @staticmethod
     def _srels_for(phys_reader, source_uri):
         """
@@ -85,27 +182,43 @@ class PackageReader(object):
         )
 
     @staticmethod
-    def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
+    def _walk_part_srels(phys_reader, srels, pruned=(), visited_partnames=None):
         """
-        Generate a 3-tuple `(partname, blob, srels)` for each of the parts in
-        *phys_reader* by walking the relationship graph rooted at srels.
+        Generate a 2-tuple `(partname, srels)` for each of the parts in
+        *phys_reader* by walking the relationship graph rooted at srels. The
+        relationships of a part named in *pruned* are neither read nor
+        followed; its *srels* is an empty tuple.
         """
         if visited_partnames is None:
-            visited_partnames = []
+            visited_partnames = set()
         for srel in srels:
             if srel.is_external:
                 continue
             partname = srel.target_partname
             if partname in visited_partnames:
                 continue
-            visited_partnames.append(partname)
+            visited_partnames.add(partname)
+            if partname in pruned:
+                yield (partname, ())
+                continue
             part_srels = PackageReader._srels_for(phys_reader, partname)
-            blob = phys_reader.blob_for(partname)
-            yield (partname, blob, part_srels)
-            for partname, blob, srels in PackageReader._walk_phys_parts(
-                phys_reader, part_srels, visited_partnames
+            yield (partname, part_srels)
+            for partname, srels in PackageReader._walk_part_srels(
+                phys_reader, part_srels, pruned, visited_partnames
             ):
-                yield (partname, blob, srels)
+                yield (partname, srels)
+
+    @staticmethod
+    def _walk_phys_parts(phys_reader, srels, pruned=()):
+        """
+        Generate a 3-tuple `(partname, blob, srels)` for each of the parts in
+        *phys_reader* by walking the relationship graph rooted at srels,
+        pruned at the parts named in *pruned*.
+        """
+        for partname, part_srels in PackageReader._walk_part_srels(
+            phys_reader, srels, pruned
+        ):
+            yield (partname, phys_reader.blob_for(partname), part_srels)
 
 
 class _ContentTypeMap(object):
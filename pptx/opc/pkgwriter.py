@@ -7,6 +7,7 @@ Convention (OPC) package, essentially an implementation of OpcPackage.save()
 
 from __future__ import absolute_import
 
+from .. import instrumentation
 from .constants import CONTENT_TYPE as CT
 from .oxml import CT_Types, serialize_part_xml
 from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
@@ -24,25 +25,31 @@ class PackageWriter(object):
     """
 
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, raw_entries=()):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
-        content types of the parts.
+        content types of the parts. Each `(partname, content_type, blob)`
+        item in *raw_entries* is written unchanged after the parts.
         """
-        phys_writer = PhysPkgWriter(pkg_file)
-        PackageWriter._write_content_types_stream(phys_writer, parts)
-        PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
-        phys_writer.close()
+        with instrumentation.span("PackageWriter.write"):
+            phys_writer = PhysPkgWriter(pkg_file)
+            PackageWriter._write_content_types_stream(phys_writer, parts, raw_entries)
+            PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
+            PackageWriter._write_parts(phys_writer, parts)
+            PackageWriter._write_raw_entries(phys_writer, raw_entries)
+            phys_writer.close()
 
     @staticmethod
-    def _write_content_types_stream(phys_writer, parts):
+    def _write_content_types_stream(phys_writer, parts, raw_entries=()):
         """
         Write ``[Content_Types].xml`` part to the physical package with an
-        appropriate content type lookup target for each part in *parts*.
+        appropriate content type lookup target for each part in *parts* and
+        each item in *raw_entries* having a content type.
         """
-        content_types_blob = serialize_part_xml(_ContentTypesItem.xml_for(parts))
+        content_types_blob = serialize_part_xml(
+            _ContentTypesItem.xml_for(parts, raw_entries)
+        )
         phys_writer.write(CONTENT_TYPES_URI, content_types_blob)
 
     @staticmethod
@@ -52,10 +59,23 @@ class PackageWriter(object):
         rels item for its relationships if and only if it has any.
         """
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            partname = part.partname
+            with instrumentation.span("serialize", partname):
+                blob = part.blob
+            with instrumentation.span("compress", partname):
+                phys_writer.write(partname, blob)
             if len(part._rels):
                 phys_writer.write(part.partname.rels_uri, part._rels.xml)
 
+    @staticmethod
+    def _write_raw_entries(phys_writer, raw_entries):
+        """
+        Write the blob of each `(partname, content_type, blob)` item in
+        *raw_entries* to the package as it is.
+        """
+        for partname, _, blob in raw_entries:
+            phys_writer.write(partname, blob)
+
     @staticmethod
     def _write_pkg_rels(phys_writer, pkg_rels):
         """
@@ -78,17 +98,21 @@ class _ContentTypesItem(object):
         self._overrides = dict()
 
     @classmethod
-    def xml_for(cls, parts):
+    def xml_for(cls, parts, raw_entries=()):
         """
-        Return content types XML mapping each part in *parts* to the
-        appropriate content type and suitable for storage as
-        ``[Content_Types].xml`` in an OPC package.
+        Return content types XML mapping each part in *parts*, and each
+        `(partname, content_type, blob)` item in *raw_entries* having
+        a content type, to the appropriate content type and suitable for
+        storage as ``[Content_Types].xml`` in an OPC package.
         """
         cti = cls()
         cti._defaults["rels"] = CT.OPC_RELATIONSHIPS
         cti._defaults["xml"] = CT.XML
         for part in parts:
             cti._add_content_type(part.partname, part.content_type)
+        for partname, content_type, _ in raw_entries:
+            if content_type is not None:
+                cti._add_content_type(partname, content_type)
         return cti._xml()
 
     def _add_content_type(self, partname, content_type):
@@ -117,3 +141,50 @@ class _ContentTypesItem(object):
         for partname in sorted(self._overrides.keys()):
             _types_elm.add_override(partname, self._overrides[partname])
         return _types_elm
+
+
+class StreamingPackageWriter(object):
+    """
+    Writes a zip-format OPC package to *pkg_file* incrementally. Unlike
+    |PackageWriter|, which writes the whole package in a single call, parts
+    can be written one at a time using :meth:`write_part` as soon as they are
+    complete, so their in-memory representation can be released. The content
+    types stream, the package rels item, and any part not yet written are
+    written on :meth:`close`.
+    """
+
+    def __init__(self, pkg_file):
+        super(StreamingPackageWriter, self).__init__()
+        self._phys_writer = PhysPkgWriter(pkg_file)
+        self._written_partnames = set()
+
+    def close(self, pkg_rels, parts):
+        """
+        Finalize the package by writing the content types stream for *parts*,
+        the package rels item for *pkg_rels* and each part in *parts* not
+        already written, then close the physical package.
+        """
+        parts = list(parts)
+        pending = [part for part in parts if not self.is_written(part)]
+        PackageWriter._write_content_types_stream(self._phys_writer, parts)
+        PackageWriter._write_pkg_rels(self._phys_writer, pkg_rels)
+        PackageWriter._write_parts(self._phys_writer, pending)
+        self._phys_writer.close()
+
+    def is_written(self, part):
+        """
+        Return |True| if a part having the partname of *part* has already
+        been written to the package, |False| otherwise.
+        """
+        return part.partname in self._written_partnames
+
+    def write_part(self, part):
+        """
+        Write the blob of *part* to the package, along with its rels item if
+        it has any relationships. A part already written is skipped, so
+        a part shared by more than one source is written only once.
+        """
+        if self.is_written(part):
+            return
+        PackageWriter._write_parts(self._phys_writer, (part,))
+        self._written_partnames.add(part.partname)
@@ -8,16 +8,63 @@ Also makes available a handful of functions that wrap its typical uses.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import os
+import sys
+import threading
+import warnings
 
 from lxml import etree
 
 from .ns import NamespacePrefixedTag
 
-
 # configure etree XML parser -------------------------------
 element_class_lookup = etree.ElementNamespaceClassLookup()
-oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
-oxml_parser.set_element_class_lookup(element_class_lookup)
+
+
+def _new_parser():
+    """
+    Return a new XML parser producing the custom element classes registered
+    in `element_class_lookup`.
+    """
+    parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+    parser.set_element_class_lookup(element_class_lookup)
+    return parser
+
+
+class _ThreadParser(threading.local):
+    """
+    Holds the parser for the current thread. An lxml parser must not be
+    used by more than one thread at a time, so each thread gets its own,
+    all sharing the same element class lookup.
+    """
+
+    def __init__(self):
+        self.parser = _new_parser()
+
+
+thread_parser = _ThreadParser()
+
+
+def __getattr__(name):
+    """
+    Resolve the deprecated module attribute `oxml_parser` to the parser of
+    the calling thread. It is to be removed in a future release; use
+    :func:`parse_xml` or `thread_parser.parser` instead.
+    """
+    if name == "oxml_parser":
+        warnings.warn(
+            "pptx.oxml.oxml_parser is deprecated, use parse_xml() or "
+            "thread_parser.parser",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return thread_parser.parser
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # ---module __getattr__() is not supported, keep a parser that callers
+    # ---using it directly must not share between threads
+    oxml_parser = _new_parser()
 
 
 def parse_from_template(template_name):
@@ -35,9 +82,10 @@ def parse_from_template(template_name):
 def parse_xml(xml):
     """
     Return root lxml element obtained by parsing XML character string in
-    *xml*, which can be either a Python 2.x string or unicode.
+    *xml*, which can be either a Python 2.x string or unicode. Safe to call
+    from more than one thread at once.
     """
-    root_element = etree.fromstring(xml, oxml_parser)
+    root_element = etree.fromstring(xml, thread_parser.parser)
     return root_element
 
 
@@ -446,6 +494,7 @@ register_element_cls("a:tr", CT_TableRow)
 
 
 from .text import (  # noqa: E402
+    CT_FontReference,
     CT_RegularTextRun,
     CT_TextBody,
     CT_TextBodyProperties,
@@ -453,6 +502,7 @@ from .text import (  # noqa: E402
     CT_TextField,
     CT_TextFont,
     CT_TextLineBreak,
+    CT_TextListStyle,
     CT_TextNormalAutofit,
     CT_TextParagraph,
     CT_TextParagraphProperties,
@@ -463,11 +513,23 @@ from .text import (  # noqa: E402
 
 register_element_cls("a:bodyPr", CT_TextBodyProperties)
 register_element_cls("a:br", CT_TextLineBreak)
+register_element_cls("a:defPPr", CT_TextParagraphProperties)
 register_element_cls("a:defRPr", CT_TextCharacterProperties)
 register_element_cls("a:endParaRPr", CT_TextCharacterProperties)
 register_element_cls("a:fld", CT_TextField)
+register_element_cls("a:fontRef", CT_FontReference)
 register_element_cls("a:latin", CT_TextFont)
 register_element_cls("a:lnSpc", CT_TextSpacing)
+register_element_cls("a:lstStyle", CT_TextListStyle)
+register_element_cls("a:lvl1pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl2pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl3pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl4pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl5pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl6pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl7pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl8pPr", CT_TextParagraphProperties)
+register_element_cls("a:lvl9pPr", CT_TextParagraphProperties)
 register_element_cls("a:normAutofit", CT_TextNormalAutofit)
 register_element_cls("a:r", CT_RegularTextRun)
 register_element_cls("a:p", CT_TextParagraph)
@@ -480,6 +542,11 @@ register_element_cls("a:spcPct", CT_TextSpacingPercent)
 register_element_cls("a:spcPts", CT_TextSpacingPoint)
 register_element_cls("a:txBody", CT_TextBody)
 register_element_cls("c:txPr", CT_TextBody)
+register_element_cls("p:bodyStyle", CT_TextListStyle)
+register_element_cls("p:defaultTextStyle", CT_TextListStyle)
+register_element_cls("p:notesStyle", CT_TextListStyle)
+register_element_cls("p:otherStyle", CT_TextListStyle)
+register_element_cls("p:titleStyle", CT_TextListStyle)
 register_element_cls("p:txBody", CT_TextBody)
 
 
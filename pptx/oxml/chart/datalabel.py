@@ -6,6 +6,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from pptx.enum.chart import XL_DATA_LABEL_POSITION
 from pptx.oxml import parse_xml
+from pptx.oxml.chart.shared import get_or_add_in_idx_order
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.text import CT_TextBody
 from pptx.oxml.xmlchemy import (
@@ -175,17 +176,30 @@ class CT_DLbls(BaseOxmlElement):
         Return the `c:dLbl` child representing the label for the data point
         at index *idx*.
         """
-        matches = self.xpath('c:dLbl[c:idx[@val="%d"]]' % idx)
+        matches = self.xpath("c:dLbl[c:idx[@val=$idx]]", idx=idx)
         if matches:
             return matches[0]
         return None
 
+    def get_or_add_dLbls_for_points(self, idxs):
+        """
+        Return a dict mapping each idx in *idxs* to the `c:dLbl` child for
+        the data point at that index, adding those not present in idx order.
+        """
+
+        def new_dLbl(idx):
+            dLbl = self._new_dLbl()
+            dLbl.idx.val = idx
+            return dLbl
+
+        return get_or_add_in_idx_order(self.dLbl_lst, idxs, new_dLbl, self._insert_dLbl)
+
     def get_or_add_dLbl_for_point(self, idx):
         """
         Return the `c:dLbl` element representing the label of the point at
         index *idx*.
         """
-        matches = self.xpath('c:dLbl[c:idx[@val="%d"]]' % idx)
+        matches = self.xpath("c:dLbl[c:idx[@val=$idx]]", idx=idx)
         if matches:
             return matches[0]
         return self._insert_dLbl_in_sequence(idx)
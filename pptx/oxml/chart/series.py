@@ -6,7 +6,11 @@ Series-related oxml objects.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from bisect import bisect_right
+
 from .datalabel import CT_DLbls
+from .shared import get_or_add_in_idx_order
+from ..ns import qn
 from ..simpletypes import XsdUnsignedInt
 from ..xmlchemy import (
     BaseOxmlElement,
@@ -86,6 +90,16 @@ class CT_NumDataSource(BaseOxmlElement):
 
     numRef = OneAndOnlyOne("c:numRef")
 
+    @property
+    def numRef_f(self):
+        """
+        Return the text of `./c:numRef/c:f`, the worksheet range reference
+        for the values in this data source, or |None| when the values are
+        literal rather than a reference.
+        """
+        results = self.xpath("./c:numRef/c:f")
+        return results[0].text if results else None
+
     @property
     def ptCount_val(self):
         """
@@ -98,14 +112,52 @@ class CT_NumDataSource(BaseOxmlElement):
         results = self.xpath(".//c:ptCount/@val")
         return int(results[0]) if results else 0
 
+    @property
+    def pt_container(self):
+        """
+        The `./c:numRef/c:numCache` or `./c:numLit` element containing the
+        `c:pt` elements of this data source, or |None| if it has neither.
+        """
+        results = self.xpath("./c:numRef/c:numCache | ./c:numLit")
+        return results[0] if results else None
+
     def pt_v(self, idx):
         """
         Return the Y value for data point *idx* in this cache, or None if no
         value is present for that data point.
         """
-        results = self.xpath(".//c:pt[@idx=%d]" % idx)
+        results = self.xpath(".//c:pt[@idx=$idx]", idx=idx)
         return results[0].value if results else None
 
+    def set_pt_values(self, values):
+        """
+        Set the value of each `c:pt` element in the numeric cache identified
+        by an idx key in the *values* mapping. A `c:pt` element is added in
+        idx order when not present and removed when its new value is |None|.
+        Existing points are located in a single pass over the cache.
+        """
+        numCache = self.pt_container
+        pts = dict((pt.idx, pt) for pt in numCache.iterchildren(qn("c:pt")))
+        existing_idxs = sorted(pts)
+        for idx, value in sorted(values.items()):
+            pt = pts.get(idx)
+            if value is None:
+                if pt is not None:
+                    numCache.remove(pt)
+                continue
+            if pt is None:
+                pt = CT_StrVal_NumVal_Composite.new_pt(idx)
+                successor_offset = bisect_right(existing_idxs, idx)
+                if successor_offset < len(existing_idxs):
+                    pts[existing_idxs[successor_offset]].addprevious(pt)
+                else:
+                    extLst = numCache.find(qn("c:extLst"))
+                    if extLst is None:
+                        numCache.append(pt)
+                    else:
+                        extLst.addprevious(pt)
+            pt.v.text = str(value)
+
 
 class CT_SeriesComposite(BaseOxmlElement):
     """
@@ -195,12 +247,25 @@ class CT_SeriesComposite(BaseOxmlElement):
         dLbls = self.get_or_add_dLbls()
         return dLbls.get_or_add_dLbl_for_point(idx)
 
+    def get_or_add_dPts(self, idxs):
+        """
+        Return a dict mapping each idx in *idxs* to the `c:dPt` child for the
+        data point at that index, adding those not present in idx order.
+        """
+
+        def new_dPt(idx):
+            dPt = self._new_dPt()
+            dPt.idx.val = idx
+            return dPt
+
+        return get_or_add_in_idx_order(self.dPt_lst, idxs, new_dPt, self._insert_dPt)
+
     def get_or_add_dPt_for_point(self, idx):
         """
         Return the `c:dPt` child representing the visual properties of the
         data point at index *idx*.
         """
-        matches = self.xpath('c:dPt[c:idx[@val="%d"]]' % idx)
+        matches = self.xpath("c:dPt[c:idx[@val=$idx]]", idx=idx)
         if matches:
             return matches[0]
         dPt = self._add_dPt()
@@ -250,6 +315,17 @@ class CT_StrVal_NumVal_Composite(BaseOxmlElement):
     v = OneAndOnlyOne("c:v")
     idx = RequiredAttribute("idx", XsdUnsignedInt)
 
+    @classmethod
+    def new_pt(cls, idx):
+        """
+        Return a newly created "loose" `c:pt` element having *idx* and an
+        empty `c:v` child.
+        """
+        pt = OxmlElement("c:pt")
+        pt.idx = idx
+        pt.append(OxmlElement("c:v"))
+        return pt
+
     @property
     def value(self):
         """
@@ -4,6 +4,8 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from bisect import bisect_right
+
 from pptx.oxml import parse_xml
 from pptx.oxml.ns import nsdecls
 from pptx.oxml.simpletypes import (
@@ -222,3 +224,33 @@ class CT_UnsignedInt(BaseOxmlElement):
     """
 
     val = RequiredAttribute("val", XsdUnsignedInt)
+
+
+def get_or_add_in_idx_order(elements, idxs, new_element, insert_first):
+    """
+    Return a dict mapping each idx in *idxs* to the element in *elements*
+    having that `c:idx/@val`, such as a `c:dPt` or `c:dLbl` element. Any
+    element not yet present is created by calling *new_element* with its idx
+    and inserted in idx order among *elements* in a single sorted pass.
+    *insert_first* is called to place the first element when *elements* is
+    empty.
+    """
+    by_idx = dict((element.idx.val, element) for element in elements)
+    existing_idxs = sorted(by_idx)
+    last = elements[-1] if elements else None
+    result = {}
+    for idx in sorted(set(idxs)):
+        element = by_idx.get(idx)
+        if element is None:
+            element = new_element(idx)
+            successor_offset = bisect_right(existing_idxs, idx)
+            if successor_offset < len(existing_idxs):
+                by_idx[existing_idxs[successor_offset]].addprevious(element)
+            else:
+                if last is None:
+                    insert_first(element)
+                else:
+                    last.addnext(element)
+                last = element
+        result[idx] = element
+    return result
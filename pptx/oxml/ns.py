@@ -6,6 +6,8 @@ Namespace related objects.
 
 from __future__ import absolute_import
 
+import threading
+
 
 #: Maps namespace prefix to namespace name for all known PowerPoint XML
 #: namespaces.
@@ -133,7 +135,17 @@ def qn(namespace_prefixed_tag):
     Return a Clark-notation qualified tag name corresponding to
     *namespace_prefixed_tag*, a string like 'p:body'. 'qn' stands for
     *qualified name*. As an example, ``qn('p:cSld')`` returns
-    ``'{http://schemas.../main}cSld'``.
+    ``'{http://schemas.../main}cSld'``. Safe to call from more than one
+    thread at once.
     """
-    nsptag = NamespacePrefixedTag(namespace_prefixed_tag)
-    return nsptag.clark_name
+    try:
+        return _qn_cache[namespace_prefixed_tag]
+    except KeyError:
+        clark_name = NamespacePrefixedTag(namespace_prefixed_tag).clark_name
+        with _qn_cache_lock:
+            return _qn_cache.setdefault(namespace_prefixed_tag, clark_name)
+
+
+# ---Clark names by namespace-prefixed tag, the set of tags used is small---
+_qn_cache = {}
+_qn_cache_lock = threading.Lock()
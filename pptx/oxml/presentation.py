@@ -6,8 +6,19 @@ Custom element classes for presentation-related XML elements.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from .simpletypes import ST_SlideId, ST_SlideSizeCoordinate, XsdString
-from .xmlchemy import BaseOxmlElement, RequiredAttribute, ZeroOrOne, ZeroOrMore
+from .simpletypes import (
+    ST_SlideId,
+    ST_SlideMasterId,
+    ST_SlideSizeCoordinate,
+    XsdString,
+)
+from .xmlchemy import (
+    BaseOxmlElement,
+    OptionalAttribute,
+    RequiredAttribute,
+    ZeroOrOne,
+    ZeroOrMore,
+)
 
 
 class CT_Presentation(BaseOxmlElement):
@@ -55,6 +66,18 @@ class CT_SlideIdList(BaseOxmlElement):
         """
         return self._add_sldId(id=self._next_id, rId=rId)
 
+    def add_sldIds(self, rIds):
+        """
+        Return a list of newly created <p:sldId> child elements, one for each
+        rId in *rIds*, in that order. The slide ids are assigned in a single
+        pass rather than searching for the next available id for each one.
+        """
+        next_id = self._next_id
+        return [
+            self._add_sldId(id=next_id + offset, rId=rId)
+            for offset, rId in enumerate(rIds)
+        ]
+
     @property
     def _next_id(self):
         """
@@ -82,6 +105,7 @@ class CT_SlideMasterIdListEntry(BaseOxmlElement):
     a reference to a slide master.
     """
 
+    id = OptionalAttribute("id", ST_SlideMasterId)
     rId = RequiredAttribute("r:id", XsdString)
 
 
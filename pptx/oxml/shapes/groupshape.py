@@ -199,6 +199,33 @@ class CT_GroupShape(BaseShapeElement):
             if e.has_ph_elm:
                 yield e
 
+    def iter_paragraph_text(self):
+        """
+        Generate a `(shape_id, paragraph_idx, text)` 3-tuple for each
+        paragraph in a shape in this shape tree, in document order.
+        Paragraphs in shapes nested in a group shape and in table cells are
+        included; *paragraph_idx* is the zero-based position of the paragraph
+        within its shape, counting table cells in row-major order. A line
+        break in *text* appears as a vertical-tab character, like
+        :attr:`_Paragraph.text`.
+        """
+        shape_tags = (qn("p:sp"), qn("p:graphicFrame"))
+        br_tag = qn("a:br")
+        shape, paragraph_idx = None, 0
+        for p in self.xpath(".//p:txBody/a:p | .//a:tc/a:txBody/a:p"):
+            owner = next(p.iterancestors(*shape_tags))
+            if owner is shape:
+                paragraph_idx += 1
+            else:
+                shape, paragraph_idx = owner, 0
+            # ---first grandchild of a shape is its `p:cNvPr` element---
+            shape_id = int(owner[0][0].get("id"))
+            text = "".join(
+                "\v" if e.tag == br_tag else (e.text or "")
+                for e in p.xpath("a:r/a:t | a:br | a:fld/a:t")
+            )
+            yield shape_id, paragraph_idx, text
+
     def iter_shape_elms(self):
         """
         Generate each child of this ``<p:spTree>`` element that corresponds
@@ -7,7 +7,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from pptx.oxml import parse_from_template, parse_xml
 from pptx.oxml.dml.fill import CT_GradientFillProperties
 from pptx.oxml.ns import nsdecls
-from pptx.oxml.simpletypes import XsdString
+from pptx.oxml.simpletypes import ST_SlideMasterId, XsdString
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement,
     Choice,
@@ -276,6 +276,7 @@ class CT_SlideLayoutIdListEntry(BaseOxmlElement):
     a reference to a slide layout.
     """
 
+    id = OptionalAttribute("id", ST_SlideMasterId)
     rId = RequiredAttribute("r:id", XsdString)
 
 
@@ -4,12 +4,16 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import copy
+
+from lxml import etree
+
 from pptx.enum.text import MSO_VERTICAL_ANCHOR
 from pptx.oxml import parse_xml
 from pptx.oxml.dml.fill import CT_GradientFillProperties
-from pptx.oxml.ns import nsdecls
+from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.simpletypes import ST_Coordinate, ST_Coordinate32, XsdBoolean, XsdInt
-from pptx.oxml.text import CT_TextBody
+from pptx.oxml.text import CT_RegularTextRun, CT_TextBody
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement,
     Choice,
@@ -71,6 +75,56 @@ class CT_Table(BaseOxmlElement):
     def firstRow(self, value):
         self._set_boolean_property("firstRow", value)
 
+    def insert_gridCol(self, idx, width):
+        """Return a new `a:gridCol` element having *width*, inserted at *idx*.
+
+        An empty `a:tc` element is inserted at *idx* in each row to match.
+        *idx* can be the column count, to add the new column at the right.
+        """
+        tblGrid = self.tblGrid
+        gridCols = tblGrid.gridCol_lst
+        gridCol = tblGrid._new_gridCol()
+        gridCol.w = width
+        if idx < len(gridCols):
+            gridCols[idx].addprevious(gridCol)
+        else:
+            tblGrid._insert_gridCol(gridCol)
+
+        tc = CT_TableCell.new()
+        for tr in self.tr_lst:
+            new_tc = copy.deepcopy(tc)
+            if idx < len(gridCols):
+                tr[idx].addprevious(new_tc)
+            else:
+                tr._insert_tc(new_tc)
+        return gridCol
+
+    def insert_tr(self, idx, height):
+        """Return a new `a:tr` element having *height*, inserted at *idx*.
+
+        The new row has an empty `a:tc` element for each grid column. *idx*
+        can be the row count, to add the new row at the bottom.
+        """
+        tr = parse_xml(
+            '<a:tr %s h="%d">%s</a:tr>'
+            % (
+                nsdecls("a"),
+                height,
+                CT_TableCell._tc_tmpl(nsdecls_str="") * len(self.tblGrid.gridCol_lst),
+            )
+        )
+        tr_lst = self.tr_lst
+        if idx < len(tr_lst):
+            tr_lst[idx].addprevious(tr)
+        else:
+            self._insert_tr(tr)
+        return tr
+
+    def iter_col_tcs(self, col_idx):
+        """Generate the `a:tc` element at *col_idx* in each row, top-to-bottom."""
+        # ---tc elements come before any others in `a:tr` element---
+        return (tr[col_idx] for tr in self.tr_lst)
+
     def iter_tcs(self):
         """Generate each `a:tc` element in this tbl.
 
@@ -96,33 +150,49 @@ class CT_Table(BaseOxmlElement):
 
     @classmethod
     def new_tbl(cls, rows, cols, width, height, tableStyleId=None):
-        """Return a new ``<p:tbl>`` element tree."""
+        """Return a new ``<p:tbl>`` element tree.
+
+        The XML for the whole grid is generated as a single string and parsed
+        once, which is much faster for a large table than adding each row
+        and cell element in turn.
+        """
         # working hypothesis is this is the default table style GUID
         if tableStyleId is None:
             tableStyleId = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"
 
-        xml = cls._tbl_tmpl() % (tableStyleId)
-        tbl = parse_xml(xml)
+        # ---last row and col absorb any div error---
+        colwidth, rowheight = width // cols, height // rows
+        col_widths = [colwidth] * (cols - 1) + [width - (cols - 1) * colwidth]
+        row_heights = [rowheight] * (rows - 1) + [height - (rows - 1) * rowheight]
 
-        # add specified number of rows and columns
-        rowheight = height // rows
-        colwidth = width // cols
+        tcs_xml = CT_TableCell._tc_tmpl(nsdecls_str="") * cols
+        xml = cls._tbl_tmpl() % (
+            tableStyleId,
+            "".join('<a:gridCol w="%d"/>' % w for w in col_widths),
+            "".join('<a:tr h="%d">%s</a:tr>' % (h, tcs_xml) for h in row_heights),
+        )
+        return parse_xml(xml)
 
-        for col in range(cols):
-            # adjust width of last col to absorb any div error
-            if col == cols - 1:
-                colwidth = width - ((cols - 1) * colwidth)
-            tbl.tblGrid.add_gridCol(width=colwidth)
+    def remove_gridCol(self, idx):
+        """Remove the grid column at *idx* along with its cell in each row."""
+        for tc in list(self.iter_col_tcs(idx)):
+            tc.getparent().remove(tc)
+        self.tblGrid.remove(self.tblGrid.gridCol_lst[idx])
 
-        for row in range(rows):
-            # adjust height of last row to absorb any div error
-            if row == rows - 1:
-                rowheight = height - ((rows - 1) * rowheight)
-            tr = tbl.add_tr(height=rowheight)
-            for col in range(cols):
-                tr.add_tc()
+    def set_texts(self, text_rows, rPrs=()):
+        """Replace the text of the cells at the top left of this table.
 
-        return tbl
+        *text_rows* is a sequence of rows, each a sequence of str cell text.
+        The `a:rPr` element at a column's offset in *rPrs*, when present and
+        not |None|, is copied into each run added to a cell in that column.
+        Cells beyond the extent of *text_rows* are not changed.
+        """
+        rPrs = list(rPrs)
+        for tr, texts in zip(self.tr_lst, text_rows):
+            tcs = tr.tc_lst
+            for col_idx, text in enumerate(texts):
+                rPr = rPrs[col_idx] if col_idx < len(rPrs) else None
+                tcs[col_idx].set_text(text, rPr)
 
     def tc(self, row_idx, col_idx):
         """Return `a:tc` element at *row_idx*, *col_idx*."""
@@ -159,12 +229,13 @@ class CT_Table(BaseOxmlElement):
     @classmethod
     def _tbl_tmpl(cls):
         return (
-            "<a:tbl %s>\n"
-            '  <a:tblPr firstRow="1" bandRow="1">\n'
-            "    <a:tableStyleId>%s</a:tableStyleId>\n"
-            "  </a:tblPr>\n"
-            "  <a:tblGrid/>\n"
-            "</a:tbl>" % (nsdecls("a"), "%s")
+            "<a:tbl %s>"
+            '<a:tblPr firstRow="1" bandRow="1">'
+            "<a:tableStyleId>%s</a:tableStyleId>"
+            "</a:tblPr>"
+            "<a:tblGrid>%s</a:tblGrid>"
+            "%s"
+            "</a:tbl>" % (nsdecls("a"), "%s", "%s", "%s")
         )
 
 
@@ -309,6 +380,30 @@ class CT_TableCell(BaseOxmlElement):
         """Offset of this cell's row in its table."""
         return self.getparent().row_idx
 
+    def set_text(self, text, rPr=None):
+        """Replace the paragraphs of this cell with ones containing *text*.
+
+        Produces the same XML as assigning *text* to the cell's text frame,
+        with each line-feed starting a new paragraph and each vertical-tab
+        a line-break, but builds it directly. A copy of *rPr*, when not
+        |None|, becomes the run properties of each run.
+        """
+        txBody = self.get_or_add_txBody()
+        for p in txBody.findall(_p_tag):
+            txBody.remove(p)
+        for p_text in text.split("\n"):
+            p = etree.SubElement(txBody, _p_tag)
+            for idx, r_text in enumerate(p_text.split("\v")):
+                if idx > 0:
+                    etree.SubElement(p, _br_tag)
+                if not r_text:
+                    continue
+                r = etree.SubElement(p, _r_tag)
+                if rPr is not None:
+                    r.append(copy.deepcopy(rPr))
+                t = etree.SubElement(r, _t_tag)
+                t.text = CT_RegularTextRun._escape_ctrl_chars(r_text)
+
     @property
     def tbl(self):
         """Table element this cell belongs to."""
@@ -346,16 +441,22 @@ class CT_TableCell(BaseOxmlElement):
         setattr(tcPr, marX, value)
 
     @classmethod
-    def _tc_tmpl(cls):
+    def _tc_tmpl(cls, nsdecls_str=None):
+        """
+        Return the XML for a new `a:tc` element. Its namespace declarations
+        are omitted when *nsdecls_str* is "", for use within a table.
+        """
+        if nsdecls_str is None:
+            nsdecls_str = " %s" % nsdecls("a")
         return (
-            "<a:tc %s>\n"
-            "  <a:txBody>\n"
-            "    <a:bodyPr/>\n"
-            "    <a:lstStyle/>\n"
-            "    <a:p/>\n"
-            "  </a:txBody>\n"
-            "  <a:tcPr/>\n"
-            "</a:tc>" % nsdecls("a")
+            "<a:tc%s>"
+            "<a:txBody>"
+            "<a:bodyPr/>"
+            "<a:lstStyle/>"
+            "<a:p/>"
+            "</a:txBody>"
+            "<a:tcPr/>"
+            "</a:tc>" % nsdecls_str
         )
 
 
@@ -443,6 +544,12 @@ class CT_TableRow(BaseOxmlElement):
         return CT_TableCell.new()
 
 
+_br_tag = qn("a:br")
+_p_tag = qn("a:p")
+_r_tag = qn("a:r")
+_t_tag = qn("a:t")
+
+
 class TcRange(object):
     """A 2D block of `a:tc` cell elements in a table.
 
@@ -17,7 +17,7 @@ from pptx.enum.text import (
 from pptx.exc import InvalidXmlError
 from pptx.oxml import parse_xml
 from pptx.oxml.dml.fill import CT_GradientFillProperties
-from pptx.oxml.ns import nsdecls
+from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.simpletypes import (
     ST_Coordinate32,
     ST_TextFontScalePercentOrPercentString,
@@ -28,6 +28,7 @@ from pptx.oxml.simpletypes import (
     ST_TextTypeface,
     ST_TextWrappingType,
     XsdBoolean,
+    XsdString,
 )
 from pptx.oxml.xmlchemy import (
     BaseOxmlElement,
@@ -43,6 +44,26 @@ from pptx.oxml.xmlchemy import (
 from pptx.util import Emu, Length
 
 
+class CT_FontReference(BaseOxmlElement):
+    """
+    `a:fontRef` custom element class, in the style of a shape, naming the
+    theme font and specifying the color its text has by default.
+    """
+
+    eg_colorChoice = ZeroOrOneChoice(
+        (
+            Choice("a:scrgbClr"),
+            Choice("a:srgbClr"),
+            Choice("a:hslClr"),
+            Choice("a:sysClr"),
+            Choice("a:schemeClr"),
+            Choice("a:prstClr"),
+        ),
+        successors=(),
+    )
+    idx = RequiredAttribute("idx", XsdString)
+
+
 class CT_RegularTextRun(BaseOxmlElement):
     """`a:r` custom element class"""
 
@@ -81,6 +102,7 @@ class CT_TextBody(BaseOxmlElement):
     """
 
     bodyPr = OneAndOnlyOne("a:bodyPr")
+    lstStyle = ZeroOrOne("a:lstStyle", successors=("a:p",))
     p = OneOrMore("a:p")
 
     def clear_content(self):
@@ -363,6 +385,24 @@ class CT_TextLineBreak(BaseOxmlElement):
         return "\v"
 
 
+class CT_TextListStyle(BaseOxmlElement):
+    """
+    Custom element class for `a:lstStyle` and the other list style elements,
+    like `p:bodyStyle` in a slide master, each having the paragraph
+    properties for up to nine indentation levels in `a:lvl1pPr` through
+    `a:lvl9pPr`, after an optional `a:defPPr` default.
+    """
+
+    defPPr = ZeroOrOne("a:defPPr")
+
+    def lvl_pPr(self, level):
+        """
+        Return the `a:lvlNpPr` child holding the properties of paragraphs at
+        zero-based indentation *level*, or |None| if not present.
+        """
+        return self.find(qn("a:lvl%dpPr" % (level + 1)))
+
+
 class CT_TextNormalAutofit(BaseOxmlElement):
     """
     <a:normAutofit> element specifying fit text to shape font reduction, etc.
@@ -8,10 +8,12 @@ classes.
 from __future__ import absolute_import, print_function
 
 import re
+import threading
 
 from lxml import etree
 
-from . import oxml_parser
+from . import thread_parser
+from .. import instrumentation
 from ..compat import Unicode
 from ..exc import InvalidXmlError
 from .ns import NamespacePrefixedTag, _nsmap, qn
@@ -27,7 +29,7 @@ def OxmlElement(nsptag_str, nsmap=None):
     """
     nsptag = NamespacePrefixedTag(nsptag_str)
     nsmap = nsmap if nsmap is not None else nsptag.nsmap
-    return oxml_parser.makeelement(nsptag.clark_name, nsmap=nsmap)
+    return thread_parser.parser.makeelement(nsptag.clark_name, nsmap=nsmap)
 
 
 def serialize_for_reading(element):
@@ -102,6 +104,31 @@ class XmlString(Unicode):
         return front, attrs, close, text
 
 
+# ---compiled XPath objects keyed by expression string, see _compiled_xpath()---
+_xpath_cache = {}
+_xpath_cache_lock = threading.Lock()
+_XPATH_CACHE_MAX = 1024
+
+
+def _compiled_xpath(xpath_str):
+    """
+    Return the compiled `etree.XPath` object for *xpath_str*, using the
+    standard Open XML namespace mapping. Each expression is compiled only
+    once; the cache is emptied if it ever grows beyond a fixed size, which
+    can only happen when expressions are built by string formatting. Safe
+    to call from more than one thread at once; the cache is changed only
+    while holding a lock.
+    """
+    try:
+        return _xpath_cache[xpath_str]
+    except KeyError:
+        xpath = etree.XPath(xpath_str, namespaces=_nsmap)
+        with _xpath_cache_lock:
+            if len(_xpath_cache) >= _XPATH_CACHE_MAX:
+                _xpath_cache.clear()
+            return _xpath_cache.setdefault(xpath_str, xpath)
+
+
 class MetaOxmlElement(type):
     """
     Metaclass for BaseOxmlElement
@@ -132,6 +159,10 @@ class BaseAttribute(object):
         super(BaseAttribute, self).__init__()
         self._attr_name = attr_name
         self._simple_type = simple_type
+        # ---computed once here rather than on each access---
+        self._clark_name = qn(attr_name) if ":" in attr_name else attr_name
+        self._from_xml = simple_type.from_xml
+        self._to_xml = simple_type.to_xml
 
     def populate_class_members(self, element_cls, prop_name):
         """
@@ -152,12 +183,6 @@ class BaseAttribute(object):
         # assign unconditionally to overwrite element name definition
         setattr(self._element_cls, self._prop_name, property_)
 
-    @property
-    def _clark_name(self):
-        if ":" in self._attr_name:
-            return qn(self._attr_name)
-        return self._attr_name
-
 
 class OptionalAttribute(BaseAttribute):
     """
@@ -189,12 +214,14 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name, default = self._clark_name, self._default
+        from_xml = self._from_xml
 
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
-                return self._default
-            return self._simple_type.from_xml(attr_str_value)
+                return default
+            return from_xml(attr_str_value)
 
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
@@ -205,14 +232,14 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "set" side of the attribute
         property descriptor.
         """
+        clark_name, default, to_xml = self._clark_name, self._default, self._to_xml
 
         def set_attr_value(obj, value):
-            if value == self._default:
-                if self._clark_name in obj.attrib:
-                    del obj.attrib[self._clark_name]
+            if value == default:
+                if clark_name in obj.attrib:
+                    del obj.attrib[clark_name]
                 return
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            obj.set(clark_name, to_xml(value))
 
         return set_attr_value
 
@@ -233,15 +260,17 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        attr_name, clark_name = self._attr_name, self._clark_name
+        from_xml = self._from_xml
 
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 raise InvalidXmlError(
                     "required '%s' attribute not present on element %s"
-                    % (self._attr_name, obj.tag)
+                    % (attr_name, obj.tag)
                 )
-            return self._simple_type.from_xml(attr_str_value)
+            return from_xml(attr_str_value)
 
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
@@ -263,10 +292,10 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "set" side of the attribute
         property descriptor.
         """
+        clark_name, to_xml = self._clark_name, self._to_xml
 
         def set_attr_value(obj, value):
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            obj.set(clark_name, to_xml(value))
 
         return set_attr_value
 
@@ -296,12 +325,15 @@ class _BaseChildElement(object):
         element.
         """
 
+        new_method_name = self._new_method_name
+        insert_method_name = self._insert_method_name
+
         def _add_child(obj, **attrs):
-            new_method = getattr(obj, self._new_method_name)
+            new_method = getattr(obj, new_method_name)
             child = new_method()
             for key, value in attrs.items():
                 setattr(child, key, value)
-            insert_method = getattr(obj, self._insert_method_name)
+            insert_method = getattr(obj, insert_method_name)
             insert_method(child)
             return child
 
@@ -338,8 +370,10 @@ class _BaseChildElement(object):
         element.
         """
 
+        successors = self._successors
+
         def _insert_child(obj, child):
-            obj.insert_element_before(child, *self._successors)
+            obj.insert_element_before(child, *successors)
             return child
 
         _insert_child.__doc__ = (
@@ -390,8 +424,10 @@ class _BaseChildElement(object):
         matching tag name or |None| if not present.
         """
 
+        tagname = qn(self._nsptagname)
+
         def get_child_element(obj):
-            return obj.find(qn(self._nsptagname))
+            return obj.find(tagname)
 
         get_child_element.__doc__ = (
             "``<%s>`` child element or |None| if not present." % self._nsptagname
@@ -409,8 +445,10 @@ class _BaseChildElement(object):
         property descriptor.
         """
 
+        tagname = qn(self._nsptagname)
+
         def get_child_element_list(obj):
-            return obj.findall(qn(self._nsptagname))
+            return obj.findall(tagname)
 
         get_child_element_list.__doc__ = (
             "A list containing each of the ``<%s>`` child elements, in the o"
@@ -514,8 +552,10 @@ class OneAndOnlyOne(_BaseChildElement):
         descriptor.
         """
 
+        tagname = qn(self._nsptagname)
+
         def get_child_element(obj):
-            child = obj.find(qn(self._nsptagname))
+            child = obj.find(tagname)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" % self._nsptagname
@@ -758,6 +798,19 @@ class _OxmlElementBase(etree.ElementBase):
             self.append(elm)
         return elm
 
+    def remap_rIds(self, rId_map):
+        """
+        Replace each relationship id in this element and its descendants,
+        such as the value of an `r:id` or `r:embed` attribute, that appears
+        as a key in *rId_map* with the rId it maps to. Used to re-point
+        a copied XML subtree at the relationships of a different part.
+        """
+        r_ns = "{%s}" % _nsmap["r"]
+        for element in self.iter(etree.Element):
+            for name, value in element.attrib.items():
+                if name.startswith(r_ns) and value in rId_map:
+                    element.set(name, rId_map[value])
+
     def remove_all(self, tagname):
         """
         Remove all child elements having *tagname*.
@@ -784,12 +837,18 @@ class _OxmlElementBase(etree.ElementBase):
         """
         return serialize_for_reading(self)
 
-    def xpath(self, xpath_str):
+    def xpath(self, xpath_str, **variables):
         """
         Override of ``lxml`` _Element.xpath() method to provide standard Open
-        XML namespace mapping in centralized location.
-        """
-        return super(BaseOxmlElement, self).xpath(xpath_str, namespaces=_nsmap)
+        XML namespace mapping in centralized location. The expression is
+        compiled once per process and reused on subsequent calls. Keyword
+        arguments provide the values of XPath variables, e.g.
+        ``ser.xpath("c:dPt[c:idx[@val=$idx]]", idx=3)``; use variables rather
+        than string formatting so the compiled expression can be reused.
+        """
+        if instrumentation.enabled:
+            instrumentation.count("xpath")
+        return _compiled_xpath(xpath_str)(self, **variables)
 
 
 BaseOxmlElement = MetaOxmlElement(
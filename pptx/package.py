@@ -10,6 +10,8 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from .opc.constants import RELATIONSHIP_TYPE as RT
 from .opc.package import OpcPackage
 from .opc.packuri import PackURI
+from .opc.pkgreader import _SerializedRelationshipCollection
+from .oxml import parse_xml
 from .parts.coreprops import CorePropertiesPart
 from .parts.image import Image, ImagePart
 from .parts.media import MediaPart
@@ -26,6 +28,29 @@ class Package(OpcPackage):
     loaded.
     """
 
+    _is_partial = False
+
+    @classmethod
+    def open(cls, pkg_file, workers=None, slides=None):
+        """
+        Return a |Package| instance loaded with the contents of *pkg_file*.
+        When *slides* is not |None|, only the slides it selects are loaded,
+        along with the parts they depend on and the rest of the presentation
+        other than slides. *slides* is either a sequence of zero-based slide
+        indices or a callable taking such an index and returning |True| for
+        each slide to be loaded. The other slides, and the parts only they
+        refer to, are kept unparsed and saved unchanged.
+        """
+        if slides is None:
+            return super(Package, cls).open(pkg_file, workers)
+
+        def prune(phys_reader, pkg_srels):
+            return _unselected_slide_partnames(phys_reader, pkg_srels, slides)
+
+        package = super(Package, cls).open(pkg_file, workers, prune)
+        package._is_partial = True
+        return package
+
     @lazyproperty
     def core_properties(self):
         """
@@ -40,6 +65,14 @@ class Package(OpcPackage):
             self.relate_to(core_props, RT.CORE_PROPERTIES)
             return core_props
 
+    @property
+    def is_partial(self):
+        """
+        |True| if this package was opened with only some of its slides
+        loaded.
+        """
+        return self._is_partial
+
     def get_or_add_image_part(self, image_file):
         """
         Return an |ImagePart| object containing the image in *image_file*. If
@@ -66,10 +99,10 @@ class Package(OpcPackage):
         def first_available_image_idx():
             image_idxs = sorted(
                 [
-                    part.partname.idx
-                    for part in self.iter_parts()
-                    if part.partname.startswith("/ppt/media/image")
-                    and part.partname.idx is not None
+                    partname.idx
+                    for partname in self.iter_partnames()
+                    if partname.startswith("/ppt/media/image")
+                    and partname.idx is not None
                 ]
             )
             for i, image_idx in enumerate(image_idxs):
@@ -92,9 +125,9 @@ class Package(OpcPackage):
         def first_available_media_idx():
             media_idxs = sorted(
                 [
-                    part.partname.idx
-                    for part in self.iter_parts()
-                    if part.partname.startswith("/ppt/media/media")
+                    partname.idx
+                    for partname in self.iter_partnames()
+                    if partname.startswith("/ppt/media/media")
                 ]
             )
             for i, media_idx in enumerate(media_idxs):
@@ -131,6 +164,36 @@ class Package(OpcPackage):
         return _MediaParts(self)
 
 
+def _unselected_slide_partnames(phys_reader, pkg_srels, slides):
+    """
+    Return the set of partnames of the slides in the package in
+    *phys_reader* not selected by *slides*, found by reading only the
+    presentation part and its relationships.
+    """
+    prs_partname = next(
+        srel.target_partname for srel in pkg_srels if srel.reltype == RT.OFFICE_DOCUMENT
+    )
+    prs_srels = _SerializedRelationshipCollection.load_from_xml(
+        prs_partname.baseURI, phys_reader.rels_xml_for(prs_partname)
+    )
+    target_partnames = dict((srel.rId, srel.target_partname) for srel in prs_srels)
+    sldIdLst = parse_xml(phys_reader.blob_for(prs_partname)).sldIdLst
+    slide_partnames = (
+        [] if sldIdLst is None else [target_partnames[s.rId] for s in sldIdLst]
+    )
+
+    if callable(slides):
+        selected = set(
+            partname for idx, partname in enumerate(slide_partnames) if slides(idx)
+        )
+    else:
+        try:
+            selected = set(slide_partnames[idx] for idx in slides)
+        except IndexError:
+            raise IndexError("slide index out of range")
+    return set(slide_partnames) - selected
+
+
 class _ImageParts(object):
     """Provides access to the image parts in a package."""
 
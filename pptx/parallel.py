@@ -0,0 +1,106 @@
+# encoding: utf-8
+
+"""
+Multi-process generation of a presentation from a template.
+
+Building slides is CPU-bound Python work, so :func:`build` spreads it across
+worker processes. Each worker builds a contiguous run of the slides in its
+own copy of the template and returns that copy serialized. The parent then
+imports the new slides of each copy, in order, into a single presentation.
+Because every copy shares the template's masters and layouts, these are
+matched rather than duplicated, and an image or media file used by slides
+from more than one worker is stored only once.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import multiprocessing
+
+from .api import Presentation
+from .compat import BytesIO
+
+
+def build(template, slide_specs, builder, workers=None):
+    """
+    Return a new |Presentation| object based on *template* having one or more
+    slides added for each item in *slide_specs*, in order.
+
+    *template* is a path to a .pptx file (a string), a file-like object, or
+    |None| for the built-in default template. The slides are added by
+    calling `builder(prs, spec)` for each *spec*, where *prs* is
+    a |Presentation| object loaded from *template*. *builder* must be
+    a module-level function and each *spec* must be picklable, since both are
+    sent to the worker processes. The template's own slides, if any, come
+    first in the result and should not be changed by *builder*.
+
+    *workers* is the number of worker processes, defaulting to the number of
+    CPUs. The slides are built in the calling process when *workers* is 1.
+    """
+    prs = Presentation(template)
+    template_slide_count = len(prs.slides)
+    template_blob = _serialize(prs)
+
+    slide_specs = list(slide_specs)
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    chunks = [
+        (template_blob, builder, specs)
+        for specs in _partition(slide_specs, max(workers, 1))
+    ]
+
+    if workers <= 1 or len(chunks) <= 1:
+        blobs = map(_build_chunk, chunks)
+        _merge(prs, blobs, template_slide_count)
+        return prs
+
+    pool = multiprocessing.Pool(min(workers, len(chunks)))
+    try:
+        _merge(prs, pool.imap(_build_chunk, chunks), template_slide_count)
+    finally:
+        pool.close()
+        pool.join()
+    return prs
+
+
+def _build_chunk(chunk):
+    """
+    Return the blob of the template in *chunk* after adding the slides for
+    each of its slide specs using its builder. Runs in a worker process.
+    """
+    template_blob, builder, slide_specs = chunk
+    prs = Presentation(BytesIO(template_blob))
+    for spec in slide_specs:
+        builder(prs, spec)
+    return _serialize(prs)
+
+
+def _merge(prs, blobs, template_slide_count):
+    """
+    Append to *prs* the slides following the first *template_slide_count* in
+    each presentation in *blobs*, in order.
+    """
+    for blob in blobs:
+        other_prs = Presentation(BytesIO(blob))
+        other_slides = list(other_prs.slides)[template_slide_count:]
+        prs.import_slides(other_prs, other_slides)
+
+
+def _partition(items, count):
+    """
+    Return a list of at most *count* non-empty contiguous runs of *items*,
+    as equal in length as possible.
+    """
+    count = min(count, len(items))
+    if count == 0:
+        return []
+    bounds = [idx * len(items) // count for idx in range(count + 1)]
+    return [items[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def _serialize(prs):
+    """
+    Return the .pptx package of *prs* as bytes.
+    """
+    stream = BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
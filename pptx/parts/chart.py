@@ -6,7 +6,10 @@ Chart part objects, including Chart and Charts
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from .. import instrumentation
 from ..chart.chart import Chart
+from ..chart.xlsx import WorksheetCellUpdater
+from .clone import RelationshipCloner
 from .embeddedpackage import EmbeddedXlsxPart
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
@@ -27,12 +30,41 @@ class ChartPart(XmlPart):
         Return a new |ChartPart| instance added to *package* containing
         a chart of *chart_type* and depicting *chart_data*.
         """
-        chart_blob = chart_data.xml_bytes(chart_type)
+        with instrumentation.span("ChartPart.new"):
+            chart_blob = chart_data.xml_bytes(chart_type)
+            partname = package.next_partname(cls.partname_template)
+            content_type = CT.DML_CHART
+            chart_part = cls.load(partname, content_type, chart_blob, package)
+            xlsx_blob = chart_data.xlsx_blob
+            chart_part.chart_workbook.update_from_xlsx_blob(xlsx_blob)
+        return chart_part
+
+    @classmethod
+    def new_from_prototype(cls, prototype, chart_data, package):
+        """
+        Return a new |ChartPart| instance added to *package* containing
+        a copy of the chart in |ChartPrototype| *prototype* depicting
+        *chart_data*. Only the series of the copied chart XML are rewritten.
+        Parts the prototype depends on, such as its chart style, are shared
+        when in *package* and otherwise copied into it for each new chart.
+        """
+        chartSpace = prototype.new_chartSpace(chart_data)
         partname = package.next_partname(cls.partname_template)
-        content_type = CT.DML_CHART
-        chart_part = cls.load(partname, content_type, chart_blob, package)
-        xlsx_blob = chart_data.xlsx_blob
-        chart_part.chart_workbook.update_from_xlsx_blob(xlsx_blob)
+        chart_part = cls(partname, CT.DML_CHART, chartSpace, package)
+        cloner = RelationshipCloner(chart_part)
+        rId_map = {}
+        for rel in prototype.rels:
+            if rel.is_external:
+                target = rel.target_ref
+            elif rel.target_part.package is package:
+                target = rel.target_part
+            else:
+                target = cloner.copy_parts([rel.target_part])[0]
+            rId_map[rel.rId] = chart_part.relate_to(
+                target, rel.reltype, rel.is_external
+            )
+        chartSpace.remap_rIds(rId_map)
+        chart_part.chart_workbook.update_from_xlsx_blob(chart_data.xlsx_blob)
         return chart_part
 
     @lazyproperty
@@ -74,6 +106,25 @@ class ChartWorkbook(object):
             return
         xlsx_part.blob = xlsx_blob
 
+    def update_values(self, range_ref, values):
+        """
+        Change the values of selected cells in the single-column worksheet
+        range *range_ref*, e.g. "Sheet1!$B$2:$B$9". *values* maps the
+        zero-based offset of a cell within the range to its new value. The
+        rest of the workbook is left unchanged. Does nothing when there is no
+        embedded workbook.
+        """
+        xlsx_part = self.xlsx_part
+        if xlsx_part is None:
+            return
+        sheet_name, column, top_row = WorksheetCellUpdater.range_origin(range_ref)
+        cell_values = dict(
+            ("%s%d" % (column, top_row + offset), value)
+            for offset, value in values.items()
+        )
+        updater = WorksheetCellUpdater(xlsx_part.blob)
+        xlsx_part.blob = updater.update(sheet_name, cell_values)
+
     @property
     def xlsx_part(self):
         """
@@ -0,0 +1,370 @@
+# encoding: utf-8
+
+"""
+Re-creating the relationships that copied XML depends on, in another part.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import copy
+import hashlib
+import re
+
+from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from ..opc.package import XmlPart
+from ..opc.packuri import PackURI
+from ..util import lazyproperty
+from .image import ImagePart
+from .media import MediaPart
+
+
+class RelationshipCloner(object):
+    """
+    Relates *part* to the parts and external targets that an XML subtree
+    copied from another part refers to by relationship id, remapping the ids
+    in the copy to match.
+
+    How each target is related depends on its kind:
+
+    * Image and media parts are de-duplicated by SHA1 hash against those
+      already in the package of *part*, which works equally well when the
+      source is in another package.
+    * Slide, layout, master, and notes parts are related directly when in the
+      same package. A slide layout or master in another package is replaced
+      by an identical one already present, determined by content hash, and
+      is otherwise copied along with the rest of its master's layouts and
+      theme. A notes slide in another package is copied, a notes master is
+      replaced by the one in this package, and a reference to any other
+      slide is cleared unless that slide has been copied by this cloner.
+    * Every other part, such as a chart, its embedded workbook, or an OLE
+      object, is copied along with each part it depends on in turn, so the
+      copy can be edited independently of the original.
+    * External relationships, like hyperlinks, are re-created as-is.
+
+    A single cloner can be used for any number of copied subtrees; the
+    de-duplication indexes and partname allocation are computed once and
+    shared, and a part referred to from more than one subtree is copied only
+    once.
+    """
+
+    def __init__(self, part):
+        super(RelationshipCloner, self).__init__()
+        self._part = part
+        self._package = part.package
+        self._copies = {}
+        self._copy_order = []
+        self._partname_cursors = {}
+        self._source_digests = {}
+
+    def clone_rels(self, element, source_part):
+        """
+        Relate the part of this cloner to each target referred to in
+        *element*, a copy of XML from *source_part*, and rewrite the
+        relationship ids in *element* to match. An id having no matching
+        relationship in *source_part* is left unchanged.
+        """
+        source_rels = source_part.rels
+        rId_map = {}
+        for rId in set(element.xpath("descendant-or-self::*/@r:*")):
+            rel = source_rels.get(rId)
+            if rel is None:
+                continue
+            if rel.is_external:
+                rId_map[rId] = self._part.relate_to(rel.target_ref, rel.reltype, True)
+                continue
+            target_part = self._target_for(rel.target_part)
+            rId_map[rId] = (
+                ""
+                if target_part is None
+                else self._part.relate_to(target_part, rel.reltype)
+            )
+        element.remap_rIds(rId_map)
+
+    def copy_parts(self, parts):
+        """
+        Return a list containing a copy of each part in *parts*, added to the
+        package of this cloner along with whatever each depends on, as for
+        a part referred to from copied XML. A relationship between two parts
+        in *parts*, like a hyperlink from one slide to another, is to the
+        copy of its target.
+        """
+        part_copies = [self._add_copy(part) for part in parts]
+        for part_copy, part in zip(part_copies, parts):
+            self._relate_copy(part_copy, part)
+        return part_copies
+
+    @property
+    def copies(self):
+        """
+        List of the parts added to the package of this cloner as copies, in
+        the order they were added. Image and media parts added in lieu of
+        a duplicate are not included.
+        """
+        return list(self._copy_order)
+
+    def _add_copy(self, part):
+        """
+        Return a copy of *part* added to the package of this cloner, without
+        relationships to the parts it depends on.
+        """
+        partname = self._next_partname(part.partname)
+        if isinstance(part, XmlPart):
+            element = copy.deepcopy(part._element)
+            part_copy = type(part)(partname, part.content_type, element, self._package)
+        else:
+            part_copy = type(part).load(
+                partname, part.content_type, part.blob, self._package
+            )
+        self._copies[part] = part_copy
+        self._copy_order.append(part_copy)
+        return part_copy
+
+    def _copy_of(self, part):
+        """
+        Return a copy of *part* added to the package of this cloner, along
+        with copies of, or relationships to, each part it depends on. Only
+        one copy of a part is made.
+        """
+        part_copy = self._copies.get(part)
+        if part_copy is None:
+            part_copy = self._add_copy(part)
+            self._relate_copy(part_copy, part)
+        return part_copy
+
+    @lazyproperty
+    def _equivalent_parts(self):
+        """
+        dict mapping a digest of content to each slide master and slide
+        layout in the package of this cloner. See :func:`_slide_master_digests`.
+        """
+        presentation_part = self._package.presentation_part
+        equivalent_parts = {}
+        for rel in presentation_part.rels.values():
+            if rel.reltype != RT.SLIDE_MASTER:
+                continue
+            for part, digest in _slide_master_digests(rel.target_part).items():
+                equivalent_parts.setdefault(digest, part)
+        return equivalent_parts
+
+    @lazyproperty
+    def _image_parts_by_sha1(self):
+        """
+        dict mapping SHA1 hash to each image part in the package of this
+        cloner. Unknown image types, like SVG, are skipped.
+        """
+        return dict(
+            (image_part.sha1, image_part)
+            for image_part in self._package._image_parts
+            if hasattr(image_part, "sha1")
+        )
+
+    def _image_part_like(self, image_part):
+        """
+        Return an image part in the package of this cloner containing the
+        same image as *image_part*, newly added if there is none.
+        """
+        sha1 = image_part.sha1
+        existing = self._image_parts_by_sha1.get(sha1)
+        if existing is not None:
+            return existing
+        new_part = ImagePart(
+            self._next_partname("/ppt/media/image1.%s" % image_part.partname.ext),
+            image_part.content_type,
+            image_part.blob,
+            self._package,
+            image_part._filename,
+        )
+        self._image_parts_by_sha1[sha1] = new_part
+        return new_part
+
+    @lazyproperty
+    def _media_parts_by_sha1(self):
+        """
+        dict mapping SHA1 hash to each media part in the package of this
+        cloner.
+        """
+        return dict(
+            (media_part.sha1, media_part) for media_part in self._package._media_parts
+        )
+
+    def _media_part_like(self, media_part):
+        """
+        Return a media part in the package of this cloner containing the same
+        media as *media_part*, newly added if there is none.
+        """
+        sha1 = media_part.sha1
+        existing = self._media_parts_by_sha1.get(sha1)
+        if existing is not None:
+            return existing
+        new_part = MediaPart(
+            self._next_partname("/ppt/media/media1.%s" % media_part.partname.ext),
+            media_part.content_type,
+            media_part.blob,
+            self._package,
+        )
+        self._media_parts_by_sha1[sha1] = new_part
+        return new_part
+
+    def _next_partname(self, partname):
+        """
+        Return a |PackURI| for an available partname in the package of this
+        cloner of the same form as *partname*, e.g. '/ppt/charts/chart7.xml'
+        for '/ppt/charts/chart3.xml'. The index is unique across extensions
+        and fills gaps in the numbering, like |OpcPackage.next_partname|.
+        """
+        stem, _, ext = _split_partname(partname)
+        used_idxs = self._used_partname_idxs.setdefault(stem, set())
+        idx = self._partname_cursors.get(stem, 1)
+        while idx in used_idxs:
+            idx += 1
+        used_idxs.add(idx)
+        self._partname_cursors[stem] = idx + 1
+        return PackURI("%s%d%s" % (stem, idx, ext))
+
+    def _relate_copy(self, part_copy, part):
+        """
+        Add a relationship from *part_copy* to a suitable target for each
+        relationship of *part*, keeping the rId so the XML of the copy needs
+        no change. An rId having no suitable target is cleared in the XML of
+        *part_copy*.
+        """
+        cleared_rIds = {}
+        for rel in part.rels.values():
+            if rel.is_external:
+                target = rel.target_ref
+            else:
+                target = self._target_for(rel.target_part)
+                if target is None:
+                    cleared_rIds[rel.rId] = ""
+                    continue
+            part_copy.rels.add_relationship(
+                rel.reltype, target, rel.rId, rel.is_external
+            )
+        if cleared_rIds and isinstance(part_copy, XmlPart):
+            part_copy._element.remap_rIds(cleared_rIds)
+
+    def _source_digest(self, part):
+        """
+        Return the content digest of *part*, a slide master or layout in
+        another package. The digests of a master and all its layouts are
+        computed together, once.
+        """
+        digest = self._source_digests.get(part)
+        if digest is None:
+            master_part = (
+                part
+                if part.content_type == CT.PML_SLIDE_MASTER
+                else part.part_related_by(RT.SLIDE_MASTER)
+            )
+            self._source_digests.update(_slide_master_digests(master_part))
+            digest = self._source_digests[part]
+        return digest
+
+    def _target_for(self, part):
+        """
+        Return the part the part of this cloner should be related to in place
+        of *part*, or |None| if there is no suitable part.
+        """
+        if isinstance(part, ImagePart):
+            return self._image_part_like(part)
+        if isinstance(part, MediaPart):
+            return self._media_part_like(part)
+        if part in self._copies:
+            return self._copies[part]
+
+        content_type = part.content_type
+        if part.package is self._package:
+            if content_type in _SLIDE_CONTENT_TYPES:
+                return part
+            return self._copy_of(part)
+
+        # ---part is in another package---
+        if content_type in (CT.PML_SLIDE_LAYOUT, CT.PML_SLIDE_MASTER):
+            equivalent = self._equivalent_parts.get(self._source_digest(part))
+            return self._copy_of(part) if equivalent is None else equivalent
+        if content_type == CT.PML_NOTES_MASTER:
+            return self._package.presentation_part.notes_master_part
+        if content_type == CT.PML_NOTES_SLIDE:
+            return self._copy_of(part)
+        if content_type in _SLIDE_CONTENT_TYPES:
+            return None
+        return self._copy_of(part)
+
+    @lazyproperty
+    def _used_partname_idxs(self):
+        """
+        dict mapping each partname stem in the package of this cloner, e.g.
+        '/ppt/charts/chart', to the set of indices in use for that stem.
+        """
+        used_partname_idxs = {}
+        for partname in self._package.iter_partnames():
+            stem, idx, _ = _split_partname(partname)
+            if idx is not None:
+                used_partname_idxs.setdefault(stem, set()).add(idx)
+        return used_partname_idxs
+
+
+def _slide_master_digests(master_part):
+    """
+    Return a dict mapping *master_part* and each of its slide layouts to
+    a digest of their content. The master's digest covers every part
+    reachable from it, such as its layouts, theme, and images, so equal
+    digests mean two masters can be used interchangeably. A layout's digest
+    combines that of its master with its own.
+    """
+    closure_sha1 = hashlib.sha1()
+    layout_parts = []
+    visited = set([master_part])
+    queue = [master_part]
+    for part in queue:
+        closure_sha1.update(part.blob)
+        for rId in sorted(part.rels):
+            rel = part.rels[rId]
+            closure_sha1.update(rel.reltype.encode("utf-8"))
+            if rel.is_external:
+                closure_sha1.update(rel.target_ref.encode("utf-8"))
+                continue
+            target_part = rel.target_part
+            if target_part in visited:
+                continue
+            visited.add(target_part)
+            queue.append(target_part)
+            if target_part.content_type == CT.PML_SLIDE_LAYOUT:
+                layout_parts.append(target_part)
+
+    master_digest = closure_sha1.hexdigest()
+    digests = {master_part: master_digest}
+    for layout_part in layout_parts:
+        layout_sha1 = hashlib.sha1(master_digest.encode("utf-8"))
+        layout_sha1.update(layout_part.blob)
+        digests[layout_part] = layout_sha1.hexdigest()
+    return digests
+
+
+# ---parts related to directly rather than copied within their own package---
+_SLIDE_CONTENT_TYPES = frozenset(
+    (
+        CT.PML_HANDOUT_MASTER,
+        CT.PML_NOTES_MASTER,
+        CT.PML_NOTES_SLIDE,
+        CT.PML_PRESENTATION_MAIN,
+        CT.PML_PRES_MACRO_MAIN,
+        CT.PML_SLIDE,
+        CT.PML_SLIDESHOW_MAIN,
+        CT.PML_SLIDE_LAYOUT,
+        CT.PML_SLIDE_MASTER,
+        CT.PML_TEMPLATE_MAIN,
+    )
+)
+
+_partname_re = re.compile(r"(.*?)(\d*)(\.[^./]*)?$")
+
+
+def _split_partname(partname):
+    """
+    Return a (stem, idx, ext) 3-tuple for *partname*, e.g. ('/ppt/charts/
+    chart', 3, '.xml') for '/ppt/charts/chart3.xml'. *idx* is |None| when
+    *partname* has no index and *ext* is '' when it has no extension.
+    """
+    stem, idx, ext = _partname_re.match(partname).groups()
+    return stem, int(idx) if idx else None, ext or ""
@@ -10,7 +10,8 @@ from ..opc.constants import RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
 from ..opc.packuri import PackURI
 from ..presentation import Presentation
-from .slide import NotesMasterPart, SlidePart
+from .clone import RelationshipCloner
+from .slide import NotesMasterPart, SlideMasterPart, SlidePart
 from ..util import lazyproperty
 
 
@@ -45,10 +46,35 @@ class PresentationPart(XmlPart):
         presentation), or |None| if not found.
         """
         for sldId in self._element.sldIdLst:
-            if sldId.id == slide_id:
+            if sldId.id == slide_id and self.is_loaded_slide(sldId.rId):
                 return self.related_parts[sldId.rId].slide
         return None
 
+    def import_slides(self, slide_parts):
+        """
+        Return a list of the |Slide| objects for copies of *slide_parts*,
+        each from another package, appended to the slides of this
+        presentation. Slide layouts and masters are matched to identical
+        ones already in this presentation and copied only when there are
+        none; images and media are likewise de-duplicated by content.
+        """
+        cloner = RelationshipCloner(self)
+        new_slide_parts = cloner.copy_parts(slide_parts)
+        self._add_slide_master_parts(
+            [part for part in cloner.copies if isinstance(part, SlideMasterPart)]
+        )
+        rIds = self.rels.add_relationships(RT.SLIDE, new_slide_parts)
+        self._element.get_or_add_sldIdLst().add_sldIds(rIds)
+        return [slide_part.slide for slide_part in new_slide_parts]
+
+    def is_loaded_slide(self, rId):
+        """
+        |True| if the slide related by *rId* was loaded. A slide is not
+        loaded only when the presentation was opened with some of its slides
+        selected.
+        """
+        return isinstance(self.related_parts[rId], SlidePart)
+
     @lazyproperty
     def notes_master(self):
         """
@@ -103,9 +129,14 @@ class PresentationPart(XmlPart):
         that sequence. The name portion is always ``slide``. The number part
         forms a continuous sequence starting at 1 (e.g. 1, 2, ... 10, ...).
         The extension is always ``.xml``.
+
+        Nothing is renamed when a slide was not loaded, since the items kept
+        unparsed with it may refer to its partname.
         """
-        for idx, rId in enumerate(rIds):
-            slide_part = self.related_parts[rId]
+        slide_parts = [self.related_parts[rId] for rId in rIds]
+        if not all(isinstance(part, SlidePart) for part in slide_parts):
+            return
+        for idx, slide_part in enumerate(slide_parts):
             slide_part.partname = PackURI("/ppt/slides/slide%d.xml" % (idx + 1))
 
     def save(self, path_or_stream):
@@ -126,6 +157,35 @@ class PresentationPart(XmlPart):
                 return sldId.id
         raise ValueError("matching slide_part not found")
 
+    def _add_slide_master_parts(self, slide_master_parts):
+        """
+        Add each of *slide_master_parts*, newly copied from another package,
+        to the slide masters of this presentation. Each master, and each
+        layout it lists, is given an id unique among them in this
+        presentation.
+        """
+        if not slide_master_parts:
+            return
+        sldMasterIdLst = self._element.get_or_add_sldMasterIdLst()
+        existing_ids = [sldMasterId.id for sldMasterId in sldMasterIdLst]
+        for sldMasterId in sldMasterIdLst:
+            master_part = self.related_parts[sldMasterId.rId]
+            sldLayoutIdLst = master_part._element.sldLayoutIdLst
+            if sldLayoutIdLst is not None:
+                existing_ids.extend(sldLayoutId.id for sldLayoutId in sldLayoutIdLst)
+        next_id = max([2147483647] + [id_ for id_ in existing_ids if id_]) + 1
+
+        rIds = self.rels.add_relationships(RT.SLIDE_MASTER, slide_master_parts)
+        for rId, master_part in zip(rIds, slide_master_parts):
+            sldMasterIdLst._add_sldMasterId(id=next_id, rId=rId)
+            next_id += 1
+            sldLayoutIdLst = master_part._element.sldLayoutIdLst
+            if sldLayoutIdLst is None:
+                continue
+            for sldLayoutId in sldLayoutIdLst:
+                sldLayoutId.id = next_id
+                next_id += 1
+
     @property
     def _next_slide_partname(self):
         """
@@ -133,6 +193,10 @@ class PresentationPart(XmlPart):
         appended to this slide collection, e.g. ``/ppt/slides/slide9.xml``
         for a slide collection containing 8 slides.
         """
+        if self.package.is_partial:
+            # ---slide parts are not renamed when some slides were not loaded,
+            # ---so their numbering can have gaps
+            return self.package.next_partname("/ppt/slides/slide%d.xml")
         sldIdLst = self._element.get_or_add_sldIdLst()
         partname_str = "/ppt/slides/slide%d.xml" % (len(sldIdLst) + 1)
         return PackURI(partname_str)
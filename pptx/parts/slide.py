@@ -7,9 +7,12 @@ Slide and related objects.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from .chart import ChartPart
+from ..dml.color import ThemeColors
 from ..opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
 from ..opc.packuri import PackURI
+from ..oxml import parse_xml
+from ..oxml.ns import qn
 from ..oxml.slide import CT_NotesMaster, CT_NotesSlide, CT_Slide
 from ..oxml.theme import CT_OfficeStyleSheet
 from ..slide import NotesMaster, NotesSlide, Slide, SlideLayout, SlideMaster
@@ -42,6 +45,14 @@ class BaseSlidePart(XmlPart):
         rId = self.relate_to(image_part, RT.IMAGE)
         return image_part, rId
 
+    @property
+    def master_part(self):
+        """
+        The slide master or notes master part this part inherits from, this
+        part itself when it is a master.
+        """
+        raise NotImplementedError("Must be implemented by all subclasses.")
+
     @property
     def name(self):
         """
@@ -49,6 +60,52 @@ class BaseSlidePart(XmlPart):
         """
         return self._element.cSld.name
 
+    @lazyproperty
+    def style_cache(self):
+        """
+        dict memoizing values resolved through the style hierarchy rooted at
+        this part, a slide or notes master, like the text properties
+        a placeholder inherits at each indentation level. Shared by all the
+        slides using this master.
+        """
+        return {}
+
+    @property
+    def theme_colors(self):
+        """
+        |ThemeColors| object resolving colors in this part to RGB values,
+        using the theme and color map of its master unless this part
+        overrides the color map. The theme is read once for each master.
+        """
+        master_part = self.master_part
+        style_cache = master_part.style_cache
+        theme_colors = style_cache.get("theme_colors")
+        if theme_colors is None:
+            theme_colors = style_cache["theme_colors"] = ThemeColors.from_elements(
+                master_part._theme_color_scheme,
+                master_part._element.find(qn("p:clrMap")),
+            )
+        override = self._element.find(
+            "%s/%s" % (qn("p:clrMapOvr"), qn("a:overrideClrMapping"))
+        )
+        if override is None:
+            return theme_colors
+        return theme_colors.remapped(override)
+
+    @property
+    def _theme_color_scheme(self):
+        """
+        The `a:clrScheme` element of the theme related to this part, or
+        |None| when it has no theme.
+        """
+        try:
+            theme_part = self.part_related_by(RT.THEME)
+        except KeyError:
+            return None
+        return parse_xml(theme_part.blob).find(
+            "%s/%s" % (qn("a:themeElements"), qn("a:clrScheme"))
+        )
+
 
 class NotesMasterPart(BaseSlidePart):
     """
@@ -67,6 +124,11 @@ class NotesMasterPart(BaseSlidePart):
         notes_master_part.relate_to(theme_part, RT.THEME)
         return notes_master_part
 
+    @property
+    def master_part(self):
+        """This notes master part, which inherits from no other."""
+        return self
+
     @lazyproperty
     def notes_master(self):
         """
@@ -119,6 +181,11 @@ class NotesSlidePart(BaseSlidePart):
         notes_slide.clone_master_placeholders(notes_master_part.notes_master)
         return notes_slide_part
 
+    @property
+    def master_part(self):
+        """The |NotesMasterPart| object this notes slide inherits from."""
+        return self.part_related_by(RT.NOTES_MASTER)
+
     @lazyproperty
     def notes_master(self):
         """
@@ -175,6 +242,16 @@ class SlidePart(BaseSlidePart):
         rId = self.relate_to(chart_part, RT.CHART)
         return rId
 
+    def add_chart_part_from_prototype(self, prototype, chart_data):
+        """
+        Return the rId of a new |ChartPart| object copied from |ChartPrototype|
+        *prototype*, displaying *chart_data*, and related to the slide
+        contained in this part.
+        """
+        chart_part = ChartPart.new_from_prototype(prototype, chart_data, self.package)
+        rId = self.relate_to(chart_part, RT.CHART)
+        return rId
+
     def get_or_add_video_media_part(self, video):
         """Return rIds for media and video relationships to media part.
 
@@ -204,6 +281,11 @@ class SlidePart(BaseSlidePart):
             return False
         return True
 
+    @property
+    def master_part(self):
+        """The |SlideMasterPart| object the layout of this slide inherits from."""
+        return self.part_related_by(RT.SLIDE_LAYOUT).master_part
+
     @lazyproperty
     def notes_slide(self):
         """
@@ -258,6 +340,11 @@ class SlideLayoutPart(BaseSlidePart):
     ``ppt/slideLayouts/slideLayout[1-9][0-9]*.xml``.
     """
 
+    @property
+    def master_part(self):
+        """The |SlideMasterPart| object this slide layout inherits from."""
+        return self.part_related_by(RT.SLIDE_MASTER)
+
     @lazyproperty
     def slide_layout(self):
         """
@@ -279,6 +366,11 @@ class SlideMasterPart(BaseSlidePart):
     ppt/slideMasters/slideMaster[1-9][0-9]*.xml.
     """
 
+    @property
+    def master_part(self):
+        """This slide master part, which inherits from no other."""
+        return self
+
     def related_slide_layout(self, rId):
         """
         Return the |SlideLayout| object of the related |SlideLayoutPart|
@@ -27,6 +27,44 @@ class Presentation(PartElementProxy):
         """
         return self.part.core_properties
 
+    def extract_text(self, notes=False):
+        """
+        Generate a `(slide_idx, shape_id, paragraph_idx, text)` 4-tuple for
+        each paragraph of text in the slides of this presentation, in slide
+        order.
+
+        When *notes* is |True|, the paragraphs of each slide's notes slide
+        follow those of the slide itself, with *shape_id* identifying the
+        shape in the notes slide. No notes slide is created for a slide that
+        doesn't have one. See :meth:`.Slide.iter_text` for details.
+        """
+        for slide_idx, slide in enumerate(self.slides):
+            for shape_id, paragraph_idx, text in slide.iter_text():
+                yield slide_idx, shape_id, paragraph_idx, text
+            if notes and slide.has_notes_slide:
+                for shape_id, paragraph_idx, text in slide.notes_slide.iter_text():
+                    yield slide_idx, shape_id, paragraph_idx, text
+
+    def import_slides(self, other_prs, slides=None):
+        """
+        Append a copy of each slide in *slides*, a sequence of slides
+        belonging to |Presentation| object *other_prs*, to the slides of this
+        presentation and return a list of the new slides. All slides of
+        *other_prs* are copied when *slides* is |None|.
+
+        Each slide is copied along with the parts it depends on, such as its
+        notes slide and charts. Its slide layout, master, and theme are
+        copied only when this presentation does not already contain
+        identical ones, and an image or media file already present is shared
+        rather than added again, so slides from decks built on the same
+        template can be merged without duplication. A hyperlink from one
+        copied slide to another is preserved while a hyperlink to a slide
+        not copied is removed.
+        """
+        if slides is None:
+            slides = other_prs.slides
+        return self.part.import_slides([slide.part for slide in slides])
+
     @property
     def notes_master(self):
         """
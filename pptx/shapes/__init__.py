@@ -13,6 +13,8 @@ class Subshape(object):
     to subclasses.
     """
 
+    __slots__ = ("_parent",)
+
     def __init__(self, parent):
         super(Subshape, self).__init__()
         self._parent = parent
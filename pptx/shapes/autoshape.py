@@ -278,6 +278,8 @@ class Shape(BaseShape):
     (slide, slideLayout, slideMaster, notesPage, notesMaster, handoutMaster).
     """
 
+    __slots__ = ("_sp", "_adjustments", "_fill", "_line")
+
     def __init__(self, sp, parent):
         super(Shape, self).__init__(sp, parent)
         self._sp = sp
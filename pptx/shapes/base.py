@@ -16,6 +16,8 @@ class BaseShape(object):
     Subclasses include |Shape|, |Picture|, and |GraphicFrame|.
     """
 
+    __slots__ = ("_element", "_parent", "_click_action", "_shadow")
+
     def __init__(self, shape_elm, parent):
         super(BaseShape, self).__init__()
         self._element = shape_elm
@@ -22,6 +22,8 @@ class Connector(BaseShape):
     have elbows, or can be curved.
     """
 
+    __slots__ = ("_line",)
+
     def begin_connect(self, shape, cxn_pt_idx):
         """
         **EXPERIMENTAL** - *The current implementation only works properly
@@ -19,6 +19,8 @@ class GraphicFrame(BaseShape):
     Corresponds to a ``<p:graphicFrame>`` element in the shape tree.
     """
 
+    __slots__ = ()
+
     @property
     def chart(self):
         """
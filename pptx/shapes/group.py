@@ -13,6 +13,8 @@ from pptx.util import lazyproperty
 class GroupShape(BaseShape):
     """A shape that acts as a container for other shapes."""
 
+    __slots__ = ("_shapes",)
+
     @property
     def click_action(self):
         """Unconditionally raises `TypeError`.
@@ -14,6 +14,8 @@ from pptx.util import lazyproperty
 class _BasePicture(BaseShape):
     """Base class for shapes based on a `p:pic` element."""
 
+    __slots__ = ("_pic", "_line")
+
     def __init__(self, pic, parent):
         super(_BasePicture, self).__init__(pic, parent)
         self._pic = pic
@@ -100,6 +102,8 @@ class Movie(_BasePicture):
     represents the video before it is played.
     """
 
+    __slots__ = ("_media_format",)
+
     @lazyproperty
     def media_format(self):
         """The |_MediaFormat| object for this movie.
@@ -145,6 +149,8 @@ class Picture(_BasePicture):
     Based on the `p:pic` element.
     """
 
+    __slots__ = ()
+
     @property
     def auto_shape_type(self):
         """Member of MSO_SHAPE indicating masking shape.
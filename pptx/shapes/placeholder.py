@@ -28,6 +28,8 @@ class _InheritsDimensions(object):
     to inherit from.
     """
 
+    __slots__ = ()
+
     @property
     def height(self):
         """
@@ -127,6 +129,8 @@ class _BaseSlidePlaceholder(_InheritsDimensions, Shape):
     inherited dimensions.
     """
 
+    __slots__ = ()
+
     @property
     def is_placeholder(self):
         """
@@ -180,6 +184,8 @@ class BasePlaceholder(Shape):
     behaviors of placeholders on a master, layout, and slide.
     """
 
+    __slots__ = ()
+
     @property
     def idx(self):
         """
@@ -217,6 +223,8 @@ class LayoutPlaceholder(_InheritsDimensions, Shape):
     exists.
     """
 
+    __slots__ = ()
+
     @property
     def _base_placeholder(self):
         """
@@ -247,6 +255,8 @@ class MasterPlaceholder(BasePlaceholder):
     Placeholder shape on a slide master.
     """
 
+    __slots__ = ()
+
 
 class NotesSlidePlaceholder(_InheritsDimensions, Shape):
     """
@@ -254,6 +264,8 @@ class NotesSlidePlaceholder(_InheritsDimensions, Shape):
     placeholder on the notes master that has the same type (e.g. 'body').
     """
 
+    __slots__ = ()
+
     @property
     def _base_placeholder(self):
         """
@@ -272,12 +284,16 @@ class SlidePlaceholder(_BaseSlidePlaceholder):
     corresponding slide layout placeholder.
     """
 
+    __slots__ = ()
+
 
 class ChartPlaceholder(_BaseSlidePlaceholder):
     """
     Placeholder shape that can only accept a chart.
     """
 
+    __slots__ = ()
+
     def insert_chart(self, chart_type, chart_data):
         """
         Return a |PlaceholderGraphicFrame| object containing a new chart of
@@ -313,6 +329,8 @@ class PicturePlaceholder(_BaseSlidePlaceholder):
     Placeholder shape that can only accept a picture.
     """
 
+    __slots__ = ()
+
     def insert_picture(self, image_file):
         """
         Return a |PlaceholderPicture| object depicting the image in
@@ -355,6 +373,8 @@ class PlaceholderGraphicFrame(GraphicFrame):
     Placeholder shape populated with a table, chart, or smart art.
     """
 
+    __slots__ = ()
+
     @property
     def is_placeholder(self):
         """
@@ -369,6 +389,8 @@ class PlaceholderPicture(_InheritsDimensions, Picture):
     Placeholder shape populated with a picture.
     """
 
+    __slots__ = ()
+
     @property
     def _base_placeholder(self):
         """
@@ -383,6 +405,8 @@ class TablePlaceholder(_BaseSlidePlaceholder):
     Placeholder shape that can only accept a picture.
     """
 
+    __slots__ = ()
+
     def insert_table(self, rows, cols):
         """
         Return a |PlaceholderGraphicFrame| object containing a table of
@@ -14,6 +14,7 @@ from pptx.oxml.ns import qn
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.simpletypes import ST_Direction
+from pptx.parts.clone import RelationshipCloner
 from pptx.shapes.autoshape import AutoShapeType, Shape
 from pptx.shapes.base import BaseShape
 from pptx.shapes.connector import Connector
@@ -197,7 +198,7 @@ class _BaseShapes(ParentedElementProxy):
 
         # increment numpart as necessary to make name unique
         numpart = id - 1
-        names = self._spTree.xpath("//p:cNvPr/@name")
+        names = set(self._spTree.xpath("//p:cNvPr/@name"))
         while True:
             name = "%s %d" % (basename, numpart)
             if name not in names:
@@ -254,6 +255,21 @@ class _BaseGroupShapes(_BaseShapes):
         self._recalculate_extents()
         return self._shape_factory(graphicFrame)
 
+    def add_chart_from(self, prototype, x, y, cx, cy, chart_data):
+        """Add a new chart copied from *prototype* to the slide.
+
+        *prototype* is a |ChartPrototype| object, typically used to add many
+        charts that share formatting and differ only in their data. The new
+        chart is positioned at (*x*, *y*), has size (*cx*, *cy*), and depicts
+        *chart_data*, which must suit the prototype's chart type. As with
+        :meth:`add_chart`, the |GraphicFrame| shape containing the chart is
+        returned.
+        """
+        rId = self.part.add_chart_part_from_prototype(prototype, chart_data)
+        graphicFrame = self._add_chart_graphicFrame(rId, x, y, cx, cy)
+        self._recalculate_extents()
+        return self._shape_factory(graphicFrame)
+
     def add_connector(self, connector_type, begin_x, begin_y, end_x, end_y):
         """Add a newly created connector shape to the end of this shape tree.
 
@@ -526,12 +542,24 @@ class SlideShapes(_BaseGroupShapes):
     def clone_shape(self, shape, left=None, top=None, width=None, height=None):
         """
         Clone a *shape* of specified size at specified position.
-        *shape* doesn't need to come from the same slide.
+        *shape* doesn't need to come from the same slide, or even the same
+        presentation. Parts the shape depends on are related to this slide;
+        a chart is copied along with its workbook while an image or media
+        file is shared with any identical one already in the presentation.
+        See |RelationshipCloner| for details.
         """
-        _element = copy.deepcopy(shape.element)
-        sp = self._add_sp_from_existing_shape(_element, left, top, width, height)
+        cloner = RelationshipCloner(self.part)
+        return self._clone_shape(shape, cloner, left, top, width, height)
 
-        return self._shape_factory(sp)
+    def clone_shapes(self, shapes):
+        """
+        Return a list containing a clone of each shape in *shapes*, as
+        :meth:`clone_shape` would produce without a position or size. This
+        is faster than cloning each shape in turn because the image and media
+        de-duplication and partname allocation work is shared across shapes.
+        """
+        cloner = RelationshipCloner(self.part)
+        return [self._clone_shape(shape, cloner) for shape in shapes]
 
     def add_table(self, rows, cols, left, top, width, height):
         """
@@ -596,6 +624,16 @@ class SlideShapes(_BaseGroupShapes):
         childTnLst = sld.get_or_add_childTnLst()
         childTnLst.add_video(pic.shape_id)
 
+    def _clone_shape(self, shape, cloner, x=None, y=None, cx=None, cy=None):
+        """
+        Return a shape proxy for a newly added copy of *shape*, having its
+        relationships re-created for this slide by *cloner*.
+        """
+        element = copy.deepcopy(shape.element)
+        cloner.clone_rels(element, shape.part)
+        sp = self._add_sp_from_existing_shape(element, x, y, cx, cy)
+        return self._shape_factory(sp)
+
     def _shape_factory(self, shape_elm):
         """
         Return an instance of the appropriate shape proxy class for
@@ -673,6 +711,9 @@ class BasePlaceholders(_BaseShapes):
     :method:`_shape_factory` to use custom placeholder classes.
     """
 
+    # ---maps lookup key to first `(shape_elm, ph)` pair having it, built on use---
+    _ph_index = None
+
     @staticmethod
     def _is_member_elm(shape_elm):
         """
@@ -680,6 +721,43 @@ class BasePlaceholders(_BaseShapes):
         """
         return shape_elm.has_ph_elm
 
+    def _find_ph_elm(self, key):
+        """
+        Return the first placeholder shape element in this collection whose
+        `p:ph` element has *key*, as computed by :meth:`_ph_key`, or |None|
+        if there is none.
+
+        Lookups use an index built on first use and kept by this collection,
+        which lives as long as its slide layout or master part, so every
+        slide inheriting from it shares the index. The element found is
+        checked to still be in this collection and have *key*; the index is
+        rebuilt when it does not, or when *key* is not found, so changes to
+        the placeholders are always reflected.
+        """
+        ph_index = self._ph_index
+        entry = None if ph_index is None else ph_index.get(key)
+        if entry is not None:
+            shape_elm, ph = entry
+            if shape_elm.getparent() is self._spTree and self._ph_key(ph) == key:
+                return shape_elm
+
+        ph_index = {}
+        for shape_elm in self._iter_member_elms():
+            ph = shape_elm.ph
+            ph_index.setdefault(self._ph_key(ph), (shape_elm, ph))
+        self._ph_index = ph_index
+        entry = ph_index.get(key)
+        return None if entry is None else entry[0]
+
+    @staticmethod
+    def _ph_key(ph):
+        """
+        Return the value of *ph*, a `p:ph` element, that placeholders are
+        looked up by in this collection. Overridden by subclasses supporting
+        lookup.
+        """
+        raise NotImplementedError("Must be implemented by subclasses supporting get()")
+
 
 class LayoutPlaceholders(BasePlaceholders):
     """
@@ -692,10 +770,15 @@ class LayoutPlaceholders(BasePlaceholders):
         Return the first placeholder shape with matching *idx* value, or
         *default* if not found.
         """
-        for placeholder in self:
-            if placeholder.element.ph_idx == idx:
-                return placeholder
-        return default
+        ph_elm = self._find_ph_elm(idx)
+        if ph_elm is None:
+            return default
+        return self._shape_factory(ph_elm)
+
+    @staticmethod
+    def _ph_key(ph):
+        """A layout placeholder is looked up by its idx value."""
+        return ph.idx
 
     def _shape_factory(self, shape_elm):
         """
@@ -717,10 +800,15 @@ class MasterPlaceholders(BasePlaceholders):
         or *default* if no such placeholder shape is present in the
         collection.
         """
-        for placeholder in self:
-            if placeholder.ph_type == ph_type:
-                return placeholder
-        return default
+        ph_elm = self._find_ph_elm(ph_type)
+        if ph_elm is None:
+            return default
+        return self._shape_factory(ph_elm)
+
+    @staticmethod
+    def _ph_key(ph):
+        """A master placeholder is looked up by its type."""
+        return ph.type
 
     def _shape_factory(self, shape_elm):
         """
@@ -37,6 +37,33 @@ class _BaseSlide(PartElementProxy):
         """
         return _Background(self._element.cSld)
 
+    def clear_style_cache(self):
+        """
+        Discard the values resolved through the style hierarchy of the
+        master this slide inherits from, such as those used by
+        :attr:`.Font.effective` and :attr:`theme_colors`. They are cached
+        for all the slides using the master and are not updated when the
+        master, its layouts, or its theme are changed, so call this after
+        changing one of those for the change to be seen.
+        """
+        self.part.master_part.style_cache.clear()
+
+    def iter_text(self):
+        """
+        Generate a `(shape_id, paragraph_idx, text)` 3-tuple for each
+        paragraph of text on this slide, in document order.
+
+        Text in group members and table cells is included. This walks the
+        slide XML directly, without constructing shape, text frame, or
+        paragraph objects, so it is much faster than accessing `.text` on
+        each shape when all the text is wanted. *paragraph_idx* is the
+        zero-based index of the paragraph within its shape (table paragraphs
+        are counted cell by cell, row by row). A line break appears as
+        a vertical-tab character (``"\\v"``), as it does in
+        :attr:`_Paragraph.text`.
+        """
+        return self._element.cSld.spTree.iter_paragraph_text()
+
     @property
     def name(self):
         """
@@ -51,6 +78,19 @@ class _BaseSlide(PartElementProxy):
         new_value = "" if value is None else value
         self._element.cSld.name = new_value
 
+    @property
+    def theme_colors(self):
+        """
+        |ThemeColors| object resolving the colors on this slide to the RGB
+        values they are rendered with, for example::
+
+            rgb = slide.theme_colors.rgb(shape.fill.fore_color)
+
+        The theme is read only once for each master, so resolving the colors
+        of every shape in a presentation stays cheap.
+        """
+        return self.part.theme_colors
+
 
 class _BaseMaster(_BaseSlide):
     """
@@ -267,7 +307,7 @@ class Slides(ParentedElementProxy):
         Provide indexed access, (e.g. 'slides[0]').
         """
         try:
-            sldId = self._sldIdLst[idx]
+            sldId = self._sldIds[idx]
         except IndexError:
             raise IndexError("slide index out of range")
         return self.part.related_slide(sldId.rId)
@@ -276,14 +316,14 @@ class Slides(ParentedElementProxy):
         """
         Support iteration (e.g. 'for slide in slides:').
         """
-        for sldId in self._sldIdLst:
+        for sldId in self._sldIds:
             yield self.part.related_slide(sldId.rId)
 
     def __len__(self):
         """
         Support len() built-in function (e.g. 'len(slides) == 4').
         """
-        return len(self._sldIdLst)
+        return len(self._sldIds)
 
     def add_slide(self, slide_layout):
         """
@@ -314,6 +354,19 @@ class Slides(ParentedElementProxy):
                 return idx
         raise ValueError("%s is not in slide collection" % slide)
 
+    @property
+    def _sldIds(self):
+        """
+        Sequence of the `p:sldId` elements of the slides in this collection.
+        When the presentation was opened with only some slides selected, the
+        slides not loaded are left out.
+        """
+        if not self.part.package.is_partial:
+            return self._sldIdLst
+        return [
+            sldId for sldId in self._sldIdLst if self.part.is_loaded_slide(sldId.rId)
+        ]
+
 
 class SlideLayout(_BaseSlide):
     """
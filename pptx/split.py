@@ -0,0 +1,299 @@
+# encoding: utf-8
+
+"""
+Splitting a presentation into one presentation per slide.
+
+:func:`split` reads the source package once, keeping each part as the bytes
+it is stored as, and writes each output package directly from those bytes.
+Only the relationships are parsed up front. The masters, layouts, themes,
+and images an output shares with the others are written as they are, without
+being parsed or serialized again. The only XML changed is that of the
+presentation part, to list just the one slide, and that of any part
+referring to a part left out of the output, like a hyperlink to another
+slide or, when unused layouts are dropped, a slide master.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import multiprocessing
+import os
+
+from .compat import BytesIO, is_string
+from .opc.constants import RELATIONSHIP_TYPE as RT
+from .opc.oxml import serialize_part_xml
+from .opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from .opc.phys_pkg import PhysPkgReader, PhysPkgWriter
+from .opc.pkgreader import _ContentTypeMap, _SerializedRelationshipCollection
+from .opc.pkgwriter import _ContentTypesItem
+from .oxml import parse_xml
+from .oxml.ns import qn
+from .parallel import _partition
+from .util import lazyproperty
+
+# ---elements listing a related part, removed when that part is left out---
+_ID_LIST_TAGS = frozenset(
+    (qn("p:sldId"), qn("p:sldMasterId"), qn("p:sldLayoutId"), qn("p:sld"))
+)
+# ---slide entries of the section list PowerPoint 2010 and later writes---
+_SECTION_SLIDE_ID_TAG = (
+    "{http://schemas.microsoft.com/office/powerpoint/2010/main}sldId"
+)
+
+
+def split(pptx, out_dir, workers=None, drop_unused_layouts=False, name="slide%d.pptx"):
+    """
+    Write each slide of the presentation in *pptx* to a presentation of its
+    own in the directory *out_dir* and return a list of the paths written, in
+    slide order.
+
+    *pptx* is a path to a .pptx file (a string) or a file-like object.
+    *out_dir* is created when it does not exist. Each file is named by
+    formatting *name* with the one-based slide number, so the third slide is
+    written to 'slide3.pptx' by default.
+
+    Each output has the parts the source would have after deleting all the
+    other slides, keeping the notes, charts, pictures, and so on of its
+    slide. A hyperlink to another slide is removed. When
+    *drop_unused_layouts* is |True|, each output keeps only the slide layout
+    its slide uses and that layout's slide master.
+
+    *workers* is the number of worker processes to write the outputs with.
+    The outputs are written in the calling process when *workers* is |None|
+    or 1. Each worker process reads the source once.
+    """
+    if not is_string(pptx):
+        pptx = pptx.read()
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+
+    source = _SourcePackage.read(_source_file(pptx))
+    jobs = [
+        (idx, os.path.join(out_dir, name % (idx + 1)))
+        for idx in range(len(source.slide_partnames))
+    ]
+    if workers is None or workers <= 1 or len(jobs) <= 1:
+        for idx, path in jobs:
+            source.write_slide(idx, path, drop_unused_layouts)
+        return [path for _, path in jobs]
+
+    chunks = [
+        (pptx, chunk_jobs, drop_unused_layouts)
+        for chunk_jobs in _partition(jobs, workers)
+    ]
+    pool = multiprocessing.Pool(len(chunks))
+    try:
+        paths = []
+        for chunk_paths in pool.imap(_split_chunk, chunks):
+            paths.extend(chunk_paths)
+    finally:
+        pool.close()
+        pool.join()
+    return paths
+
+
+def _source_file(pptx):
+    """
+    Return *pptx*, a path or the bytes of a package, as a path or file-like
+    object the package can be read from.
+    """
+    return BytesIO(pptx) if isinstance(pptx, bytes) else pptx
+
+
+def _split_chunk(chunk):
+    """
+    Write the slide for each `(idx, path)` job in *chunk* and return the
+    paths written. Runs in a worker process.
+    """
+    pptx, jobs, drop_unused_layouts = chunk
+    source = _SourcePackage.read(_source_file(pptx))
+    for idx, path in jobs:
+        source.write_slide(idx, path, drop_unused_layouts)
+    return [path for _, path in jobs]
+
+
+class _SourcePackage(object):
+    """
+    The parts of a package as stored, each with its relationships, for
+    writing packages made of a subset of them.
+    """
+
+    def __init__(self, content_types, pkg_rels_xml, pkg_srels, blobs, rels):
+        super(_SourcePackage, self).__init__()
+        self._content_types = content_types
+        self._pkg_rels_xml = pkg_rels_xml
+        self._pkg_srels = pkg_srels
+        self._blobs = blobs
+        self._rels = rels
+
+    @classmethod
+    def read(cls, pkg_file):
+        """
+        Return a |_SourcePackage| object holding the parts in *pkg_file*
+        reachable from the package relationships.
+        """
+        phys_reader = PhysPkgReader(pkg_file)
+        try:
+            content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
+            pkg_rels_xml = phys_reader.rels_xml_for(PACKAGE_URI)
+            pkg_srels = list(
+                _SerializedRelationshipCollection.load_from_xml(
+                    PACKAGE_URI.baseURI, pkg_rels_xml
+                )
+            )
+            blobs, rels = {}, {}
+            pending = [srel.target_partname for srel in _internal(pkg_srels)]
+            while pending:
+                partname = pending.pop()
+                if partname in blobs:
+                    continue
+                blobs[partname] = phys_reader.blob_for(partname)
+                rels_xml = phys_reader.rels_xml_for(partname)
+                srels = list(
+                    _SerializedRelationshipCollection.load_from_xml(
+                        partname.baseURI, rels_xml
+                    )
+                )
+                rels[partname] = (rels_xml, srels)
+                pending.extend(srel.target_partname for srel in _internal(srels))
+        finally:
+            phys_reader.close()
+        return cls(content_types, pkg_rels_xml, pkg_srels, blobs, rels)
+
+    @lazyproperty
+    def slide_partnames(self):
+        """List of the partnames of the slides, in presentation order."""
+        target_partnames = dict(
+            (srel.rId, srel.target_partname)
+            for srel in self._rels[self._prs_partname][1]
+        )
+        sldIdLst = parse_xml(self._blobs[self._prs_partname]).sldIdLst
+        if sldIdLst is None:
+            return []
+        return [target_partnames[sldId.rId] for sldId in sldIdLst]
+
+    def write_slide(self, idx, pkg_file, drop_unused_layouts=False):
+        """
+        Write a package containing only the slide at *idx* to *pkg_file*,
+        leaving out the slide layouts and masters it does not use when
+        *drop_unused_layouts* is |True|.
+        """
+        slide_partname = self.slide_partnames[idx]
+        excluded = set(self._rels_of_type(self._prs_partname, RT.SLIDE))
+        excluded.discard(slide_partname)
+        if drop_unused_layouts:
+            layout_partname = self._related_partname(slide_partname, RT.SLIDE_LAYOUT)
+            master_partname = self._related_partname(layout_partname, RT.SLIDE_MASTER)
+            excluded.update(self._rels_of_type(self._prs_partname, RT.SLIDE_MASTER))
+            excluded.update(self._rels_of_type(master_partname, RT.SLIDE_LAYOUT))
+            excluded.difference_update((layout_partname, master_partname))
+
+        partnames = self._reachable_partnames(excluded)
+        phys_writer = PhysPkgWriter(pkg_file)
+        entries = [
+            (partname, self._content_types[partname], None) for partname in partnames
+        ]
+        phys_writer.write(
+            CONTENT_TYPES_URI,
+            serialize_part_xml(_ContentTypesItem.xml_for((), entries)),
+        )
+        phys_writer.write(PACKAGE_URI.rels_uri, self._pkg_rels_xml)
+        for partname in partnames:
+            blob, rels_xml = self._part_items(partname, excluded)
+            phys_writer.write(partname, blob)
+            if rels_xml is not None:
+                phys_writer.write(partname.rels_uri, rels_xml)
+        phys_writer.close()
+
+    def _part_items(self, partname, excluded):
+        """
+        Return a `(blob, rels_xml)` pair for the part *partname* as written
+        without the parts in *excluded*. Both are as stored unless the part
+        is related to a part in *excluded*. *rels_xml* is |None| when the
+        part has no relationships.
+        """
+        blob = self._blobs[partname]
+        rels_xml, srels = self._rels[partname]
+        dropped_rIds = set(
+            srel.rId for srel in _internal(srels) if srel.target_partname in excluded
+        )
+        if not dropped_rIds:
+            return blob, rels_xml
+
+        rels_elm = parse_xml(rels_xml)
+        for rel_elm in rels_elm.relationship_lst:
+            if rel_elm.rId in dropped_rIds:
+                rels_elm.remove(rel_elm)
+        return _without_rIds(blob, dropped_rIds), rels_elm.xml
+
+    @lazyproperty
+    def _prs_partname(self):
+        """Partname of the presentation part."""
+        return next(
+            srel.target_partname
+            for srel in self._pkg_srels
+            if srel.reltype == RT.OFFICE_DOCUMENT
+        )
+
+    def _reachable_partnames(self, excluded):
+        """
+        Return a list of the partnames of the parts reachable from the
+        package relationships without passing through a part in *excluded*,
+        in the order first reached.
+        """
+        partnames, visited = [], set(excluded)
+        pending = [srel.target_partname for srel in _internal(self._pkg_srels)]
+        pending.reverse()
+        while pending:
+            partname = pending.pop()
+            if partname in visited:
+                continue
+            visited.add(partname)
+            partnames.append(partname)
+            srels = self._rels[partname][1]
+            pending.extend(reversed([s.target_partname for s in _internal(srels)]))
+        return partnames
+
+    def _related_partname(self, partname, reltype):
+        """
+        Return the partname of the first part related to *partname* by
+        *reltype*.
+        """
+        return next(iter(self._rels_of_type(partname, reltype)))
+
+    def _rels_of_type(self, partname, reltype):
+        """
+        Return a list of the partnames of the parts related to *partname* by
+        *reltype*.
+        """
+        return [
+            srel.target_partname
+            for srel in _internal(self._rels[partname][1])
+            if srel.reltype == reltype
+        ]
+
+
+def _internal(srels):
+    """Return a list of the relationships in *srels* not external."""
+    return [srel for srel in srels if not srel.is_external]
+
+
+def _without_rIds(blob, rIds):
+    """
+    Return the XML in *blob* changed so no longer referring to any
+    relationship in *rIds*. An element listing a related part, like a
+    `p:sldId` element, is removed; any other reference is cleared. A section
+    entry for a slide no longer listed is also removed.
+    """
+    element = parse_xml(blob)
+    for referring in element.xpath("descendant::*[@r:id]"):
+        if referring.tag in _ID_LIST_TAGS and referring.get(qn("r:id")) in rIds:
+            referring.getparent().remove(referring)
+    element.remap_rIds(dict((rId, "") for rId in rIds))
+
+    sldIdLst = element.find(qn("p:sldIdLst"))
+    if sldIdLst is not None:
+        slide_ids = set(sldId.get("id") for sldId in sldIdLst)
+        for section_sldId in element.iter(_SECTION_SLIDE_ID_TAG):
+            if section_sldId.get("id") not in slide_ids:
+                section_sldId.getparent().remove(section_sldId)
+    return serialize_part_xml(element)
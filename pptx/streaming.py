@@ -0,0 +1,186 @@
+# encoding: utf-8
+
+"""
+Append-only writer for generating presentations too large to hold in memory.
+
+A |PresentationWriter| loads its slide masters, layouts, and theme from
+a template, then writes each slide to the output package as soon as the
+caller flushes it, releasing the slide's XML afterward. Peak memory is
+therefore bounded by the slides being built rather than by the total slide
+count.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from .api import Presentation
+from .opc.pkgwriter import StreamingPackageWriter
+from .parts.image import ImagePart
+from .parts.media import MediaPart
+from .parts.slide import SlidePart
+
+
+class PresentationWriter(object):
+    """
+    Writes a presentation to *pkg_file* one slide at a time. *pkg_file* can
+    be either a path to a file (a string) or a file-like object. Masters,
+    layouts, and theme are loaded from *template*, a path or file-like object
+    containing a .pptx package; the built-in default template is used when
+    *template* is |None|.
+
+    Typical use::
+
+        with PresentationWriter("big.pptx", "template.pptx") as writer:
+            layout = writer.presentation.slide_layouts[6]
+            for row in rows:
+                slide = writer.add_slide(layout)
+                ...  # populate slide
+                writer.flush(slide)
+
+    A flushed slide is written to the package immediately and its XML (along
+    with that of its notes slide, charts, and embedded workbooks) is dropped;
+    the |Slide| object and any shape or chart objects obtained from it must
+    not be used after flushing. Image and media parts are retained so they
+    can be reused by later slides. Slides not explicitly flushed are written
+    on :meth:`close`, as are ``[Content_Types].xml``, ``presentation.xml``,
+    and the package rels.
+    """
+
+    def __init__(self, pkg_file, template=None):
+        super(PresentationWriter, self).__init__()
+        self._prs = Presentation(template)
+        self._pkg_writer = StreamingPackageWriter(pkg_file)
+        self._slide_count = len(self._prs.slides)
+        self._shared_parts_cache = None
+        self._shared_rel_count = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add_slide(self, slide_layout):
+        """
+        Return a newly added slide that inherits layout from *slide_layout*,
+        appended after any slides already added.
+        """
+        slide = self._prs.slides.add_slide(slide_layout)
+        self._slide_count += 1
+        return slide
+
+    def close(self):
+        """
+        Write all parts not yet flushed along with the content types stream
+        and package rels, then close the output package.
+        """
+        package = self._prs.part.package
+        parts = package.parts
+        for part in parts:
+            if not self._pkg_writer.is_written(part):
+                part.before_marshal()
+        self._pkg_writer.close(package.rels, parts)
+
+    def flush(self, slide):
+        """
+        Write *slide* to the output package along with each part only it
+        depends on, such as its notes slide and charts, then release their
+        in-memory XML. Parts shared with the template, like the slide layout,
+        are written on :meth:`close`.
+        """
+        shared_parts = self._shared_parts()
+        for part in self._iter_slide_parts(slide.part, shared_parts):
+            part.before_marshal()
+            self._pkg_writer.write_part(part)
+            _release(part)
+
+    @property
+    def presentation(self):
+        """
+        The |Presentation| object being written, providing access to its
+        slide masters and layouts.
+        """
+        return self._prs
+
+    @staticmethod
+    def _iter_slide_parts(slide_part, shared_parts):
+        """
+        Generate *slide_part* followed by each part reachable from it by
+        relationship that does not appear in *shared_parts*. Other slides
+        reached by, for example, a hyperlink, are not included.
+        """
+        visited = set([slide_part])
+        stack = [slide_part]
+        while stack:
+            source = stack.pop()
+            targets = [
+                rel.target_part for rel in source.rels.values() if not rel.is_external
+            ]
+            yield source
+            for part in targets:
+                if part in visited or part in shared_parts:
+                    continue
+                if isinstance(part, SlidePart):
+                    continue
+                visited.add(part)
+                stack.append(part)
+
+    def _shared_parts(self):
+        """
+        Return the set of parts reachable from the package without passing
+        through a slide part, such as the presentation part, slide masters,
+        layouts, and themes.
+
+        The set is found again only when the presentation part gains
+        a relationship to something other than a slide, like the notes
+        master added along with the first notes slide, so flushing a slide
+        does not take longer as the number of slides grows.
+        """
+        rel_count = len(self._prs.part.rels) - self._slide_count
+        if rel_count != self._shared_rel_count:
+            self._shared_parts_cache = self._find_shared_parts()
+            self._shared_rel_count = rel_count
+        return self._shared_parts_cache
+
+    def _find_shared_parts(self):
+        """
+        Return the set of parts reachable from the package without passing
+        through a slide part.
+        """
+        shared_parts = set()
+        stack = [self._prs.part.package]
+        while stack:
+            source = stack.pop()
+            for rel in source.rels.values():
+                if rel.is_external:
+                    continue
+                part = rel.target_part
+                if part in shared_parts or isinstance(part, SlidePart):
+                    continue
+                shared_parts.add(part)
+                stack.append(part)
+        return shared_parts
+
+
+# ---attributes holding the XML or blob of a part, directly or through the
+# ---object cached by a lazyproperty like SlidePart.slide or ChartPart.chart
+_PAYLOAD_ATTRS = (
+    "_element",
+    "_blob",
+    "_slide",
+    "_notes_slide",
+    "_chart",
+    "_chart_workbook",
+)
+
+
+def _release(part):
+    """
+    Drop the payload of *part*, which has already been written, keeping its
+    partname, content type, and relationships. Image and media parts are
+    kept intact so they remain available for de-duplication.
+    """
+    if isinstance(part, (ImagePart, MediaPart)):
+        return
+    for name in _PAYLOAD_ATTRS:
+        if hasattr(part, name):
+            setattr(part, name, None)
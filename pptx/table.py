@@ -4,11 +4,12 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from pptx.compat import is_integer
+from pptx.compat import is_integer, is_string, to_unicode
 from pptx.dml.fill import FillFormat
 from pptx.oxml.table import TcRange
+from pptx.oxml.xmlchemy import OxmlElement
 from pptx.shapes import Subshape
-from pptx.text.text import TextFrame
+from pptx.text.text import Font, TextFrame
 from pptx.util import lazyproperty
 
 
@@ -19,6 +20,8 @@ class Table(object):
     :meth:`.Slide.shapes.add_table` to add a table to a slide.
     """
 
+    __slots__ = ("_tbl", "_graphic_frame", "_columns", "_rows")
+
     def __init__(self, tbl, graphic_frame):
         super(Table, self).__init__()
         self._tbl = tbl
@@ -144,6 +147,51 @@ class Table(object):
         """
         return _RowCollection(self._tbl, self)
 
+    def set_values(self, rows, formats=None):
+        """Replace the text of the cells at the top left of this table.
+
+        *rows* is a sequence of rows, each a sequence of cell values, or
+        a 2-D NumPy array or pandas DataFrame (whose index and column labels
+        are not written). A str value is used as-is, |None| or NaN leaves
+        the cell empty, and any other value is converted to str, using the
+        number format of its column when there is one. The cell XML is
+        built directly, which is much faster than assigning the text of
+        each cell in turn when there are many cells.
+
+        *formats* is an optional sequence with one item per column, each
+        either |None|, a :func:`format` spec like ``",.2f"`` used as the
+        number format for the column, or a |ColumnFormat| object that also
+        specifies the font of the column's text. Cells outside the extent of
+        *rows* are not changed. Raises |ValueError| when *rows* has more rows
+        or columns than this table.
+        """
+        if hasattr(rows, "to_numpy"):
+            rows = rows.to_numpy()
+        if hasattr(rows, "tolist"):
+            rows = rows.tolist()
+        rows = [list(row) for row in rows]
+
+        if len(rows) > len(self._tbl.tr_lst) or any(
+            len(row) > len(self._tbl.tblGrid.gridCol_lst) for row in rows
+        ):
+            raise ValueError("values exceed table dimensions")
+
+        col_formats = [
+            ColumnFormat(number_format=f) if f is None or is_string(f) else f
+            for f in (formats or ())
+        ]
+        number_formats = [col_format.number_format for col_format in col_formats]
+        text_rows = [
+            [
+                _cell_text(
+                    value, number_formats[idx] if idx < len(number_formats) else None
+                )
+                for idx, value in enumerate(row)
+            ]
+            for row in rows
+        ]
+        self._tbl.set_texts(text_rows, [f.new_rPr() for f in col_formats])
+
     @property
     def vert_banding(self):
         """
@@ -160,6 +208,8 @@ class Table(object):
 class _Cell(Subshape):
     """Table cell"""
 
+    __slots__ = ("_tc", "_fill")
+
     def __init__(self, tc, parent):
         super(_Cell, self).__init__(parent)
         self._tc = tc
@@ -394,9 +444,49 @@ class _Cell(Subshape):
             raise TypeError(tmpl % margin_value)
 
 
+class ColumnFormat(object):
+    """Formatting applied to a column of cells by :meth:`Table.set_values`.
+
+    *number_format* is a :func:`format` spec like ``",.0f"`` or ``".1%"``
+    applied to each value that is not a str. *bold*, *italic*, *size*, and
+    *color* (an |RGBColor| value) specify the font of each run of text;
+    |None| leaves a property to be inherited, as for |Font|.
+    """
+
+    __slots__ = ("number_format", "bold", "italic", "size", "color")
+
+    def __init__(
+        self, number_format=None, bold=None, italic=None, size=None, color=None
+    ):
+        super(ColumnFormat, self).__init__()
+        self.number_format = number_format
+        self.bold = bold
+        self.italic = italic
+        self.size = size
+        self.color = color
+
+    def new_rPr(self):
+        """
+        Return a new `a:rPr` element specifying the font properties of this
+        format, or |None| when it specifies none.
+        """
+        if (self.bold, self.italic, self.size, self.color) == (None,) * 4:
+            return None
+        rPr = OxmlElement("a:rPr")
+        font = Font(rPr)
+        font.bold = self.bold
+        font.italic = self.italic
+        font.size = self.size
+        if self.color is not None:
+            font.color.rgb = self.color
+        return rPr
+
+
 class _Column(Subshape):
     """Table column"""
 
+    __slots__ = ("_gridCol",)
+
     def __init__(self, gridCol, parent):
         super(_Column, self).__init__(parent)
         self._gridCol = gridCol
@@ -417,6 +507,8 @@ class _Column(Subshape):
 class _Row(Subshape):
     """Table row"""
 
+    __slots__ = ("_tr",)
+
     def __init__(self, tr, parent):
         super(_Row, self).__init__(parent)
         self._tr = tr
@@ -445,6 +537,8 @@ class _Row(Subshape):
 class _CellCollection(Subshape):
     """Horizontal sequence of row cells"""
 
+    __slots__ = ("_tr",)
+
     def __init__(self, tr, parent):
         super(_CellCollection, self).__init__(parent)
         self._tr = tr
@@ -468,6 +562,8 @@ class _CellCollection(Subshape):
 class _ColumnCollection(Subshape):
     """Sequence of table columns."""
 
+    __slots__ = ("_tbl",)
+
     def __init__(self, tbl, parent):
         super(_ColumnCollection, self).__init__(parent)
         self._tbl = tbl
@@ -487,16 +583,59 @@ class _ColumnCollection(Subshape):
         """
         return len(self._tbl.tblGrid.gridCol_lst)
 
+    def delete(self, idx):
+        """
+        Remove the column at *idx*, along with its cell in each row. The
+        graphic frame narrows by the width of the column. Raises |ValueError|
+        when a cell in the column is part of a merged cell spanning more than
+        one column.
+        """
+        self._validate_idx(idx, len(self) - 1)
+        for tc in self._tbl.iter_col_tcs(idx):
+            if tc.gridSpan > 1 or tc.hMerge:
+                raise ValueError("column contains part of a merged cell")
+        self._tbl.remove_gridCol(idx)
+        self.notify_width_changed()
+
+    def insert(self, idx, width=None):
+        """
+        Return a new |_Column| inserted at *idx*, moving the column at *idx*
+        and those to its right one place right. *idx* can be the column count
+        to add the column at the right. Each cell in the new column is empty.
+        *width* defaults to that of the column at *idx*, or of the last
+        column when adding at the right, and the graphic frame widens to
+        match. Raises |ValueError| when *idx* falls within a merged cell.
+        """
+        col_count = len(self)
+        self._validate_idx(idx, col_count)
+        if idx < col_count:
+            for tc in self._tbl.iter_col_tcs(idx):
+                if tc.hMerge:
+                    raise ValueError("cannot insert column within a merged cell")
+        if width is None:
+            width = self._tbl.tblGrid.gridCol_lst[min(idx, col_count - 1)].w
+        gridCol = self._tbl.insert_gridCol(idx, width)
+        self.notify_width_changed()
+        return _Column(gridCol, self)
+
     def notify_width_changed(self):
         """
         Called by a column when its width changes. Pass along to parent.
         """
         self._parent.notify_width_changed()
 
+    @staticmethod
+    def _validate_idx(idx, max_idx):
+        """Raise |IndexError| if *idx* is not in the range 0 to *max_idx*."""
+        if idx < 0 or idx > max_idx:
+            raise IndexError("column index [%d] out of range" % idx)
+
 
 class _RowCollection(Subshape):
     """Sequence of table rows"""
 
+    __slots__ = ("_tbl",)
+
     def __init__(self, tbl, parent):
         super(_RowCollection, self).__init__(parent)
         self._tbl = tbl
@@ -516,8 +655,77 @@ class _RowCollection(Subshape):
         """
         return len(self._tbl.tr_lst)
 
+    def delete(self, idx):
+        """
+        Remove the row at *idx*. The graphic frame shortens by the height of
+        the row. Raises |ValueError| when a cell in the row is part of
+        a merged cell spanning more than one row.
+        """
+        self._validate_idx(idx, len(self) - 1)
+        tr = self._tbl.tr_lst[idx]
+        for tc in tr.tc_lst:
+            if tc.rowSpan > 1 or tc.vMerge:
+                raise ValueError("row contains part of a merged cell")
+        self._tbl.remove(tr)
+        self.notify_height_changed()
+
+    def insert(self, idx, height=None):
+        """
+        Return a new |_Row| inserted at *idx*, moving the row at *idx* and
+        those below it down one place. *idx* can be the row count to add the
+        row at the bottom. Each cell in the new row is empty. *height*
+        defaults to that of the row at *idx*, or of the last row when adding
+        at the bottom, and the graphic frame lengthens to match. Raises
+        |ValueError| when *idx* falls within a merged cell.
+        """
+        tr_lst = self._tbl.tr_lst
+        self._validate_idx(idx, len(tr_lst))
+        if idx < len(tr_lst):
+            for tc in tr_lst[idx].tc_lst:
+                if tc.vMerge:
+                    raise ValueError("cannot insert row within a merged cell")
+        if height is None:
+            height = tr_lst[min(idx, len(tr_lst) - 1)].h
+        tr = self._tbl.insert_tr(idx, height)
+        self.notify_height_changed()
+        return _Row(tr, self)
+
     def notify_height_changed(self):
         """
         Called by a row when its height changes. Pass along to parent.
         """
         self._parent.notify_height_changed()
+
+    @staticmethod
+    def _validate_idx(idx, max_idx):
+        """Raise |IndexError| if *idx* is not in the range 0 to *max_idx*."""
+        if idx < 0 or idx > max_idx:
+            raise IndexError("row index [%d] out of range" % idx)
+
+
+def _cell_text(value, number_format):
+    """
+    Return the str text of a cell containing *value*, formatted using
+    *number_format* when it is not |None| and *value* is not a str.
+    """
+    if _is_missing(value):
+        return ""
+    if is_string(value):
+        return to_unicode(value)
+    if number_format is not None:
+        return format(value, number_format)
+    return "%s" % value
+
+
+def _is_missing(value):
+    """
+    Return |True| if *value* marks a missing value, like |None|, NaN, or
+    pandas `NaT`. pandas `NA` cannot be tested for truth, so any value
+    whose comparison with itself is not a bool is also treated as missing.
+    """
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except TypeError:
+        return True
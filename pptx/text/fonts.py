@@ -8,6 +8,7 @@ from __future__ import absolute_import, print_function
 
 import os
 import sys
+import threading
 
 from struct import calcsize, unpack_from
 
@@ -20,6 +21,7 @@ class FontFiles(object):
     """
 
     _font_files = None
+    _lock = threading.Lock()
 
     @classmethod
     def find(cls, family_name, is_bold, is_italic):
@@ -28,7 +30,9 @@ class FontFiles(object):
         *family_name* and the styles *is_bold* and *is_italic*.
         """
         if cls._font_files is None:
-            cls._font_files = cls._installed_fonts()
+            with cls._lock:
+                if cls._font_files is None:
+                    cls._font_files = cls._installed_fonts()
         return cls._font_files[(family_name, is_bold, is_italic)]
 
     @classmethod
@@ -6,8 +6,12 @@ Objects related to layout of rendered text, such as TextFitter.
 
 from __future__ import absolute_import, print_function
 
+import threading
+
 from PIL import ImageFont
 
+from .. import instrumentation
+
 
 class TextFitter(tuple):
     """
@@ -25,9 +29,10 @@ class TextFitter(tuple):
         *max_size* that allows *text* to fit completely within *extents* when
         rendered using font defined in *font_file*.
         """
-        line_source = _LineSource(text)
-        text_fitter = cls(line_source, extents, font_file)
-        return text_fitter._best_fit_font_size(max_size)
+        with instrumentation.span("TextFitter"):
+            line_source = _LineSource(text)
+            text_fitter = cls(line_source, extents, font_file)
+            return text_fitter._best_fit_font_size(max_size)
 
     def _best_fit_font_size(self, max_size):
         """
@@ -289,18 +294,23 @@ class _Line(tuple):
 
 class _Fonts(object):
     """
-    A memoizing cache for ImageFont objects.
+    A memoizing cache for ImageFont objects, safe to use from more than one
+    thread.
     """
 
     fonts = {}
+    _lock = threading.Lock()
 
     @classmethod
     def font(cls, font_path, point_size):
-        if (font_path, point_size) not in cls.fonts:
-            cls.fonts[(font_path, point_size)] = ImageFont.truetype(
-                font_path, point_size
-            )
-        return cls.fonts[(font_path, point_size)]
+        key = (font_path, point_size)
+        font = cls.fonts.get(key)
+        if font is None:
+            with cls._lock:
+                font = cls.fonts.get(key)
+                if font is None:
+                    font = cls.fonts[key] = ImageFont.truetype(font_path, point_size)
+        return font
 
 
 def _rendered_size(text, point_size, font_file):
@@ -313,7 +323,11 @@ def _rendered_size(text, point_size, font_file):
     px_per_inch = 72.0
 
     font = _Fonts.font(font_file, point_size)
-    px_width, px_height = font.getsize(text)
+    if hasattr(font, "getsize"):
+        px_width, px_height = font.getsize(text)
+    else:
+        # ---Pillow 10 removed getsize(), its result is the bbox right-bottom---
+        _, _, px_width, px_height = font.getbbox(text)
 
     emu_width = int(px_width / px_per_inch * emu_per_inch)
     emu_height = int(px_height / px_per_inch * emu_per_inch)
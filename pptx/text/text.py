@@ -5,12 +5,18 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from pptx.compat import to_unicode
+from pptx.dml.color import ColorFormat
 from pptx.dml.fill import FillFormat
 from pptx.enum.dml import MSO_FILL
 from pptx.enum.lang import MSO_LANGUAGE_ID
-from pptx.enum.text import MSO_AUTO_SIZE, MSO_UNDERLINE
-from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.enum.text import MSO_AUTO_SIZE, MSO_UNDERLINE, PP_ALIGN
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.dml.fill import CT_SolidColorFillProperties
+from pptx.oxml.ns import qn
 from pptx.oxml.simpletypes import ST_TextWrappingType
+from pptx.oxml.text import CT_FontReference
 from pptx.shapes import Subshape
 from pptx.text.fonts import FontFiles
 from pptx.text.layout import TextFitter
@@ -24,6 +30,8 @@ class TextFrame(Subshape):
     child element of ``<p:sp>``. Not intended to be constructed directly.
     """
 
+    __slots__ = ("_element", "_txBody")
+
     def __init__(self, txBody, parent):
         super(TextFrame, self).__init__(parent)
         self._element = self._txBody = txBody
@@ -259,6 +267,64 @@ class TextFrame(Subshape):
             self._parent.height - self.margin_top - self.margin_bottom,
         )
 
+    def _inherited_values(self, level):
+        """
+        Return a `(values, theme_fonts)` 2-tuple for the paragraphs at
+        *level* in this text frame. *values* is a dict of the property values
+        they inherit from outside the text frame, from the shape's style and
+        then from the base placeholders and master text style it inherits
+        from. The part of these that comes from the master and its layouts
+        is computed once for each placeholder and level and is cached on the
+        master part until cleared with :meth:`.clear_style_cache`.
+        """
+        values = {}
+        fontRef = self._txBody.getparent().find(_FONTREF_PATH)
+        if fontRef is not None:
+            _set_default(values, "name", _FONTREF_TYPEFACES.get(fontRef.idx))
+            if fontRef.eg_colorChoice is not None:
+                values["fill"] = fontRef
+
+        master_part = self._master_part
+        if master_part is None:
+            return values, {}
+        cache = master_part.style_cache
+        theme_fonts = cache.get("theme_fonts")
+        if theme_fonts is None:
+            theme_fonts = cache["theme_fonts"] = _theme_fonts(master_part)
+
+        base_placeholders = _base_placeholders(self._parent)
+        style_tag = _text_style_tag(master_part, self._parent)
+        base_element = base_placeholders[0]._element if base_placeholders else None
+        key = ("text", base_element, style_tag, level)
+        inherited_values = cache.get(key)
+        if inherited_values is None:
+            list_styles = [
+                placeholder._element.txBody.lstStyle
+                for placeholder in base_placeholders
+                if placeholder._element.txBody is not None
+            ]
+            list_styles.append(_text_style(master_part, style_tag))
+            inherited_values = cache[key] = {}
+            for lstStyle in list_styles:
+                _add_list_style_values(inherited_values, lstStyle, level)
+
+        for name, value in inherited_values.items():
+            values.setdefault(name, value)
+        return values, theme_fonts
+
+    @property
+    def _master_part(self):
+        """
+        The slide master or notes master part the text in this text frame
+        inherits from, or |None| when there is none, as for text in a chart.
+        A chart object, like a chart title, has no part of its own.
+        """
+        try:
+            part = self.part
+        except AttributeError:
+            return None
+        return getattr(part, "master_part", None)
+
     def _set_font(self, family, size, bold, italic):
         """
         Set the font properties of all the text in this text frame to
@@ -289,9 +355,12 @@ class Font(object):
     ``<a:defRPr>`` in list style elements.
     """
 
-    def __init__(self, rPr):
+    __slots__ = ("_element", "_rPr", "_parent", "_color", "_fill")
+
+    def __init__(self, rPr, parent=None):
         super(Font, self).__init__()
         self._element = self._rPr = rPr
+        self._parent = parent
 
     @property
     def bold(self):
@@ -327,6 +396,18 @@ class Font(object):
         """
         return FillFormat.from_fill_parent(self._rPr)
 
+    @property
+    def effective(self):
+        """
+        |EffectiveFont| object having the character properties the text of
+        this font's run or paragraph appears with, including those inherited
+        from its style hierarchy. Raises |ValueError| for a font not
+        belonging to a run or paragraph, like the font of a chart.
+        """
+        if self._parent is None:
+            raise ValueError("effective font available only for a run or paragraph")
+        return self._parent._effective_font
+
     @property
     def italic(self):
         """
@@ -444,6 +525,8 @@ class _Hyperlink(Subshape):
     element of the run's properties element (``<a:rPr>``).
     """
 
+    __slots__ = ("_rPr",)
+
     def __init__(self, rPr, parent):
         super(_Hyperlink, self).__init__(parent)
         self._rPr = rPr
@@ -483,6 +566,8 @@ class _Hyperlink(Subshape):
 class _Paragraph(Subshape):
     """Paragraph object. Not intended to be constructed directly."""
 
+    __slots__ = ("_element", "_p")
+
     def __init__(self, p, parent):
         super(_Paragraph, self).__init__(parent)
         self._element = self._p = p
@@ -522,6 +607,17 @@ class _Paragraph(Subshape):
             self._element.remove(elm)
         return self
 
+    @property
+    def effective_props(self):
+        """
+        |EffectiveParagraphProperties| object having the properties this
+        paragraph appears with, including those inherited from its style
+        hierarchy, such as the layout and master placeholders it inherits
+        from and the master's text styles.
+        """
+        values, theme_fonts = self._effective_values()
+        return EffectiveParagraphProperties(values, theme_fonts, self.level)
+
     @property
     def font(self):
         """
@@ -531,7 +627,7 @@ class _Paragraph(Subshape):
         contained in and they may be overridden by character properties set at
         the run level.
         """
-        return Font(self._defRPr)
+        return Font(self._defRPr, self)
 
     @property
     def level(self):
@@ -649,6 +745,32 @@ class _Paragraph(Subshape):
         self.clear()
         self._element.append_text(to_unicode(text))
 
+    @property
+    def _effective_font(self):
+        """|EffectiveFont| object for the default font of this paragraph."""
+        values, theme_fonts = self._effective_values()
+        return EffectiveFont(values, theme_fonts)
+
+    def _effective_values(self):
+        """
+        Return a `(values, theme_fonts)` 2-tuple. *values* is a dict mapping
+        the name of each property this paragraph has a value for, directly
+        or by inheritance, to that value, and *theme_fonts* maps theme font
+        references like '+mn-lt' to a typeface.
+        """
+        pPr = self._p.pPr
+        level = 0 if pPr is None else pPr.lvl
+        values = {}
+        if pPr is not None:
+            _add_pPr_values(values, pPr)
+        text_frame = self._parent
+        lstStyle = text_frame._txBody.lstStyle
+        _add_list_style_values(values, lstStyle, level)
+        inherited_values, theme_fonts = text_frame._inherited_values(level)
+        for name, value in inherited_values.items():
+            values.setdefault(name, value)
+        return values, theme_fonts
+
     @property
     def _defRPr(self):
         """
@@ -671,6 +793,8 @@ class _Paragraph(Subshape):
 class _Run(Subshape):
     """Text run object. Corresponds to ``<a:r>`` child element in a paragraph."""
 
+    __slots__ = ("_r", "_hyperlink")
+
     def __init__(self, r, parent):
         super(_Run, self).__init__(parent)
         self._r = r
@@ -685,7 +809,7 @@ class _Run(Subshape):
         the run level are contained in the font object.
         """
         rPr = self._r.get_or_add_rPr()
-        return Font(rPr)
+        return Font(rPr, self)
 
     @lazyproperty
     def hyperlink(self):
@@ -717,3 +841,262 @@ class _Run(Subshape):
     @text.setter
     def text(self, str):
         self._r.text = to_unicode(str)
+
+    @property
+    def _effective_font(self):
+        """|EffectiveFont| object for the text in this run."""
+        values = {}
+        _add_rPr_values(values, self._r.rPr)
+        paragraph_values, theme_fonts = self._parent._effective_values()
+        for name, value in paragraph_values.items():
+            values.setdefault(name, value)
+        return EffectiveFont(values, theme_fonts)
+
+
+class EffectiveFont(object):
+    """
+    Read-only character properties text appears with, each the value found
+    first in its style hierarchy, or the PowerPoint default when the
+    hierarchy has none. Returned by :attr:`Font.effective`.
+    """
+
+    __slots__ = ("_values", "_theme_fonts")
+
+    def __init__(self, values, theme_fonts):
+        super(EffectiveFont, self).__init__()
+        self._values = values
+        self._theme_fonts = theme_fonts
+
+    @property
+    def bold(self):
+        """|True| if the text appears bold, |False| otherwise."""
+        return bool(self._values.get("bold", False))
+
+    @property
+    def color(self):
+        """
+        Read-only |ColorFormat| object for the solid color of the text, or
+        |None| when the text has no solid color, like when it appears in the
+        default text color of the theme.
+        """
+        fill = self._values.get("fill")
+        if not isinstance(fill, (CT_SolidColorFillProperties, CT_FontReference)):
+            return None
+        return ColorFormat.from_colorchoice_parent(fill)
+
+    @property
+    def italic(self):
+        """|True| if the text appears italic, |False| otherwise."""
+        return bool(self._values.get("italic", False))
+
+    @property
+    def name(self):
+        """
+        Typeface name of the text, like 'Calibri'. A theme font reference,
+        like '+mj-lt', is replaced by the typeface the theme defines for it.
+        The minor (body) font of the theme is used when no typeface appears
+        in the style hierarchy. |None| when there is no theme to consult.
+        """
+        name = self._values.get("name", "+mn-lt")
+        if name.startswith("+"):
+            return self._theme_fonts.get(name)
+        return name
+
+    @property
+    def size(self):
+        """|Length| value of the font size of the text, 18pt by default."""
+        return self._values.get("size", Pt(18))
+
+    @property
+    def underline(self):
+        """
+        |True| for single underline, |False| for no underline, or a member of
+        the :ref:`MsoTextUnderlineType` enumeration for any other setting.
+        """
+        u = self._values.get("underline", MSO_UNDERLINE.NONE)
+        if u is MSO_UNDERLINE.NONE:
+            return False
+        if u is MSO_UNDERLINE.SINGLE_LINE:
+            return True
+        return u
+
+
+class EffectiveParagraphProperties(object):
+    """
+    Read-only paragraph properties a paragraph appears with, each the value
+    found first in its style hierarchy, or the PowerPoint default when the
+    hierarchy has none. Returned by :attr:`_Paragraph.effective_props`.
+    """
+
+    __slots__ = ("_values", "_theme_fonts", "_level")
+
+    def __init__(self, values, theme_fonts, level):
+        super(EffectiveParagraphProperties, self).__init__()
+        self._values = values
+        self._theme_fonts = theme_fonts
+        self._level = level
+
+    @property
+    def alignment(self):
+        """Member of :ref:`PpParagraphAlignment`, ``PP_ALIGN.LEFT`` by default."""
+        return self._values.get("alignment", PP_ALIGN.LEFT)
+
+    @property
+    def font(self):
+        """|EffectiveFont| object for the default font of the paragraph."""
+        return EffectiveFont(self._values, self._theme_fonts)
+
+    @property
+    def level(self):
+        """Indentation level of the paragraph, 0 to 8."""
+        return self._level
+
+    @property
+    def line_spacing(self):
+        """
+        Line spacing as a float number of lines or a |Length| value for
+        a fixed spacing, 1.0 by default.
+        """
+        return self._values.get("line_spacing", 1.0)
+
+    @property
+    def space_after(self):
+        """|Length| value of the spacing after the paragraph, 0 by default."""
+        return self._values.get("space_after", Pt(0))
+
+    @property
+    def space_before(self):
+        """|Length| value of the spacing before the paragraph, 0 by default."""
+        return self._values.get("space_before", Pt(0))
+
+
+# ---placeholder types whose text is styled by the master's title style---
+_TITLE_TYPES = frozenset((PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE))
+# ---placeholder types whose text is styled by the master's other style---
+_OTHER_TYPES = frozenset(
+    (
+        PP_PLACEHOLDER.DATE,
+        PP_PLACEHOLDER.FOOTER,
+        PP_PLACEHOLDER.HEADER,
+        PP_PLACEHOLDER.SLIDE_NUMBER,
+    )
+)
+_FONTREF_PATH = "%s/%s" % (qn("p:style"), qn("a:fontRef"))
+_FONTREF_TYPEFACES = {"major": "+mj-lt", "minor": "+mn-lt"}
+
+
+def _add_list_style_values(values, lstStyle, level):
+    """
+    Add to *values* the properties of paragraphs at *level* in *lstStyle*,
+    a list style element, those of its level first and then its defaults.
+    *lstStyle* can be |None|.
+    """
+    if lstStyle is None:
+        return
+    for pPr in (lstStyle.lvl_pPr(level), lstStyle.defPPr):
+        if pPr is not None:
+            _add_pPr_values(values, pPr)
+
+
+def _add_pPr_values(values, pPr):
+    """
+    Add to *values* the paragraph properties in *pPr* and the character
+    properties of its `a:defRPr` child.
+    """
+    _set_default(values, "alignment", pPr.algn)
+    _set_default(values, "line_spacing", pPr.line_spacing)
+    _set_default(values, "space_before", pPr.space_before)
+    _set_default(values, "space_after", pPr.space_after)
+    _add_rPr_values(values, pPr.defRPr)
+
+
+def _add_rPr_values(values, rPr):
+    """Add to *values* the character properties in *rPr*, which can be |None|."""
+    if rPr is None:
+        return
+    if rPr.sz is not None:
+        _set_default(values, "size", Centipoints(rPr.sz))
+    _set_default(values, "bold", rPr.b)
+    _set_default(values, "italic", rPr.i)
+    _set_default(values, "underline", rPr.u)
+    latin = rPr.latin
+    if latin is not None:
+        _set_default(values, "name", latin.typeface)
+    _set_default(values, "fill", rPr.eg_fillProperties)
+
+
+def _base_placeholders(shape):
+    """
+    Return a list of the layout and master placeholders *shape* inherits
+    from, nearest first. The list is empty when *shape* is not
+    a placeholder or has no base placeholder.
+    """
+    base_placeholders = []
+    while True:
+        try:
+            shape = shape._base_placeholder
+        except (AttributeError, KeyError):
+            return base_placeholders
+        if shape is None:
+            return base_placeholders
+        base_placeholders.append(shape)
+
+
+def _set_default(values, name, value):
+    """Set *name* in *values* to *value* unless *value* is |None| or already set."""
+    if value is not None and name not in values:
+        values[name] = value
+
+
+def _text_style(master_part, style_tag):
+    """
+    Return the list style element identified by *style_tag*, a child of
+    `p:txStyles` on a slide master, of the notes master, or of the
+    presentation. Returns |None| when there is no such element.
+    """
+    if style_tag == "p:defaultTextStyle":
+        presentation_elm = master_part.package.presentation_part._element
+        return presentation_elm.find(qn(style_tag))
+    if style_tag == "p:notesStyle":
+        return master_part._element.find(qn(style_tag))
+    return master_part._element.find("%s/%s" % (qn("p:txStyles"), qn(style_tag)))
+
+
+def _text_style_tag(master_part, shape):
+    """
+    Return the tag of the text style *shape* takes its defaults from, like
+    'p:titleStyle' for a title placeholder on a slide.
+    """
+    if master_part.content_type == CT.PML_NOTES_MASTER:
+        return "p:notesStyle"
+    ph = shape._element.ph if getattr(shape, "is_placeholder", False) else None
+    if ph is None:
+        return "p:defaultTextStyle"
+    if ph.type in _TITLE_TYPES:
+        return "p:titleStyle"
+    if ph.type in _OTHER_TYPES:
+        return "p:otherStyle"
+    return "p:bodyStyle"
+
+
+def _theme_fonts(master_part):
+    """
+    Return a dict mapping the theme font references '+mj-lt' and '+mn-lt'
+    to the latin typeface of the major and minor font of the theme of
+    *master_part*. The dict is empty when the master has no theme.
+    """
+    try:
+        theme_part = master_part.part_related_by(RT.THEME)
+    except KeyError:
+        return {}
+    fontScheme = parse_xml(theme_part.blob).find(
+        "%s/%s" % (qn("a:themeElements"), qn("a:fontScheme"))
+    )
+    theme_fonts = {}
+    if fontScheme is None:
+        return theme_fonts
+    for font_tag, font_ref in (("a:majorFont", "+mj-lt"), ("a:minorFont", "+mn-lt")):
+        latin = fontScheme.find("%s/%s" % (qn(font_tag), qn("a:latin")))
+        if latin is not None:
+            theme_fonts[font_ref] = latin.get("typeface")
+    return theme_fonts
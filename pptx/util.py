@@ -4,6 +4,8 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import threading
+
 
 class Length(int):
     """
@@ -123,11 +125,19 @@ class Pt(Length):
         return Length.__new__(cls, emu)
 
 
+# ---guards publishing a lazyproperty value; held only to check and set---
+_lazyproperty_lock = threading.Lock()
+
+
 def lazyproperty(f):
     """
     @lazyprop decorator. Decorated method will be called only on first access
     to calculate a cached property value. After that, the cached value is
     returned.
+
+    When threads race on first access, the method may be called by more than
+    one of them but only the first value cached is ever returned, so all
+    threads see the same object.
     """
     cache_attr_name = "_%s" % f.__name__  # like '_foobar' for prop 'foobar'
     docstring = f.__doc__
@@ -136,8 +146,13 @@ def lazyproperty(f):
         try:
             return getattr(obj, cache_attr_name)
         except AttributeError:
-            value = f(obj)
-            setattr(obj, cache_attr_name, value)
-            return value
+            pass
+        value = f(obj)
+        with _lazyproperty_lock:
+            try:
+                return getattr(obj, cache_attr_name)
+            except AttributeError:
+                setattr(obj, cache_attr_name, value)
+                return value
 
     return property(get_prop_value, doc=docstring)
@@ -38,7 +38,7 @@ AUTHOR = "MEGAZONE SpaceONE Team"
 AUTHOR_EMAIL = "admin@spaceone.dev"
 URL = "http://github.com/spaceone-dev/python-pptx"
 LICENSE = license
-PACKAGES = find_packages(exclude=["tests", "tests.*"])
+PACKAGES = find_packages(exclude=["benchmarks", "tests", "tests.*"])
 PACKAGE_DATA = {"pptx": ["templates/*"]}
 
 INSTALL_REQUIRES = ["lxml>=3.1.0", "Pillow>=3.3.2", "XlsxWriter>=0.5.7"]
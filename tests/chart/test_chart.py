@@ -141,6 +141,64 @@ class DescribeChart(object):
         rewriter_.replace_series_data.assert_called_once_with(chartSpace)
         workbook_.update_from_xlsx_blob.assert_called_once_with(xlsx_blob)
 
+    def it_can_update_selected_values_in_place(self, workbook_, workbook_prop_):
+        chartSpace = element(
+            "c:chartSpace/c:chart/c:plotArea/c:lineChart/c:ser/(c:idx{val=0},c:ord"
+            'er{val=0},c:val/c:numRef/(c:f"Sheet1!$B$2:$B$5",c:numCache/(c:ptCoun'
+            't{val=4},c:pt{idx=0}/c:v"1.0",c:pt{idx=2}/c:v"3.0",c:pt{idx=3}/c:v"4'
+            '.0")))'
+        )
+        chart = Chart(chartSpace, None)
+        values = {1: 2.5, 2: None, 3: 42}
+
+        chart.update_values(0, values)
+
+        assert chartSpace.xml == xml(
+            "c:chartSpace/c:chart/c:plotArea/c:lineChart/c:ser/(c:idx{val=0},c:ord"
+            'er{val=0},c:val/c:numRef/(c:f"Sheet1!$B$2:$B$5",c:numCache/(c:ptCoun'
+            't{val=4},c:pt{idx=0}/c:v"1.0",c:pt{idx=1}/c:v"2.5",c:pt{idx=3}/c:v"4'
+            '2")))'
+        )
+        workbook_.update_values.assert_called_once_with("Sheet1!$B$2:$B$5", values)
+
+    def but_it_raises_on_a_point_index_out_of_range(self, workbook_prop_):
+        chartSpace = element(
+            "c:chartSpace/c:chart/c:plotArea/c:scatterChart/c:ser/(c:idx{val=0},c"
+            ":order{val=0},c:yVal/c:numRef/(c:f,c:numCache/c:ptCount{val=2}))"
+        )
+        chart = Chart(chartSpace, None)
+
+        with pytest.raises(IndexError):
+            chart.update_values(0, {2: 1.0})
+
+    def and_it_updates_literal_values_in_the_chart_xml_only(
+        self, workbook_, workbook_prop_
+    ):
+        chartSpace = element(
+            "c:chartSpace/c:chart/c:plotArea/c:lineChart/c:ser/(c:idx{val=0},c:ord"
+            'er{val=0},c:val/c:numLit/(c:ptCount{val=2},c:pt{idx=0}/c:v"1.0"))'
+        )
+        chart = Chart(chartSpace, None)
+
+        chart.update_values(0, {1: 2.5})
+
+        assert chartSpace.xml == xml(
+            "c:chartSpace/c:chart/c:plotArea/c:lineChart/c:ser/(c:idx{val=0},c:ord"
+            'er{val=0},c:val/c:numLit/(c:ptCount{val=2},c:pt{idx=0}/c:v"1.0",c:'
+            'pt{idx=1}/c:v"2.5"))'
+        )
+        workbook_.update_values.assert_not_called()
+
+    def but_it_raises_when_the_series_has_no_cached_values(self, workbook_prop_):
+        chartSpace = element(
+            "c:chartSpace/c:chart/c:plotArea/c:lineChart/c:ser/(c:idx{val=0},c:ord"
+            'er{val=0},c:val/c:numRef/c:f"Sheet1!$B$2:$B$3")'
+        )
+        chart = Chart(chartSpace, None)
+
+        with pytest.raises(ValueError):
+            chart.update_values(0, {0: 1.0})
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=["c:catAx", "c:dateAx", "c:valAx"])
@@ -6,6 +6,7 @@ Test suite for pptx.chart.data module
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from array import array
 from datetime import date, datetime
 
 import pytest
@@ -30,7 +31,16 @@ from pptx.chart.data import (
 from pptx.chart.xlsx import CategoryWorkbookWriter
 from pptx.enum.base import EnumValue
 
-from ..unitutil.mock import call, class_mock, instance_mock, property_mock
+from ..unitutil.mock import (
+    call,
+    class_mock,
+    function_mock,
+    instance_mock,
+    MagicMock,
+    method_mock,
+    Mock,
+    property_mock,
+)
 
 
 class DescribeChartData(object):
@@ -91,6 +101,17 @@ class Describe_BaseSeriesData(object):
         series_data, expected_value = number_format_fixture
         assert series_data.number_format == expected_value
 
+    def it_knows_the_x_and_y_values_of_its_data_points(self, request):
+        data_points = [XyDataPoint(None, 1, 2, None), XyDataPoint(None, 3, 4, None)]
+        method_mock(request, _BaseSeriesData, "__len__", return_value=2)
+        method_mock(
+            request, _BaseSeriesData, "_data_point", side_effect=data_points * 2
+        )
+        series_data = _BaseSeriesData(None, None, None)
+
+        assert series_data.x_values == [1, 3]
+        assert series_data.y_values == [2, 4]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[("Tincture of Foo", "Tincture of Foo"), (None, "")])
@@ -161,13 +182,23 @@ class DescribeCategoryChartData(object):
 
     def it_can_add_a_series(self, add_ser_fixture):
         chart_data, name, values, number_format = add_ser_fixture[:4]
-        CategorySeriesData_, calls, series_ = add_ser_fixture[4:]
+        CategorySeriesData_, series_ = add_ser_fixture[4:]
         series = chart_data.add_series(name, values, number_format)
-        CategorySeriesData_.assert_called_once_with(chart_data, name, number_format)
+        CategorySeriesData_.assert_called_once_with(
+            chart_data, name, number_format, values
+        )
         assert chart_data[-1] is series
-        assert series.add_data_point.call_args_list == calls
         assert series is series_
 
+    def it_can_be_constructed_from_a_dataframe(self, dataframe_):
+        chart_data = CategoryChartData.from_dataframe(dataframe_, "0.0")
+
+        assert chart_data.number_format == "0.0"
+        assert [c.label for c in chart_data.categories] == ["a", "b", "c"]
+        assert [s.name for s in chart_data] == ["1999", "2000"]
+        assert chart_data[0].values == [1.0, None, 3.0]
+        assert chart_data[1].values == [4.0, 5.0, 6.0]
+
     def it_can_set_its_categories(self, categories_set_fixture):
         chart_data, names, Categories_, categories_, calls = categories_set_fixture
         chart_data.categories = names
@@ -188,16 +219,23 @@ class DescribeCategoryChartData(object):
     def add_ser_fixture(self, CategorySeriesData_, series_):
         chart_data = CategoryChartData()
         name, values, number_format = "foobar", iter((1, 2, 3)), "0.0"
-        calls = [call(1), call(2), call(3)]
-        return (
-            chart_data,
-            name,
-            values,
-            number_format,
-            CategorySeriesData_,
-            calls,
-            series_,
-        )
+        return (chart_data, name, values, number_format, CategorySeriesData_, series_)
+
+    @pytest.fixture
+    def dataframe_(self, request):
+        columns = {
+            1999: Mock(
+                name="col_1999",
+                **{"to_numpy.return_value": array("d", [1, float("nan"), 3])}
+            ),
+            2000: Mock(
+                name="col_2000", **{"to_numpy.return_value": array("d", [4, 5, 6])}
+            ),
+        }
+        dataframe_ = MagicMock(name="dataframe", columns=[1999, 2000])
+        dataframe_.index.tolist.return_value = ["a", "b", "c"]
+        dataframe_.__getitem__.side_effect = columns.__getitem__
+        return dataframe_
 
     @pytest.fixture
     def categories_fixture(self, Categories_, categories_):
@@ -639,6 +677,13 @@ class DescribeCategorySeriesData(object):
         series_data, expected_values = values_fixture
         assert series_data.values == expected_values
 
+    def it_returns_a_copy_of_its_values(self):
+        series_data = CategorySeriesData(None, None, None, [1, 2])
+
+        series_data.values.append(3)
+
+        assert series_data.values == [1, 2]
+
     def it_knows_its_values_range_ref(self, values_ref_fixture):
         series_data, chart_data_, values_ref_ = values_ref_fixture
         values_ref = series_data.values_ref
@@ -657,6 +702,14 @@ class DescribeCategorySeriesData(object):
         assert series_data[-1] is data_point_
         assert data_point is data_point_
 
+    def it_can_append_a_data_point(self):
+        series_data = CategorySeriesData(None, None, "0.0", array("d", [1]))
+
+        series_data.append(CategoryDataPoint(None, 2, "0.00"))
+
+        assert series_data.values == [1.0, 2]
+        assert [dp.number_format for dp in series_data] == ["0.0", "0.00"]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -678,14 +731,15 @@ class DescribeCategorySeriesData(object):
         chart_data_.categories_ref = categories_ref
         return series_data, expected_value
 
-    @pytest.fixture
+    @pytest.fixture(
+        params=[
+            ([1, 2, 3], [1, 2, 3]),
+            (array("d", [1.5, float("nan"), 3]), [1.5, None, 3.0]),
+        ]
+    )
     def values_fixture(self, request):
-        series_data = CategorySeriesData(None, None, None)
-        expected_values = [1, 2, 3]
-        for value in expected_values:
-            series_data._data_points.append(
-                instance_mock(request, CategoryDataPoint, value=value)
-            )
+        values, expected_values = request.param
+        series_data = CategorySeriesData(None, None, None, values)
         return series_data, expected_values
 
     @pytest.fixture
@@ -724,6 +778,17 @@ class DescribeBubbleChartData(object):
         assert chart_data[-1] is series_data_
         assert series_data is series_data_
 
+    def it_can_add_a_series_from_arrays(self):
+        chart_data = BubbleChartData()
+        sizes = array("d", [5, 6])
+
+        series_data = chart_data.add_series_arrays("S1", [1, 2], [3, 4], sizes)
+
+        assert chart_data[-1] is series_data
+        assert series_data._bubble_sizes is sizes
+        assert series_data.bubble_sizes == [5.0, 6.0]
+        assert [dp.bubble_size for dp in series_data] == [5.0, 6.0]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -756,6 +821,22 @@ class DescribeXyChartData(object):
         assert chart_data[-1] is series_data_
         assert series_data is series_data_
 
+    def it_can_add_a_series_from_arrays(self):
+        chart_data = XyChartData()
+        x_values, y_values = array("d", [1, 2]), array("d", [3, float("nan")])
+
+        series_data = chart_data.add_series_arrays("S1", x_values, y_values)
+
+        assert chart_data[-1] is series_data
+        assert series_data._x_values is x_values
+        assert series_data._y_values is y_values
+        assert series_data.x_values == [1.0, 2.0]
+        assert series_data.y_values == [3.0, None]
+
+    def but_it_raises_when_the_arrays_differ_in_length(self):
+        with pytest.raises(ValueError):
+            XyChartData().add_series_arrays("S1", [1, 2, 3], [4, 5])
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -785,6 +866,16 @@ class DescribeBubbleSeriesData(object):
         assert series_data[-1] is data_point_
         assert data_point is data_point_
 
+    def it_can_append_a_data_point(self):
+        series_data = BubbleSeriesData(None, None, None, [1], [2], [3])
+
+        series_data.append(BubbleDataPoint(None, 4, 5, 6, "0.0"))
+
+        assert series_data.x_values == [1, 4]
+        assert series_data.y_values == [2, 5]
+        assert series_data.bubble_sizes == [3, 6]
+        assert series_data[-1].number_format == "0.0"
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -822,6 +913,72 @@ class DescribeXySeriesData(object):
         assert series_data[-1] is data_point_
         assert data_point is data_point_
 
+    def it_can_downsample_its_data_points(self):
+        series_data = XySeriesData(
+            None, None, None, range(9), [0, 0, 0, 0, 9, 0, 0, 0, 0]
+        )
+        series_data.add_data_point(9, None)
+
+        series_data.downsample(3)
+
+        assert series_data.x_values == [0, 4, 8]
+        assert series_data.y_values == [0, 9, 0]
+        assert series_data.worksheet_point_count == 3
+        assert series_data.worksheet_y_values == [0, 9, 0]
+
+    def it_counts_worksheet_points_without_copying_the_values(self, request):
+        _values_ = function_mock(request, "pptx.chart.data._values")
+        series_data = XySeriesData(None, None, None, range(4), array("d", range(4)))
+
+        assert series_data.worksheet_point_count == 4
+        _values_.assert_not_called()
+
+    def it_can_keep_full_resolution_in_the_worksheet(self):
+        series_data = BubbleSeriesData(None, None, None, range(6), range(6), range(6))
+
+        series_data.downsample(2, "min_max", keep_full_resolution=True)
+
+        assert len(series_data) == 2
+        assert series_data.bubble_sizes == [0, 5]
+        assert series_data.worksheet_point_count == 6
+        assert series_data.worksheet_x_values == [0, 1, 2, 3, 4, 5]
+        assert series_data.worksheet_bubble_sizes == [0, 1, 2, 3, 4, 5]
+
+    def but_it_raises_on_an_unsupported_downsampling_method(self):
+        with pytest.raises(ValueError):
+            XySeriesData(None, None, None).downsample(3, "median")
+
+    def it_provides_access_to_its_data_points(self):
+        series_data = XySeriesData(None, None, "0.0", array("d", [1, 2]), [3, 4])
+        series_data.add_data_point(5, 6, "0.00")
+
+        assert len(series_data) == 3
+        assert series_data.x_values == [1.0, 2.0, 5]
+        assert [(dp.x, dp.y) for dp in series_data] == [(1.0, 3), (2.0, 4), (5, 6)]
+        assert [dp.number_format for dp in series_data[-2:]] == ["0.0", "0.00"]
+        with pytest.raises(IndexError):
+            series_data[3]
+
+    def it_can_append_a_data_point(self):
+        series_data = XySeriesData(None, None, None, array("d", [1]), [2])
+
+        series_data.append(XyDataPoint(None, 3, 4, "0.0"))
+
+        assert series_data.x_values == [1.0, 3]
+        assert series_data.y_values == [2, 4]
+        assert series_data[-1].number_format == "0.0"
+
+    def it_returns_copies_of_its_values(self):
+        series_data = XySeriesData(None, None, None, [1], [2])
+
+        series_data.x_values.append(3)
+        series_data.y_values.append(4)
+        series_data.worksheet_y_values.append(5)
+
+        assert series_data.x_values == [1]
+        assert series_data.y_values == [2]
+        assert series_data.worksheet_y_values == [2]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -880,6 +1037,10 @@ class DescribeXyDataPoint(object):
         assert data_point._series_data is series_data_
         assert data_point.number_format == "00.0"
 
+    def it_does_not_carry_an_instance_dict(self, series_data_):
+        data_point = BubbleDataPoint(series_data_, 42, 24, 3, None)
+        assert not hasattr(data_point, "__dict__")
+
     def it_knows_its_x_y_values(self, value_fixture):
         data_point, x, y = value_fixture
         assert data_point.x == x
@@ -0,0 +1,56 @@
+# encoding: utf-8
+
+"""Unit-test suite for `pptx.chart.downsample` module."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+
+import pytest
+
+from pptx.chart.downsample import lttb, min_max
+
+
+class Describe_lttb(object):
+    def it_keeps_the_points_that_define_the_shape_of_the_line(self):
+        x_values = list(range(9))
+        y_values = [0, 0, 0, 0, 10, 0, 0, 0, 0]
+        assert lttb(x_values, y_values, 3) == [0, 4, 8]
+
+    def it_keeps_the_first_and_last_point(self):
+        x_values = list(range(100))
+        y_values = [(i * 37) % 11 for i in x_values]
+
+        idxs = lttb(x_values, y_values, 10)
+
+        assert len(idxs) == 10
+        assert idxs[0] == 0
+        assert idxs[-1] == 99
+        assert idxs == sorted(set(idxs))
+
+    @pytest.mark.parametrize(
+        "start", (datetime.date(2020, 1, 1), datetime.datetime(2020, 1, 1, 12))
+    )
+    def it_can_downsample_date_x_values(self, start):
+        x_values = [start + datetime.timedelta(days=idx) for idx in range(9)]
+        y_values = [0, 0, 0, 0, 10, 0, 0, 0, 0]
+        assert lttb(x_values, y_values, 3) == [0, 4, 8]
+
+    def it_keeps_every_point_when_there_are_not_too_many(self):
+        assert lttb([1, 2, 3], [4, 5, 6], 3) == [0, 1, 2]
+
+    def it_raises_on_a_point_count_too_small(self):
+        with pytest.raises(ValueError):
+            lttb(list(range(10)), list(range(10)), 2)
+
+
+class Describe_min_max(object):
+    def it_keeps_the_extremes_of_each_bucket(self):
+        y_values = [3, 9, 1, 4, 4, 0, 7, 2]
+        assert min_max(list(range(8)), y_values, 4) == [1, 2, 5, 6]
+
+    def it_keeps_a_single_point_for_a_flat_bucket(self):
+        assert min_max(list(range(4)), [5, 5, 5, 5], 2) == [0]
+
+    def it_keeps_every_point_when_there_are_not_too_many(self):
+        assert min_max([1, 2], [4, 5], 5) == [0, 1]
@@ -12,6 +12,7 @@ from pptx.chart.datalabel import DataLabel
 from pptx.chart.marker import Marker
 from pptx.chart.point import BubblePoints, CategoryPoints, Point, XyPoints
 from pptx.dml.chtfmt import ChartFormat
+from pptx.dml.color import RGBColor
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.mock import class_mock, instance_mock
@@ -36,6 +37,41 @@ class Describe_BasePoints(object):
         with pytest.raises(IndexError):
             points[3]
 
+    def it_can_fill_many_points_at_once(self):
+        ser = element(
+            "c:ser/(c:idx{val=0},c:order{val=0},c:dPt/c:idx{val=2},c:cat/c:numRe"
+            "f/c:numCache/c:ptCount{val=4})"
+        )
+        points = CategoryPoints(ser)
+
+        points.format_many((3, 0, 2), fill_rgb=RGBColor(0xFF, 0x00, 0x00))
+
+        assert [dPt.idx.val for dPt in ser.dPt_lst] == [0, 2, 3]
+        assert ser.xpath("c:dPt/c:spPr/a:solidFill/a:srgbClr/@val") == ["FF0000"] * 3
+
+    def it_can_label_many_points_at_once(self):
+        ser = element(
+            "c:ser/(c:idx{val=0},c:order{val=0},c:dLbls/(c:dLbl/(c:idx{val=1},c:"
+            "showVal{val=1}),c:showVal{val=1}),c:cat/c:numRef/c:numCache/c:ptCo"
+            "unt{val=3})"
+        )
+        points = CategoryPoints(ser)
+
+        points.format_many([2, 0], label_text=["two", "zero"])
+
+        dLbls = ser.dLbls
+        assert [dLbl.idx_val for dLbl in dLbls.dLbl_lst] == [0, 1, 2]
+        assert [
+            "".join(dLbl.xpath("c:tx/c:rich//a:t/text()")) for dLbl in dLbls.dLbl_lst
+        ] == ["zero", "", "two"]
+
+    def but_it_raises_when_a_point_index_is_out_of_range(self):
+        points = CategoryPoints(
+            element("c:ser/c:cat/c:numRef/c:numCache/c:ptCount{val=2}")
+        )
+        with pytest.raises(IndexError):
+            points.format_many([0, 2], label_text="x")
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -0,0 +1,95 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.chart.prototype module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from pptx.chart.chart import Chart
+from pptx.chart.data import CategoryChartData
+from pptx.chart.prototype import ChartPrototype
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import _Relationship
+from pptx.oxml import parse_xml
+from pptx.parts.chart import ChartPart
+
+from ..unitutil.mock import instance_mock
+
+
+class DescribeChartPrototype(object):
+    def it_can_construct_from_chart_data(self, chart_data):
+        chart_type = XL_CHART_TYPE.BAR_CLUSTERED
+
+        prototype = ChartPrototype.from_chart_data(chart_type, chart_data)
+
+        assert prototype.chart_type == chart_type
+        assert (
+            prototype._chartSpace.xml == parse_xml(chart_data.xml_bytes(chart_type)).xml
+        )
+        assert prototype.rels == ()
+
+    def it_can_construct_from_an_existing_chart(self, request, chart_data):
+        chart_type = XL_CHART_TYPE.PIE
+        chart_part_ = instance_mock(request, ChartPart)
+        chart_part_.blob = chart_data.xml_bytes(chart_type)
+        shapes_rel_ = instance_mock(
+            request, _Relationship, reltype=RT.CHART_USER_SHAPES
+        )
+        xlsx_rel_ = instance_mock(request, _Relationship, reltype=RT.PACKAGE)
+        chart_part_.rels = {"rId1": xlsx_rel_, "rId2": shapes_rel_}
+        chart_ = instance_mock(request, Chart, chart_type=chart_type)
+        chart_.part = chart_part_
+
+        prototype = ChartPrototype.from_chart(chart_)
+
+        assert prototype.chart_type == chart_type
+        assert prototype._chartSpace.xml == parse_xml(chart_part_.blob).xml
+        assert prototype.rels == (shapes_rel_,)
+
+    def it_can_stamp_a_new_chartSpace_with_other_data(self, chart_data):
+        chart_type = XL_CHART_TYPE.COLUMN_CLUSTERED
+        chartSpace = parse_xml(chart_data.xml_bytes(chart_type))
+        chartSpace.get_or_add_externalData().rId = "rId1"
+        chartSpace.plotArea.sers[0].get_or_add_spPr()
+        prototype = ChartPrototype(chart_type, chartSpace)
+        new_data = CategoryChartData()
+        new_data.categories = ("x", "y", "z")
+        new_data.add_series("Apples", (4, 5, 6))
+        new_data.add_series("Pears", (7, 8, 9))
+        new_data.add_series("Plums", (1, 2, 3))
+
+        new_chartSpace = prototype.new_chartSpace(new_data)
+
+        assert new_chartSpace is not chartSpace
+        assert new_chartSpace.externalData is None
+        assert chartSpace.externalData is not None
+        sers = new_chartSpace.plotArea.sers
+        assert len(sers) == 3
+        assert all(ser.spPr is not None for ser in sers)
+        assert [ser.xpath("./c:tx//c:v")[0].text for ser in sers] == [
+            "Apples",
+            "Pears",
+            "Plums",
+        ]
+        assert [pt.text for pt in sers[2].xpath("./c:cat//c:v")] == ["x", "y", "z"]
+        assert [pt.text for pt in sers[2].xpath("./c:val//c:v")] == ["1", "2", "3"]
+        assert sers[0].cat is not sers[1].cat
+        assert len(chartSpace.plotArea.sers) == 1
+
+    def it_provides_access_to_its_rels(self, request):
+        rels = (instance_mock(request, _Relationship),)
+        prototype = ChartPrototype(None, None, rels)
+        assert prototype.rels == rels
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def chart_data(self):
+        chart_data = CategoryChartData()
+        chart_data.categories = ("a", "b")
+        chart_data.add_series("Series 1", (1, 2))
+        return chart_data
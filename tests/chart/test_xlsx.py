@@ -6,8 +6,11 @@ Test suite for pptx.chart.xlsx module
 
 from __future__ import absolute_import, print_function
 
+from zipfile import ZipFile
+
 import pytest
 
+from lxml import etree
 from xlsxwriter import Workbook
 from xlsxwriter.worksheet import Worksheet
 
@@ -22,6 +25,7 @@ from pptx.chart.xlsx import (
     _BaseWorkbookWriter,
     BubbleWorkbookWriter,
     CategoryWorkbookWriter,
+    WorksheetCellUpdater,
     XyWorkbookWriter,
 )
 from pptx.compat import BytesIO
@@ -429,6 +433,16 @@ class DescribeXyWorkbookWriter(object):
         workbook_writer._populate_worksheet(workbook_, worksheet_)
         assert worksheet_.mock_calls == expected_calls
 
+    def it_lays_out_full_resolution_data_for_a_downsampled_series(self):
+        chart_data = XyChartData()
+        series_1 = chart_data.add_series_arrays("Series 1", range(5), range(5))
+        series_1.downsample(3, keep_full_resolution=True)
+        series_2 = chart_data.add_series_arrays("Series 2", (1, 2), (3, 4))
+        workbook_writer = XyWorkbookWriter(chart_data)
+
+        assert workbook_writer.x_values_ref(series_1) == "Sheet1!$A$2:$A$6"
+        assert workbook_writer.y_values_ref(series_2) == "Sheet1!$B$9:$B$10"
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -510,3 +524,67 @@ class DescribeXyWorkbookWriter(object):
         xlsx_file_ = instance_mock(request, BytesIO)
         xlsx_file_.getvalue.return_value = xlsx_blob_
         return xlsx_file_
+
+
+class DescribeWorksheetCellUpdater(object):
+    def it_knows_the_origin_of_a_range(self):
+        range_origin = WorksheetCellUpdater.range_origin
+        assert range_origin("Sheet1!$B$2:$B$9") == ("Sheet1", "B", 2)
+        assert range_origin("'My Sheet'!$AA$10") == ("My Sheet", "AA", 10)
+
+    def it_can_update_cell_values(self):
+        chart_data = XyChartData()
+        chart_data.add_series_arrays("Series 1", (1, 2), (3, 4))
+        xlsx_blob = XyWorkbookWriter(chart_data).xlsx_blob
+
+        xlsx_blob = WorksheetCellUpdater(xlsx_blob).update(
+            "Sheet1", {"B2": 42.5, "B3": None, "D3": 7, "A5": 9}
+        )
+
+        with ZipFile(BytesIO(xlsx_blob)) as zipf:
+            sheet = etree.fromstring(zipf.read("xl/worksheets/sheet1.xml"))
+        cells = [
+            (c.get("r"), c.findtext("{%s}v" % sheet.nsmap[None]))
+            for c in sheet.iter("{%s}c" % sheet.nsmap[None])
+        ]
+        assert cells == [
+            ("B1", "0"),
+            ("A2", "1"),
+            ("B2", "42.5"),
+            ("A3", "2"),
+            ("B3", None),
+            ("D3", "7"),
+            ("A5", "9"),
+        ]
+
+    def it_does_not_resolve_entities_in_the_workbook(self, tmpdir):
+        secret_path = tmpdir.join("secret.txt")
+        secret_path.write("SECRET")
+        xlsx_blob = XyWorkbookWriter(XyChartData()).xlsx_blob
+        with ZipFile(BytesIO(xlsx_blob)) as zipf:
+            members = dict((name, zipf.read(name)) for name in zipf.namelist())
+        sheet_xml = members["xl/worksheets/sheet1.xml"].decode("utf-8")
+        doctype = '<!DOCTYPE worksheet [<!ENTITY xxe SYSTEM "file://%s">]>' % (
+            secret_path
+        )
+        members["xl/worksheets/sheet1.xml"] = (
+            sheet_xml.replace("?>", "?>" + doctype, 1)
+            .replace("<sheetData/>", "<sheetData/><headerFooter>&xxe;</headerFooter>")
+            .encode("utf-8")
+        )
+        xlsx_file = BytesIO()
+        with ZipFile(xlsx_file, "w") as zipf:
+            for name, blob in members.items():
+                zipf.writestr(name, blob)
+
+        xlsx_blob = WorksheetCellUpdater(xlsx_file.getvalue()).update(
+            "Sheet1", {"A1": 1}
+        )
+
+        with ZipFile(BytesIO(xlsx_blob)) as zipf:
+            assert b"SECRET" not in zipf.read("xl/worksheets/sheet1.xml")
+
+    def but_it_raises_on_an_unknown_sheet_name(self):
+        xlsx_blob = XyWorkbookWriter(XyChartData()).xlsx_blob
+        with pytest.raises(KeyError):
+            WorksheetCellUpdater(xlsx_blob).update("Sheet9", {"A1": 1})
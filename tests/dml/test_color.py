@@ -8,8 +8,10 @@ from __future__ import absolute_import
 
 import pytest
 
-from pptx.dml.color import ColorFormat, RGBColor
+from pptx.dml.color import ColorFormat, RGBColor, ThemeColors
 from pptx.enum.dml import MSO_COLOR_TYPE, MSO_THEME_COLOR
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 
 from ..oxml.unitdata.dml import (
     a_lumMod,
@@ -22,6 +24,7 @@ from ..oxml.unitdata.dml import (
     an_scrgbClr,
     an_srgbClr,
 )
+from ..unitutil.cxml import element
 
 
 class DescribeColorFormat(object):
@@ -290,3 +293,62 @@ class DescribeRGBColor(object):
 
     def it_can_provide_a_hex_string_rgb_value(self):
         assert str(RGBColor(0x12, 0x34, 0x56)) == "123456"
+
+
+class DescribeThemeColors(object):
+    @pytest.mark.parametrize(
+        ("color_cxml", "expected_value"),
+        (
+            ("a:solidFill/a:schemeClr{val=accent1}", "4F81BD"),
+            ("a:solidFill/a:schemeClr{val=tx1}", "000000"),
+            ("a:solidFill/a:schemeClr{val=bg1}", "FFFFFF"),
+            ("a:solidFill/a:schemeClr{val=lt1}", "FFFFFF"),
+            ("a:solidFill/a:schemeClr{val=accent1}/a:lumMod{val=75000}", "376092"),
+            (
+                "a:solidFill/a:schemeClr{val=accent1}/(a:lumMod{val=60000},a:lumOff"
+                "{val=40000})",
+                "95B3D7",
+            ),
+            ("a:solidFill/a:schemeClr{val=bg1}/a:shade{val=50000}", "BCBCBC"),
+            ("a:solidFill/a:schemeClr{val=tx1}/a:tint{val=50000}", "BCBCBC"),
+            ("a:solidFill/a:srgbClr{val=123456}", "123456"),
+            ("a:solidFill/a:sysClr{val=windowText,lastClr=000000}", "000000"),
+            ("a:solidFill/a:schemeClr{val=hlink}", None),
+            ("a:solidFill/a:prstClr{val=red}", None),
+            ("a:solidFill", None),
+        ),
+    )
+    def it_resolves_the_RGB_value_of_a_color(self, color_cxml, expected_value):
+        color_format = ColorFormat.from_colorchoice_parent(element(color_cxml))
+        theme_colors = ThemeColors.from_elements(
+            parse_xml(
+                '<a:clrScheme %s><a:dk1><a:sysClr val="windowText" lastClr="000000"/>'
+                '</a:dk1><a:lt1><a:sysClr val="window" lastClr="FFFFFF"/></a:lt1><a:ac'
+                'cent1><a:srgbClr val="4F81BD"/></a:accent1></a:clrScheme>'
+                % nsdecls("a")
+            ),
+            parse_xml('<p:clrMap %s bg1="lt1" tx1="dk1"/>' % nsdecls("p")),
+        )
+
+        rgb = theme_colors.rgb(color_format)
+
+        expected_rgb = (
+            None if expected_value is None else RGBColor.from_string(expected_value)
+        )
+        assert rgb == expected_rgb
+
+    def it_can_map_its_colors_differently(self):
+        theme_colors = ThemeColors(
+            {"dk1": RGBColor(0, 0, 0), "lt1": RGBColor(255, 255, 255)},
+            {"bg1": "lt1"},
+        )
+        color_format = ColorFormat.from_colorchoice_parent(
+            element("a:solidFill/a:schemeClr{val=bg1}")
+        )
+
+        remapped = theme_colors.remapped(
+            parse_xml('<a:overrideClrMapping %s bg1="dk1"/>' % nsdecls("a"))
+        )
+
+        assert theme_colors.rgb(color_format) == RGBColor(255, 255, 255)
+        assert remapped.rgb(color_format) == RGBColor(0, 0, 0)
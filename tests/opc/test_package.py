@@ -6,8 +6,11 @@ Test suite for pptx.opc.package module
 
 from __future__ import absolute_import
 
+from zipfile import ZipFile
+
 import pytest
 
+from pptx.compat import BytesIO
 from pptx.opc.oxml import CT_Relationships
 from pptx.opc.packuri import PACKAGE_URI, PackURI
 from pptx.opc.package import (
@@ -24,6 +27,7 @@ from pptx.oxml.xmlchemy import BaseOxmlElement
 from pptx.package import Package
 
 from ..unitutil.cxml import element
+from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import (
     call,
     class_mock,
@@ -47,10 +51,81 @@ class DescribeOpcPackage(object):
         # exercise ---------------------
         pkg = OpcPackage.open(pkg_file)
         # verify -----------------------
-        PackageReader_.from_file.assert_called_once_with(pkg_file)
-        Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg, PartFactory_)
+        PackageReader_.from_file.assert_called_once_with(pkg_file, prune=None)
+        Unmarshaller_.unmarshal.assert_called_once_with(
+            pkg_reader, pkg, PartFactory_, None
+        )
         assert isinstance(pkg, OpcPackage)
 
+    def it_can_open_a_pkg_file_using_threads(
+        self, request, PackageReader_, PartFactory_, Unmarshaller_
+    ):
+        ThreadPool_ = class_mock(request, "pptx.opc.package.ThreadPool")
+        pool_ = ThreadPool_.return_value
+        pkg_file = Mock(name="pkg_file")
+        pkg_reader = PackageReader_.from_file.return_value
+
+        pkg = OpcPackage.open(pkg_file, workers=4)
+
+        ThreadPool_.assert_called_once_with(4)
+        PackageReader_.from_file.assert_called_once_with(pkg_file, pool_, None)
+        Unmarshaller_.unmarshal.assert_called_once_with(
+            pkg_reader, pkg, PartFactory_, pool_
+        )
+        pool_.close.assert_called_once_with()
+        pool_.join.assert_called_once_with()
+        assert isinstance(pkg, OpcPackage)
+
+    def it_loads_the_same_parts_using_threads_as_without(self):
+        pkg_path = absjoin(test_file_dir, "test.pptx")
+
+        serial_pkg = Package.open(pkg_path)
+        threaded_pkg = Package.open(pkg_path, workers=4)
+
+        assert [
+            (part.partname, part.content_type, part.blob, sorted(part.rels))
+            for part in threaded_pkg.iter_parts()
+        ] == [
+            (part.partname, part.content_type, part.blob, sorted(part.rels))
+            for part in serial_pkg.iter_parts()
+        ]
+
+    def it_can_open_with_parts_pruned_from_the_load(self):
+        pkg_path = absjoin(test_file_dir, "test.pptx")
+        slide_partname = PackURI("/ppt/slides/slide1.xml")
+        prune_ = Mock(name="prune_", return_value=set([slide_partname]))
+
+        pkg = OpcPackage.open(pkg_path, prune=prune_)
+
+        parts = dict((part.partname, part) for part in pkg.iter_parts())
+        assert type(parts[slide_partname]) is Part
+        assert len(parts[slide_partname].rels) == 0
+        assert isinstance(parts["/ppt/presentation.xml"], XmlPart)
+        assert isinstance(parts["/ppt/slideLayouts/slideLayout1.xml"], XmlPart)
+        assert "/ppt/slides/_rels/slide1.xml.rels" in set(pkg.iter_partnames())
+
+    def it_saves_the_pruned_parts_unchanged(self):
+        pkg_path = absjoin(test_file_dir, "test.pptx")
+        slide_partname = PackURI("/ppt/slides/slide1.xml")
+        pkg = OpcPackage.open(
+            pkg_path, prune=lambda phys_reader, pkg_srels: set([slide_partname])
+        )
+        stream = BytesIO()
+
+        pkg.save(stream)
+
+        original = ZipFile(pkg_path)
+        saved = ZipFile(stream)
+        for membername in (
+            "ppt/slides/slide1.xml",
+            "ppt/slides/_rels/slide1.xml.rels",
+        ):
+            assert saved.read(membername) == original.read(membername)
+        saved_pkg = OpcPackage.open(stream)
+        assert sorted(p.partname for p in saved_pkg.iter_parts()) == sorted(
+            p.partname for p in OpcPackage.open(pkg_path).iter_parts()
+        )
+
     def it_initializes_its_rels_collection_on_first_reference(
         self, RelationshipCollection_
     ):
@@ -108,7 +183,7 @@ class DescribeOpcPackage(object):
         pkg.save(pkg_file_)
         for part in parts_:
             part.before_marshal.assert_called_once_with()
-        PackageWriter_.write.assert_called_once_with(pkg_file_, pkg._rels, parts_)
+        PackageWriter_.write.assert_called_once_with(pkg_file_, pkg._rels, parts_, ())
 
     def it_can_be_notified_after_unmarshalling_is_complete(self, pkg):
         pkg.after_unmarshal()
@@ -702,6 +777,10 @@ class Describe_Relationship(object):
         assert rel.target_part == target
         assert rel.is_external == external
 
+    def it_does_not_carry_an_instance_dict(self):
+        rel = _Relationship("rId1", "reltype", None, None, external=True)
+        assert not hasattr(rel, "__dict__")
+
     def it_should_raise_on_target_part_access_on_external_rel(self):
         rel = _Relationship(None, None, None, None, external=True)
         with pytest.raises(ValueError):
@@ -753,6 +832,16 @@ class DescribeRelationshipCollection(object):
         assert rels[rId] == rel
         assert rel == _Relationship_.return_value
 
+    def it_can_add_several_relationships_at_once(self):
+        rels = RelationshipCollection("/ppt")
+        rels.add_relationship("reltype", "target", "rId2")
+        parts = [Mock(name="part%d" % idx) for idx in range(3)]
+
+        rIds = rels.add_relationships("reltype", parts)
+
+        assert rIds == ["rId1", "rId3", "rId4"]
+        assert [rels[rId].target_part for rId in rIds] == parts
+
     def it_can_add_an_external_relationship(self, add_ext_rel_fixture_):
         rels, reltype, url = add_ext_rel_fixture_
         rId = rels.get_or_add_ext_rel(reltype, url)
@@ -864,6 +953,27 @@ class DescribeUnmarshaller(object):
             part.after_unmarshal.assert_called_once_with()
         pkg_.after_unmarshal.assert_called_once_with()
 
+    def it_unmarshals_parts_concurrently_when_given_a_pool(
+        self, request, pkg_reader_, pkg_, part_factory_, parts_dict_
+    ):
+        _unmarshal_parts_concurrently = method_mock(
+            request,
+            Unmarshaller,
+            "_unmarshal_parts_concurrently",
+            return_value=parts_dict_,
+        )
+        _unmarshal_relationships = method_mock(
+            request, Unmarshaller, "_unmarshal_relationships"
+        )
+        pool_ = Mock(name="pool_")
+
+        Unmarshaller.unmarshal(pkg_reader_, pkg_, part_factory_, pool_)
+
+        _unmarshal_parts_concurrently.assert_called_once_with(
+            pkg_reader_, pkg_, part_factory_, pool_
+        )
+        _unmarshal_relationships.assert_called_once_with(pkg_reader_, pkg_, parts_dict_)
+
     def it_can_unmarshal_parts(
         self,
         pkg_reader_,
@@ -887,6 +997,32 @@ class DescribeUnmarshaller(object):
         ]
         assert parts == parts_dict_
 
+    def it_can_unmarshal_parts_using_a_thread_pool(
+        self,
+        pkg_reader_,
+        pkg_,
+        part_factory_,
+        parts_dict_,
+        partnames_,
+        content_types_,
+        blobs_,
+    ):
+        partname_, partname_2_ = partnames_
+        content_type_, content_type_2_ = content_types_
+        blob_, blob_2_ = blobs_
+        pool_ = Mock(name="pool_")
+        pool_.map.side_effect = lambda func, items: [func(item) for item in items]
+
+        parts = Unmarshaller._unmarshal_parts_concurrently(
+            pkg_reader_, pkg_, part_factory_, pool_
+        )
+
+        assert part_factory_.call_args_list == [
+            call(partname_, content_type_, blob_, pkg_),
+            call(partname_2_, content_type_2_, blob_2_, pkg_),
+        ]
+        assert parts == parts_dict_
+
     def it_can_unmarshal_relationships(self):
         # test data --------------------
         reltype = "http://reltype"
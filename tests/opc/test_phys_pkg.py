@@ -29,7 +29,6 @@ from pptx.opc.phys_pkg import (
 from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import class_mock, loose_mock, Mock
 
-
 test_pptx_path = absjoin(test_file_dir, "test.pptx")
 dir_pkg_path = absjoin(test_file_dir, "expanded_pptx")
 zip_pkg_path = test_pptx_path
@@ -58,6 +57,12 @@ class DescribeDirPkgReader(object):
         sha1 = hashlib.sha1(rels_xml).hexdigest()
         assert sha1 == "64ffe86bb2bbaad53c3c1976042b907f8e10c5a3"
 
+    def it_knows_the_membernames_of_its_items(self, dir_reader):
+        membernames = dir_reader.membernames
+        assert "[Content_Types].xml" in membernames
+        assert "ppt/slides/slide1.xml" in membernames
+        assert "ppt/slides/_rels/slide1.xml.rels" in membernames
+
     def it_returns_none_when_part_has_no_rels_xml(self, dir_reader):
         partname = PackURI("/ppt/viewProps.xml")
         rels_xml = dir_reader.rels_xml_for(partname)
@@ -118,6 +123,12 @@ class DescribeZipPkgReader(object):
         sha1 = hashlib.sha1(rels_xml).hexdigest()
         assert sha1 == "e31451d4bbe7d24adbe21454b8e9fdae92f50de5"
 
+    def it_knows_the_membernames_of_its_items(self, phys_reader):
+        membernames = phys_reader.membernames
+        assert membernames[0] == "[Content_Types].xml"
+        assert "ppt/slides/slide1.xml" in membernames
+        assert not any(name.endswith("/") for name in membernames)
+
     def it_returns_none_when_part_has_no_rels_xml(self, phys_reader):
         partname = PackURI("/ppt/viewProps.xml")
         rels_xml = phys_reader.rels_xml_for(partname)
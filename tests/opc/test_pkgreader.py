@@ -85,12 +85,36 @@ class DescribePackageReader(object):
         from_xml.assert_called_once_with(phys_reader.content_types_xml)
         _srels_for.assert_called_once_with(phys_reader, "/")
         _load_serialized_parts.assert_called_once_with(
-            phys_reader, pkg_srels, content_types
+            phys_reader, pkg_srels, content_types, frozenset()
         )
         phys_reader.close.assert_called_once_with()
-        init.assert_called_once_with(content_types, pkg_srels, sparts)
+        init.assert_called_once_with(content_types, pkg_srels, sparts, (), frozenset())
         assert isinstance(pkg_reader, PackageReader)
 
+    def it_can_read_the_parts_using_a_thread_pool(
+        self, request, init, PhysPkgReader_, from_xml, _srels_for
+    ):
+        _read_serialized_parts = method_mock(
+            request, PackageReader, "_read_serialized_parts"
+        )
+        phys_reader = PhysPkgReader_.return_value
+        content_types = from_xml.return_value
+        pkg_srels = _srels_for.return_value
+        pool_ = Mock(name="pool_")
+
+        PackageReader.from_file(Mock(name="pkg_file"), pool_)
+
+        _read_serialized_parts.assert_called_once_with(
+            phys_reader, pkg_srels, content_types, pool_, frozenset()
+        )
+        init.assert_called_once_with(
+            content_types,
+            pkg_srels,
+            _read_serialized_parts.return_value,
+            (),
+            frozenset(),
+        )
+
     def it_can_iterate_over_the_serialized_parts(self):
         # mockery ----------------------
         partname, content_type, blob = ("part/name.xml", "app/vnd.type", "<Part_1/>")
@@ -155,6 +179,98 @@ class DescribePackageReader(object):
         assert _SerializedPart_.call_args_list == expected_calls
         assert retval == expected_sparts
 
+    def it_can_read_serialized_parts_using_a_thread_pool(
+        self, request, _SerializedPart_
+    ):
+        _walk_part_srels = method_mock(
+            request,
+            PackageReader,
+            "_walk_part_srels",
+            return_value=iter(
+                [("/part/name1.xml", "srels_1"), ("/part/name2.xml", "srels_2")]
+            ),
+        )
+        phys_reader = Mock(name="phys_reader")
+        phys_reader.blob_for.side_effect = ["<Part_1/>", "<Part_2/>"]
+        pkg_srels = Mock(name="pkg_srels")
+        content_types = {
+            "/part/name1.xml": "app/vnd.type_1",
+            "/part/name2.xml": "app/vnd.type_2",
+        }
+        pool_ = Mock(name="pool_")
+        pool_.map.side_effect = lambda func, items: [func(item) for item in items]
+        _SerializedPart_.side_effect = expected_sparts = (
+            Mock(name="spart_1"),
+            Mock(name="spart_2"),
+        )
+
+        sparts = PackageReader._read_serialized_parts(
+            phys_reader, pkg_srels, content_types, pool_
+        )
+
+        _walk_part_srels.assert_called_once_with(phys_reader, pkg_srels, ())
+        assert _SerializedPart_.call_args_list == [
+            call("/part/name1.xml", "app/vnd.type_1", "<Part_1/>", "srels_1"),
+            call("/part/name2.xml", "app/vnd.type_2", "<Part_2/>", "srels_2"),
+        ]
+        assert sparts == expected_sparts
+
+    def it_can_read_the_items_not_loaded_as_raw_entries(self):
+        content_types = _ContentTypeMap()
+        content_types._add_override(PackURI("/ppt/slides/slide2.xml"), "app/vnd.ct_sld")
+        phys_reader = Mock(name="phys_reader")
+        phys_reader.membernames = [
+            "[Content_Types].xml",
+            "_rels/.rels",
+            "ppt/presentation.xml",
+            "ppt/_rels/presentation.xml.rels",
+            "ppt/slides/slide1.xml",
+            "ppt/slides/_rels/slide1.xml.rels",
+            "ppt/slides/slide2.xml",
+            "ppt/media/orphan.bin",
+        ]
+        phys_reader.blob_for.side_effect = lambda partname: "blob of %s" % partname
+        sparts = (
+            _SerializedPart(PackURI("/ppt/presentation.xml"), None, None, ()),
+            _SerializedPart(PackURI("/ppt/slides/slide1.xml"), None, None, ()),
+        )
+
+        raw_entries = PackageReader._read_raw_entries(
+            phys_reader, content_types, sparts, set(["/ppt/slides/slide1.xml"])
+        )
+
+        assert raw_entries == (
+            (
+                "/ppt/slides/_rels/slide1.xml.rels",
+                None,
+                "blob of /ppt/slides/_rels/slide1.xml.rels",
+            ),
+            (
+                "/ppt/slides/slide2.xml",
+                "app/vnd.ct_sld",
+                "blob of /ppt/slides/slide2.xml",
+            ),
+            ("/ppt/media/orphan.bin", None, "blob of /ppt/media/orphan.bin"),
+        )
+
+    def it_does_not_walk_past_a_pruned_part(self, _srels_for):
+        partname_1, partname_2 = "/part/name1.xml", "/part/name2.xml"
+        pkg_srels = [
+            Mock(name="rId1", is_external=False, target_partname=partname_1),
+            Mock(name="rId2", is_external=False, target_partname=partname_2),
+        ]
+        part_2_srels = [Mock(name="rId3", is_external=False, target_partname="x")]
+        _srels_for.side_effect = [part_2_srels, []]
+
+        walked = list(
+            PackageReader._walk_part_srels(
+                Mock(name="phys_reader"), pkg_srels, set([partname_1])
+            )
+        )
+
+        assert walked == [(partname_1, ()), (partname_2, part_2_srels), ("x", [])]
+        assert len(_srels_for.call_args_list) == 2
+
     def it_can_walk_phys_pkg_parts(self, _srels_for):
         # test data --------------------
         # +----------+       +--------+
@@ -9,7 +9,11 @@ import pytest
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.package import Part
 from pptx.opc.packuri import PackURI
-from pptx.opc.pkgwriter import _ContentTypesItem, PackageWriter
+from pptx.opc.pkgwriter import (
+    _ContentTypesItem,
+    PackageWriter,
+    StreamingPackageWriter,
+)
 
 from .unitdata.types import a_Default, a_Types, an_Override
 from ..unitutil.mock import (
@@ -30,13 +34,15 @@ class DescribePackageWriter(object):
         pkg_rels = Mock(name="pkg_rels")
         parts = Mock(name="parts")
         phys_writer = PhysPkgWriter_.return_value
+        raw_entries = Mock(name="raw_entries")
         # exercise ---------------------
-        PackageWriter.write(pkg_file, pkg_rels, parts)
+        PackageWriter.write(pkg_file, pkg_rels, parts, raw_entries)
         # verify -----------------------
         expected_calls = [
-            call._write_content_types_stream(phys_writer, parts),
+            call._write_content_types_stream(phys_writer, parts, raw_entries),
             call._write_pkg_rels(phys_writer, pkg_rels),
             call._write_parts(phys_writer, parts),
+            call._write_raw_entries(phys_writer, raw_entries),
         ]
         PhysPkgWriter_.assert_called_once_with(pkg_file)
         assert _write_methods.mock_calls == expected_calls
@@ -49,7 +55,7 @@ class DescribePackageWriter(object):
         # exercise ---------------------
         PackageWriter._write_content_types_stream(phys_writer, parts)
         # verify -----------------------
-        xml_for.assert_called_once_with(parts)
+        xml_for.assert_called_once_with(parts, ())
         serialize_part_xml_.assert_called_once_with(xml_for.return_value)
         phys_writer.write.assert_called_once_with(
             "/[Content_Types].xml", serialize_part_xml_.return_value
@@ -81,6 +87,20 @@ class DescribePackageWriter(object):
         ]
         assert phys_writer.write.mock_calls == expected_calls
 
+    def it_can_write_raw_entries(self):
+        phys_writer = Mock(name="phys_writer")
+        raw_entries = (
+            (PackURI("/ppt/slides/slide2.xml"), "app/vnd.ct_sld", b"<p:sld/>"),
+            (PackURI("/ppt/slides/_rels/slide2.xml.rels"), None, b"<Relationships/>"),
+        )
+
+        PackageWriter._write_raw_entries(phys_writer, raw_entries)
+
+        assert phys_writer.write.mock_calls == [
+            call("/ppt/slides/slide2.xml", b"<p:sld/>"),
+            call("/ppt/slides/_rels/slide2.xml.rels", b"<Relationships/>"),
+        ]
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -100,14 +120,17 @@ class DescribePackageWriter(object):
         patch1 = patch.object(PackageWriter, "_write_content_types_stream")
         patch2 = patch.object(PackageWriter, "_write_pkg_rels")
         patch3 = patch.object(PackageWriter, "_write_parts")
+        patch4 = patch.object(PackageWriter, "_write_raw_entries")
         root_mock.attach_mock(patch1.start(), "_write_content_types_stream")
         root_mock.attach_mock(patch2.start(), "_write_pkg_rels")
         root_mock.attach_mock(patch3.start(), "_write_parts")
+        root_mock.attach_mock(patch4.start(), "_write_raw_entries")
 
         def fin():
             patch1.stop()
             patch2.stop()
             patch3.stop()
+            patch4.stop()
 
         request.addfinalizer(fin)
         return root_mock
@@ -117,12 +140,77 @@ class DescribePackageWriter(object):
         return method_mock(request, _ContentTypesItem, "xml_for")
 
 
+class DescribeStreamingPackageWriter(object):
+    def it_writes_a_part_only_once(self, PhysPkgWriter_, _write_parts_):
+        part = Mock(name="part", partname=PackURI("/ppt/slides/slide1.xml"))
+        pkg_writer = StreamingPackageWriter("foo.pptx")
+
+        pkg_writer.write_part(part)
+        pkg_writer.write_part(part)
+
+        phys_writer = PhysPkgWriter_.return_value
+        _write_parts_.assert_called_once_with(phys_writer, (part,))
+        assert pkg_writer.is_written(part) is True
+
+    def it_writes_the_remaining_parts_on_close(
+        self,
+        PhysPkgWriter_,
+        _write_parts_,
+        _write_content_types_stream_,
+        _write_pkg_rels_,
+    ):
+        written = Mock(name="written", partname=PackURI("/ppt/slides/slide1.xml"))
+        pending = Mock(name="pending", partname=PackURI("/ppt/slides/slide2.xml"))
+        pkg_rels = Mock(name="pkg_rels")
+        pkg_writer = StreamingPackageWriter("foo.pptx")
+        pkg_writer.write_part(written)
+
+        pkg_writer.close(pkg_rels, iter([written, pending]))
+
+        phys_writer = PhysPkgWriter_.return_value
+        _write_content_types_stream_.assert_called_once_with(
+            phys_writer, [written, pending]
+        )
+        _write_pkg_rels_.assert_called_once_with(phys_writer, pkg_rels)
+        assert _write_parts_.call_args_list[-1] == call(phys_writer, [pending])
+        phys_writer.close.assert_called_once_with()
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def PhysPkgWriter_(self, request):
+        return function_mock(request, "pptx.opc.pkgwriter.PhysPkgWriter")
+
+    @pytest.fixture
+    def _write_content_types_stream_(self, request):
+        return method_mock(request, PackageWriter, "_write_content_types_stream")
+
+    @pytest.fixture
+    def _write_parts_(self, request):
+        return method_mock(request, PackageWriter, "_write_parts")
+
+    @pytest.fixture
+    def _write_pkg_rels_(self, request):
+        return method_mock(request, PackageWriter, "_write_pkg_rels")
+
+
 class Describe_ContentTypesItem(object):
     def it_can_compose_content_types_xml(self, xml_for_fixture):
         parts, expected_xml = xml_for_fixture
         types_elm = _ContentTypesItem.xml_for(parts)
         assert types_elm.xml == expected_xml
 
+    def it_includes_the_content_types_of_raw_entries(self):
+        raw_entries = (
+            (PackURI("/ppt/slides/slide2.xml"), "app/vnd.ct_sld", b""),
+            (PackURI("/ppt/slides/_rels/slide2.xml.rels"), None, b""),
+        )
+        types_elm = _ContentTypesItem.xml_for([], raw_entries)
+        overrides = types_elm.xpath("*[local-name()='Override']")
+        assert [(o.get("PartName"), o.get("ContentType")) for o in overrides] == [
+            ("/ppt/slides/slide2.xml", "app/vnd.ct_sld")
+        ]
+
     # fixtures ---------------------------------------------
 
     def _mock_part(self, request, name, partname_str, content_type):
@@ -86,6 +86,28 @@ class DescribeCT_GroupShape(object):
         x, y, cx, cy = xSp._child_extents
         assert (x, y, cx, cy) == expected_values
 
+    def it_can_iterate_the_text_of_its_paragraphs(self):
+        spTree = element(
+            "p:spTree/("
+            'p:sp/(p:nvSpPr/p:cNvPr{id=2},p:txBody/(a:p/(a:r/a:t"foo",a:br,'
+            'a:r/a:t"bar"),a:p)),'
+            'p:grpSp/p:sp/(p:nvSpPr/p:cNvPr{id=4},p:txBody/a:p/a:fld/a:t"7"),'
+            "p:graphicFrame/(p:nvGraphicFramePr/p:cNvPr{id=5},a:graphic/a:graphicDa"
+            'ta/a:tbl/(a:tr/(a:tc/a:txBody/a:p/a:r/a:t"a",a:tc/a:txBody/a:p),'
+            'a:tr/a:tc/a:txBody/a:p/a:r/a:t"b")))'
+        )
+
+        texts = list(spTree.iter_paragraph_text())
+
+        assert texts == [
+            (2, 0, "foo\vbar"),
+            (2, 1, ""),
+            (4, 0, "7"),
+            (5, 0, "a"),
+            (5, 1, ""),
+            (5, 2, "b"),
+        ]
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -6,11 +6,13 @@ Test suite for pptx.oxml.__init__.py module, primarily XML parser-related.
 
 from __future__ import print_function, unicode_literals
 
+import threading
+
 import pytest
 
 from lxml import etree
 
-from pptx.oxml import oxml_parser, parse_xml, register_element_cls
+from pptx.oxml import parse_xml, register_element_cls, thread_parser
 from pptx.oxml.ns import qn
 from pptx.oxml.xmlchemy import BaseOxmlElement
 
@@ -23,12 +25,48 @@ class DescribeOxmlParser(object):
         assert xml_bytes == stripped_xml_bytes
 
 
+class DescribeThreadParser(object):
+    def it_provides_a_separate_parser_for_each_thread(self):
+        parsers = []
+        thread = threading.Thread(target=lambda: parsers.append(thread_parser.parser))
+        thread.start()
+        thread.join()
+
+        assert parsers[0] is not thread_parser.parser
+
+    def it_resolves_the_deprecated_oxml_parser_to_the_thread_parser(self):
+        parsers = []
+
+        def import_oxml_parser():
+            with pytest.warns(DeprecationWarning):
+                from pptx.oxml import oxml_parser
+
+            parsers.append((oxml_parser, thread_parser.parser))
+
+        thread = threading.Thread(target=import_oxml_parser)
+        thread.start()
+        thread.join()
+
+        oxml_parser, parser = parsers[0]
+        assert oxml_parser is parser
+        assert oxml_parser is not thread_parser.parser
+
+    def and_it_gives_each_parser_the_custom_element_classes(self, xml_bytes):
+        register_element_cls("a:foo", CustElmCls)
+        elements = []
+        thread = threading.Thread(target=lambda: elements.append(parse_xml(xml_bytes)))
+        thread.start()
+        thread.join()
+
+        assert type(elements[0]) is CustElmCls
+
+
 class DescribeParseXml(object):
-    def it_uses_oxml_configured_parser_to_parse_xml(
-        self, mock_xml_bytes, fromstring, mock_oxml_parser
+    def it_uses_the_parser_of_the_calling_thread_to_parse_xml(
+        self, mock_xml_bytes, fromstring, thread_parser_
     ):
         element = parse_xml(mock_xml_bytes)
-        fromstring.assert_called_once_with(mock_xml_bytes, mock_oxml_parser)
+        fromstring.assert_called_once_with(mock_xml_bytes, thread_parser_.parser)
         assert element is fromstring.return_value
 
     def it_prefers_to_parse_bytes(self, xml_bytes):
@@ -52,7 +90,7 @@ class DescribeParseXml(object):
 class DescribeRegisterCustomElementClass(object):
     def it_determines_cust_elm_class_constructed_for_specified_tag(self, xml_bytes):
         register_element_cls("a:foo", CustElmCls)
-        foo = etree.fromstring(xml_bytes, oxml_parser)
+        foo = etree.fromstring(xml_bytes, thread_parser.parser)
         assert type(foo) is CustElmCls
         assert type(foo.find(qn("a:bar"))) is etree._Element
 
@@ -68,7 +106,7 @@ class CustElmCls(BaseOxmlElement):
 
 @pytest.fixture
 def foo(xml_bytes):
-    return etree.fromstring(xml_bytes, oxml_parser)
+    return etree.fromstring(xml_bytes, thread_parser.parser)
 
 
 @pytest.fixture
@@ -77,8 +115,8 @@ def fromstring(request):
 
 
 @pytest.fixture
-def mock_oxml_parser(request):
-    return var_mock(request, "pptx.oxml.oxml_parser")
+def thread_parser_(request):
+    return var_mock(request, "pptx.oxml.thread_parser")
 
 
 @pytest.fixture
@@ -17,6 +17,17 @@ class DescribeCT_SlideIdList(object):
         sldIdLst.add_sldId("rId1")
         assert sldIdLst.xml == expected_xml
 
+    def it_can_add_several_sldId_elements_at_once(self):
+        sldIdLst = element("p:sldIdLst/p:sldId{r:id=rId4,id=300}")
+
+        sldIds = sldIdLst.add_sldIds(["rId7", "rId5"])
+
+        assert sldIdLst.xml == xml(
+            "p:sldIdLst/(p:sldId{r:id=rId4,id=300},p:sldId{r:id=rId7,id=301},p:s"
+            "ldId{r:id=rId5,id=302})"
+        )
+        assert sldIds == sldIdLst.sldId_lst[1:]
+
     def it_knows_the_next_available_slide_id(self, next_id_fixture):
         sldIdLst, expected_id = next_id_fixture
         assert sldIdLst._next_id == expected_id
@@ -6,10 +6,10 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
-from pptx.oxml.ns import nsdecls
+from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.table import CT_Table, TcRange
 
-from ..unitutil.cxml import element
+from ..unitutil.cxml import element, xml
 
 
 class DescribeCT_Table(object):
@@ -52,6 +52,84 @@ class DescribeCT_Table(object):
         assert tbl.tc(1, 0) is tcs[2]
         assert tbl.tc(1, 1) is tcs[3]
 
+    @pytest.mark.parametrize("idx", (0, 1, 2))
+    def it_can_insert_a_grid_column(self, idx):
+        tbl = element(
+            "a:tbl/(a:tblGrid/(a:gridCol{w=1},a:gridCol{w=2}),a:tr{h=1}/(a:tc,a:tc,a:"
+            "extLst))"
+        )
+        tcs = tbl.tr_lst[0].tc_lst
+
+        gridCol = tbl.insert_gridCol(idx, 9)
+
+        assert tbl.tblGrid.gridCol_lst.index(gridCol) == idx
+        assert gridCol.w == 9
+        new_tcs = tbl.tr_lst[0].tc_lst
+        assert len(new_tcs) == 3
+        assert new_tcs[idx] not in tcs
+        assert tbl.tr_lst[0][-1].tag == qn("a:extLst")
+
+    @pytest.mark.parametrize("idx", (0, 1, 2))
+    def it_can_insert_a_row(self, idx):
+        tbl = CT_Table.new_tbl(2, 3, 300, 200)
+        tr_lst = tbl.tr_lst
+
+        tr = tbl.insert_tr(idx, 42)
+
+        assert tbl.tr_lst.index(tr) == idx
+        assert tr not in tr_lst
+        assert tr.h == 42
+        assert tr.xml == CT_Table.new_tbl(1, 3, 300, 42).tr_lst[0].xml
+
+    def it_can_remove_a_grid_column(self):
+        tbl = CT_Table.new_tbl(2, 3, 300, 200)
+        tcs = list(tbl.iter_col_tcs(1))
+        gridCol = tbl.tblGrid.gridCol_lst[1]
+
+        tbl.remove_gridCol(1)
+
+        assert gridCol not in tbl.tblGrid.gridCol_lst
+        assert not any(tc in tbl.iter_tcs() for tc in tcs)
+        assert [len(tr.tc_lst) for tr in tbl.tr_lst] == [2, 2]
+
+    def it_can_set_the_text_of_its_cells(self):
+        tbl = element("a:tbl/(a:tr/(a:tc,a:tc),a:tr/(a:tc,a:tc))")
+        rPr = element("a:rPr{i=1}")
+
+        tbl.set_texts([["a", "b"], ["c"]], [None, rPr])
+
+        assert [tc.text for tc in tbl.iter_tcs()] == ["a", "b", "c", ""]
+        assert tbl.xpath(".//a:rPr/../a:t/text()") == ["b"]
+
+
+class DescribeCT_TableCell(object):
+    @pytest.mark.parametrize(
+        ("tc_cxml", "text", "rPr_cxml", "expected_cxml"),
+        (
+            ("a:tc", "", None, "a:tc/a:txBody/(a:bodyPr,a:p)"),
+            (
+                'a:tc/(a:txBody/(a:bodyPr,a:p/a:r/a:t"old",a:p),a:tcPr)',
+                "foo",
+                None,
+                'a:tc/(a:txBody/(a:bodyPr,a:p/a:r/a:t"foo"),a:tcPr)',
+            ),
+            (
+                "a:tc/a:txBody/(a:bodyPr,a:p)",
+                "a\vb\n\x07",
+                "a:rPr{b=1}",
+                'a:tc/a:txBody/(a:bodyPr,a:p/(a:r/(a:rPr{b=1},a:t"a"),a:br,a:r/(a:r'
+                'Pr{b=1},a:t"b")),a:p/a:r/(a:rPr{b=1},a:t"_x0007_"))',
+            ),
+        ),
+    )
+    def it_can_set_its_text(self, tc_cxml, text, rPr_cxml, expected_cxml):
+        tc = element(tc_cxml)
+        rPr = None if rPr_cxml is None else element(rPr_cxml)
+
+        tc.set_text(text, rPr)
+
+        assert tc.xml == xml(expected_cxml)
+
 
 class DescribeTcRange(object):
     def it_knows_when_the_range_contains_a_merged_cell(self, contains_merge_fixture):
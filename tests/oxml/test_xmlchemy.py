@@ -8,6 +8,8 @@ provided by the metaclass-built test classes at the end of the file.
 
 from __future__ import absolute_import, print_function
 
+import threading
+
 import pytest
 
 from pptx.exc import InvalidXmlError
@@ -15,6 +17,7 @@ from pptx.oxml import register_element_cls
 from pptx.oxml.ns import qn
 from pptx.oxml.simpletypes import BaseIntType
 from pptx.oxml.xmlchemy import (
+    _compiled_xpath,
     BaseOxmlElement,
     Choice,
     OneAndOnlyOne,
@@ -27,6 +30,7 @@ from pptx.oxml.xmlchemy import (
 )
 
 from ..unitdata import BaseBuilder
+from ..unitutil.cxml import element, xml
 
 
 class DescribeCustomElementClass(object):
@@ -34,6 +38,44 @@ class DescribeCustomElementClass(object):
         assert type(CT_Parent).__name__ == "MetaOxmlElement"
 
 
+class DescribeBaseOxmlElement(object):
+    def it_can_evaluate_an_xpath_expression(self):
+        ser = element("c:ser/(c:dPt/c:idx{val=1},c:dPt/c:idx{val=3})")
+        dPts = ser.xpath("c:dPt")
+        assert ser.xpath("c:dPt[c:idx[@val=$idx]]", idx=3) == [dPts[1]]
+
+    def it_compiles_each_xpath_expression_only_once(self):
+        xpath = _compiled_xpath("./c:dPt/c:idx/@val")
+        assert _compiled_xpath("./c:dPt/c:idx/@val") is xpath
+
+    def and_it_shares_one_compiled_expression_between_threads(self):
+        xpaths = []
+
+        def compile_xpath():
+            xpaths.append(_compiled_xpath("./c:ser/c:idx[@val=$val]"))
+
+        threads = [threading.Thread(target=compile_xpath) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(xpath is xpaths[0] for xpath in xpaths)
+
+    def it_can_remap_the_relationship_ids_it_contains(self):
+        graphicFrame = element(
+            "p:graphicFrame/a:graphic/a:graphicData/(c:chart{r:id=rId1},"
+            "a:blip{r:embed=rId2,r:link=rId3})"
+        )
+
+        graphicFrame.remap_rIds({"rId1": "rId7", "rId2": "rId8"})
+
+        assert graphicFrame.xml == xml(
+            "p:graphicFrame/a:graphic/a:graphicData/(c:chart{r:id=rId7},"
+            "a:blip{r:embed=rId8,r:link=rId3})"
+        )
+
+
 class DescribeChoice(object):
     def it_adds_a_getter_property_for_the_choice_element(self, getter_fixture):
         parent, expected_choice = getter_fixture
@@ -10,16 +10,24 @@ import pytest
 
 from pptx.chart.chart import Chart
 from pptx.chart.data import ChartData
+from pptx.chart.prototype import ChartPrototype
 from pptx.enum.base import EnumValue
 from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
-from pptx.opc.package import OpcPackage
+from pptx.opc.package import OpcPackage, Part, _Relationship
 from pptx.opc.packuri import PackURI
 from pptx.oxml.chart.chart import CT_ChartSpace
 from pptx.parts.chart import ChartPart, ChartWorkbook
+from pptx.parts.clone import RelationshipCloner
 from pptx.parts.embeddedpackage import EmbeddedXlsxPart
 
 from ..unitutil.cxml import element, xml
-from ..unitutil.mock import class_mock, instance_mock, method_mock, property_mock
+from ..unitutil.mock import (
+    call,
+    class_mock,
+    instance_mock,
+    method_mock,
+    property_mock,
+)
 
 
 class DescribeChartPart(object):
@@ -37,6 +45,55 @@ class DescribeChartPart(object):
         chart_workbook_.update_from_xlsx_blob.assert_called_once_with(xlsx_blob_)
         assert chart_part is chart_part_
 
+    def it_can_construct_from_a_chart_prototype(self, prototype_fixture):
+        prototype_, chart_data_, package_, partname_ = prototype_fixture[:4]
+        part_, relate_to_, chart_workbook_, xlsx_blob_ = prototype_fixture[4:]
+
+        chart_part = ChartPart.new_from_prototype(prototype_, chart_data_, package_)
+
+        prototype_.new_chartSpace.assert_called_once_with(chart_data_)
+        package_.next_partname.assert_called_once_with("/ppt/charts/chart%d.xml")
+        assert chart_part.partname is partname_
+        assert chart_part.content_type == CT.DML_CHART
+        assert chart_part.package is package_
+        assert relate_to_.call_args_list == [
+            call(part_, RT.CHART_USER_SHAPES, False),
+            call("http://x/y", RT.HYPERLINK, True),
+        ]
+        assert chart_part._element.xml == xml("c:chartSpace/c:userShapes{r:id=rId9}")
+        chart_workbook_.update_from_xlsx_blob.assert_called_once_with(xlsx_blob_)
+
+    def it_copies_prototype_parts_from_another_package(
+        self, request, chart_data_, package_, chart_workbook_
+    ):
+        shapes_part_ = instance_mock(request, Part)
+        shapes_copy_ = instance_mock(request, Part)
+        rel_ = instance_mock(
+            request,
+            _Relationship,
+            rId="rId2",
+            reltype=RT.CHART_USER_SHAPES,
+            is_external=False,
+            target_part=shapes_part_,
+        )
+        prototype_ = instance_mock(request, ChartPrototype, rels=(rel_,))
+        prototype_.new_chartSpace.return_value = element("c:chartSpace")
+        cloner_ = instance_mock(request, RelationshipCloner)
+        cloner_.copy_parts.return_value = [shapes_copy_]
+        RelationshipCloner_ = class_mock(
+            request, "pptx.parts.chart.RelationshipCloner", return_value=cloner_
+        )
+        relate_to_ = method_mock(request, ChartPart, "relate_to", return_value="rId1")
+        property_mock(
+            request, ChartPart, "chart_workbook", return_value=chart_workbook_
+        )
+
+        chart_part = ChartPart.new_from_prototype(prototype_, chart_data_, package_)
+
+        RelationshipCloner_.assert_called_once_with(chart_part)
+        cloner_.copy_parts.assert_called_once_with([shapes_part_])
+        relate_to_.assert_called_once_with(shapes_copy_, RT.CHART_USER_SHAPES, False)
+
     def it_provides_access_to_the_chart_object(self, chart_fixture):
         chart_part, chart_, Chart_ = chart_fixture
         chart = chart_part.chart
@@ -83,6 +140,50 @@ class DescribeChartPart(object):
             xlsx_blob_,
         )
 
+    @pytest.fixture
+    def prototype_fixture(
+        self, request, chart_data_, package_, partname_, chart_workbook_, xlsx_blob_
+    ):
+        part_ = instance_mock(request, Part, package=package_)
+        rels = (
+            instance_mock(
+                request,
+                _Relationship,
+                rId="rId3",
+                reltype=RT.CHART_USER_SHAPES,
+                is_external=False,
+                target_part=part_,
+            ),
+            instance_mock(
+                request,
+                _Relationship,
+                rId="rId4",
+                reltype=RT.HYPERLINK,
+                is_external=True,
+                target_ref="http://x/y",
+            ),
+        )
+        prototype_ = instance_mock(request, ChartPrototype, rels=rels)
+        prototype_.new_chartSpace.return_value = element(
+            "c:chartSpace/c:userShapes{r:id=rId3}"
+        )
+        relate_to_ = method_mock(
+            request, ChartPart, "relate_to", side_effect=["rId9", "rId10"]
+        )
+        property_mock(
+            request, ChartPart, "chart_workbook", return_value=chart_workbook_
+        )
+        return (
+            prototype_,
+            chart_data_,
+            package_,
+            partname_,
+            part_,
+            relate_to_,
+            chart_workbook_,
+            xlsx_blob_,
+        )
+
     @pytest.fixture
     def workbook_fixture(self, chartSpace_, ChartWorkbook_, chart_workbook_):
         chart_part = ChartPart(None, None, chartSpace_)
@@ -177,6 +278,26 @@ class DescribeChartWorkbook(object):
         chart_data.update_from_xlsx_blob(xlsx_blob_)
         assert chart_data.xlsx_part.blob is xlsx_blob_
 
+    def it_can_update_selected_worksheet_values(
+        self, request, xlsx_part_prop_, xlsx_part_
+    ):
+        WorksheetCellUpdater_ = class_mock(
+            request, "pptx.parts.chart.WorksheetCellUpdater"
+        )
+        WorksheetCellUpdater_.range_origin.return_value = ("Sheet1", "C", 2)
+        updater_ = WorksheetCellUpdater_.return_value
+        updater_.update.return_value = b"new-blob"
+        xlsx_part_prop_.return_value = xlsx_part_
+        xlsx_part_.blob = b"old-blob"
+        chart_workbook = ChartWorkbook(None, None)
+
+        chart_workbook.update_values("Sheet1!$C$2:$C$9", {0: 1.5, 3: None})
+
+        WorksheetCellUpdater_.range_origin.assert_called_once_with("Sheet1!$C$2:$C$9")
+        WorksheetCellUpdater_.assert_called_once_with(b"old-blob")
+        updater_.update.assert_called_once_with("Sheet1", {"C2": 1.5, "C5": None})
+        assert xlsx_part_.blob == b"new-blob"
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -0,0 +1,363 @@
+# encoding: utf-8
+
+"""Unit test suite for pptx.parts.clone module."""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part, XmlPart
+from pptx.opc.packuri import PackURI
+from pptx.package import Package
+from pptx.parts.chart import ChartPart
+from pptx.parts.clone import (
+    _slide_master_digests,
+    _split_partname,
+    RelationshipCloner,
+)
+from pptx.parts.image import ImagePart
+from pptx.parts.media import MediaPart
+from pptx.parts.presentation import PresentationPart
+from pptx.parts.slide import (
+    NotesMasterPart,
+    NotesSlidePart,
+    SlideLayoutPart,
+    SlideMasterPart,
+    SlidePart,
+)
+
+from ..unitutil.cxml import element, xml
+from ..unitutil.mock import property_mock
+
+
+class DescribeRelationshipCloner(object):
+    def it_re_creates_external_relationships(self, source_part, target_part):
+        rId = source_part.relate_to("http://x/y", RT.HYPERLINK, is_external=True)
+        sp = element("p:sp/p:nvSpPr/p:cNvPr/a:hlinkClick{r:id=%s}" % rId)
+        target_part.relate_to(target_part, RT.SLIDE)
+
+        RelationshipCloner(target_part).clone_rels(sp, source_part)
+
+        assert sp.xml == xml("p:sp/p:nvSpPr/p:cNvPr/a:hlinkClick{r:id=rId2}")
+        assert target_part.target_ref("rId2") == "http://x/y"
+
+    def it_shares_an_identical_image_part(self, source_part, target_part):
+        image_part = _image_part(source_part.package, "image1.png", b"foo")
+        rId = source_part.relate_to(image_part, RT.IMAGE)
+        existing_part = _image_part(target_part.package, "image3.png", b"foo")
+        target_part.relate_to(existing_part, RT.IMAGE)
+        pic = element("p:pic/p:blipFill/a:blip{r:embed=%s}" % rId)
+
+        RelationshipCloner(target_part).clone_rels(pic, source_part)
+
+        assert pic.xml == xml("p:pic/p:blipFill/a:blip{r:embed=rId1}")
+        assert target_part.related_parts["rId1"] is existing_part
+
+    def and_it_adds_an_image_part_when_there_is_none(self, source_part, target_part):
+        image_part = _image_part(source_part.package, "image1.png", b"foo")
+        rId = source_part.relate_to(image_part, RT.IMAGE)
+        existing_part = _image_part(target_part.package, "image1.jpg", b"bar")
+        target_part.relate_to(existing_part, RT.IMAGE)
+        pics = [element("p:pic/p:blipFill/a:blip{r:embed=%s}" % rId) for _ in range(2)]
+
+        cloner = RelationshipCloner(target_part)
+        for pic in pics:
+            cloner.clone_rels(pic, source_part)
+
+        new_part = target_part.related_parts["rId2"]
+        assert isinstance(new_part, ImagePart)
+        assert new_part is not image_part
+        assert new_part.partname == "/ppt/media/image2.png"
+        assert new_part.blob == b"foo"
+        assert [pic.xml for pic in pics] == [
+            xml("p:pic/p:blipFill/a:blip{r:embed=rId2}")
+        ] * 2
+
+    def it_shares_an_identical_media_part(self, source_part, target_part):
+        media_part = MediaPart(
+            PackURI("/ppt/media/media1.mp4"), "video/mp4", b"foo", source_part.package
+        )
+        rId = source_part.relate_to(media_part, RT.MEDIA)
+        pic = element("p:pic/p:nvPicPr/p:nvPr/a:videoFile{r:link=%s}" % rId)
+
+        RelationshipCloner(target_part).clone_rels(pic, source_part)
+
+        new_part = target_part.related_parts["rId1"]
+        assert isinstance(new_part, MediaPart)
+        assert new_part.partname == "/ppt/media/media1.mp4"
+        assert new_part.sha1 == media_part.sha1
+
+    def it_relates_a_slide_in_the_same_package(self, source_part):
+        slide_part = _slide_part(source_part.package, 3)
+        rId = source_part.relate_to(slide_part, RT.SLIDE)
+        target_part = _slide_part(source_part.package, 2)
+        sp = element("p:sp/p:nvSpPr/p:cNvPr/a:hlinkClick{r:id=%s}" % rId)
+
+        RelationshipCloner(target_part).clone_rels(sp, source_part)
+
+        assert sp.xml == xml("p:sp/p:nvSpPr/p:cNvPr/a:hlinkClick{r:id=rId1}")
+        assert target_part.related_parts["rId1"] is slide_part
+
+    def but_it_clears_a_reference_to_a_slide_in_another_package(
+        self, source_part, target_part
+    ):
+        rId = source_part.relate_to(_slide_part(source_part.package, 3), RT.SLIDE)
+        sp = element("p:sp/p:nvSpPr/p:cNvPr/a:hlinkClick{r:id=%s}" % rId)
+
+        RelationshipCloner(target_part).clone_rels(sp, source_part)
+
+        assert sp.xpath(".//a:hlinkClick/@r:id") == [""]
+        assert len(target_part.rels) == 0
+
+    def it_copies_other_parts_along_with_their_dependencies(
+        self, source_part, target_part
+    ):
+        chart_part = ChartPart(
+            PackURI("/ppt/charts/chart1.xml"),
+            CT.DML_CHART,
+            element("c:chartSpace/c:externalData{r:id=rId1}"),
+            source_part.package,
+        )
+        xlsx_part = Part(
+            PackURI("/ppt/embeddings/Microsoft_Excel_Sheet1.xlsx"),
+            CT.SML_SHEET,
+            b"xlsx-blob",
+            source_part.package,
+        )
+        chart_part.relate_to(xlsx_part, RT.PACKAGE)
+        rId = source_part.relate_to(chart_part, RT.CHART)
+        existing_chart_part = ChartPart(
+            PackURI("/ppt/charts/chart1.xml"),
+            CT.DML_CHART,
+            element("c:chartSpace"),
+            target_part.package,
+        )
+        target_part.relate_to(existing_chart_part, RT.CHART)
+        graphicFrame = element("p:graphicFrame/a:graphic/c:chart{r:id=%s}" % rId)
+
+        RelationshipCloner(target_part).clone_rels(graphicFrame, source_part)
+
+        assert graphicFrame.xml == xml("p:graphicFrame/a:graphic/c:chart{r:id=rId2}")
+        chart_copy = target_part.related_parts["rId2"]
+        assert isinstance(chart_copy, ChartPart)
+        assert chart_copy.partname == "/ppt/charts/chart2.xml"
+        assert chart_copy.package is target_part.package
+        assert chart_copy._element is not chart_part._element
+        assert chart_copy._element.xml == chart_part._element.xml
+        xlsx_copy = chart_copy.related_parts["rId1"]
+        assert xlsx_copy is not xlsx_part
+        assert xlsx_copy.partname == "/ppt/embeddings/Microsoft_Excel_Sheet1.xlsx"
+        assert xlsx_copy.blob == b"xlsx-blob"
+
+    def it_can_copy_parts_referring_to_one_another(self, source_part, target_part):
+        package = source_part.package
+        slide_parts = [_slide_part(package, idx) for idx in (2, 3)]
+        slide_parts[0].relate_to(slide_parts[1], RT.SLIDE)
+        slide_parts[0].relate_to(_slide_part(package, 4), RT.SLIDE)
+        slide_parts[0]._element = element(
+            "p:sld/p:cSld/p:spTree/(p:sp/p:nvSpPr/p:cNvPr/a:hlinkClick{r:id=rId1},p"
+            ":sp/p:nvSpPr/p:cNvPr/a:hlinkClick{r:id=rId2})"
+        )
+        cloner = RelationshipCloner(target_part)
+
+        slide_copies = cloner.copy_parts(slide_parts)
+
+        assert [part.partname for part in slide_copies] == [
+            "/ppt/slides/slide2.xml",
+            "/ppt/slides/slide3.xml",
+        ]
+        assert slide_copies[0].related_parts == {"rId1": slide_copies[1]}
+        assert slide_copies[0]._element.xpath("//a:hlinkClick/@r:id") == ["rId1", ""]
+        assert slide_parts[0]._element.xpath("//a:hlinkClick/@r:id") == [
+            "rId1",
+            "rId2",
+        ]
+        assert cloner.copies == slide_copies
+
+    def it_uses_an_identical_slide_layout_when_there_is_one(self):
+        source_layout = _presentation_with_layout("Foo")
+        target_layout = _presentation_with_layout("Foo")
+        slide_part = _slide_part(source_layout.package, 1)
+        slide_part.relate_to(source_layout, RT.SLIDE_LAYOUT)
+        cloner = RelationshipCloner(target_layout.package.presentation_part)
+
+        slide_copy = cloner.copy_parts([slide_part])[0]
+
+        assert slide_copy.part_related_by(RT.SLIDE_LAYOUT) is target_layout
+        assert cloner.copies == [slide_copy]
+
+    def but_it_copies_the_slide_master_closure_when_there_is_none(self):
+        source_layout = _presentation_with_layout("Foo")
+        target_layout = _presentation_with_layout("Bar")
+        slide_part = _slide_part(source_layout.package, 1)
+        slide_part.relate_to(source_layout, RT.SLIDE_LAYOUT)
+        cloner = RelationshipCloner(target_layout.package.presentation_part)
+
+        slide_copy = cloner.copy_parts([slide_part])[0]
+
+        layout_copy = slide_copy.part_related_by(RT.SLIDE_LAYOUT)
+        master_copy = layout_copy.part_related_by(RT.SLIDE_MASTER)
+        theme_copy = master_copy.part_related_by(RT.THEME)
+        assert layout_copy.partname == "/ppt/slideLayouts/slideLayout2.xml"
+        assert master_copy.partname == "/ppt/slideMasters/slideMaster2.xml"
+        assert theme_copy.partname == "/ppt/theme/theme2.xml"
+        assert master_copy.part_related_by(RT.SLIDE_LAYOUT) is layout_copy
+        assert layout_copy._element.xml == source_layout._element.xml
+        assert set(cloner.copies) == set(
+            [slide_copy, layout_copy, master_copy, theme_copy]
+        )
+
+    def it_uses_its_own_notes_master_for_a_copied_notes_slide(
+        self, request, source_part
+    ):
+        target_prs_part = _presentation_with_layout("Foo").package.presentation_part
+        notes_master_part = NotesMasterPart(
+            PackURI("/ppt/notesMasters/notesMaster1.xml"),
+            CT.PML_NOTES_MASTER,
+            element("p:notesMaster"),
+            target_prs_part.package,
+        )
+        property_mock(
+            request,
+            PresentationPart,
+            "notes_master_part",
+            return_value=notes_master_part,
+        )
+        notes_slide_part = NotesSlidePart(
+            PackURI("/ppt/notesSlides/notesSlide1.xml"),
+            CT.PML_NOTES_SLIDE,
+            element("p:notes"),
+            source_part.package,
+        )
+        notes_slide_part.relate_to(source_part, RT.SLIDE)
+        notes_slide_part.relate_to(
+            NotesMasterPart(
+                PackURI("/ppt/notesMasters/notesMaster1.xml"),
+                CT.PML_NOTES_MASTER,
+                element("p:notesMaster"),
+                source_part.package,
+            ),
+            RT.NOTES_MASTER,
+        )
+        source_part.relate_to(notes_slide_part, RT.NOTES_SLIDE)
+
+        slide_copy = RelationshipCloner(target_prs_part).copy_parts([source_part])[0]
+
+        notes_slide_copy = slide_copy.part_related_by(RT.NOTES_SLIDE)
+        assert notes_slide_copy is not notes_slide_part
+        assert notes_slide_copy.part_related_by(RT.SLIDE) is slide_copy
+        assert notes_slide_copy.part_related_by(RT.NOTES_MASTER) is notes_master_part
+
+    def it_allocates_partnames_filling_gaps(self, target_part):
+        package = target_part.package
+        for idx in (1, 3):
+            target_part.relate_to(
+                _image_part(package, "image%d.png" % idx, b"%d" % idx), RT.IMAGE
+            )
+        cloner = RelationshipCloner(target_part)
+
+        partnames = [
+            cloner._next_partname("/ppt/media/image9.%s" % ext)
+            for ext in ("png", "jpg", "png")
+        ]
+
+        assert partnames == [
+            "/ppt/media/image2.png",
+            "/ppt/media/image4.jpg",
+            "/ppt/media/image5.png",
+        ]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def source_part(self):
+        package = Package()
+        slide_part = _slide_part(package, 1)
+        package.relate_to(slide_part, RT.SLIDE)
+        return slide_part
+
+    @pytest.fixture
+    def target_part(self):
+        package = Package()
+        slide_part = _slide_part(package, 1)
+        package.relate_to(slide_part, RT.SLIDE)
+        return slide_part
+
+
+class Describe_slide_master_digests(object):
+    def it_digests_a_slide_master_and_its_layouts(self):
+        layout_part = _presentation_with_layout("Foo")
+        master_part = layout_part.part_related_by(RT.SLIDE_MASTER)
+        other_layout_part = _presentation_with_layout("Foo")
+        other_master_part = other_layout_part.part_related_by(RT.SLIDE_MASTER)
+        changed_layout_part = _presentation_with_layout("Bar")
+        changed_master_part = changed_layout_part.part_related_by(RT.SLIDE_MASTER)
+
+        digests = _slide_master_digests(master_part)
+        other_digests = _slide_master_digests(other_master_part)
+        changed_digests = _slide_master_digests(changed_master_part)
+
+        assert set(digests) == set([master_part, layout_part])
+        assert digests[master_part] != digests[layout_part]
+        assert digests[master_part] == other_digests[other_master_part]
+        assert digests[layout_part] == other_digests[other_layout_part]
+        assert digests[master_part] != changed_digests[changed_master_part]
+
+
+class Describe_split_partname(object):
+    @pytest.mark.parametrize(
+        "partname, expected_value",
+        (
+            ("/ppt/charts/chart3.xml", ("/ppt/charts/chart", 3, ".xml")),
+            ("/ppt/media/image12.png", ("/ppt/media/image", 12, ".png")),
+            ("/ppt/presentation.xml", ("/ppt/presentation", None, ".xml")),
+            ("/ppt/foo/bar42", ("/ppt/foo/bar", 42, "")),
+        ),
+    )
+    def it_splits_a_partname_into_stem_idx_and_ext(self, partname, expected_value):
+        assert _split_partname(partname) == expected_value
+
+
+def _image_part(package, filename, blob):
+    return ImagePart(PackURI("/ppt/media/%s" % filename), "image/png", blob, package)
+
+
+def _presentation_with_layout(layout_name):
+    """
+    Return the slide layout part of a new package having a presentation part,
+    a slide master, and a theme, with the layout named *layout_name*.
+    """
+    package = Package()
+    prs_part = PresentationPart(
+        PackURI("/ppt/presentation.xml"),
+        CT.PML_PRESENTATION_MAIN,
+        element("p:presentation"),
+        package,
+    )
+    package.relate_to(prs_part, RT.OFFICE_DOCUMENT)
+    master_part = SlideMasterPart(
+        PackURI("/ppt/slideMasters/slideMaster1.xml"),
+        CT.PML_SLIDE_MASTER,
+        element("p:sldMaster/p:sldLayoutIdLst/p:sldLayoutId{r:id=rId1}"),
+        package,
+    )
+    prs_part.relate_to(master_part, RT.SLIDE_MASTER)
+    layout_part = SlideLayoutPart(
+        PackURI("/ppt/slideLayouts/slideLayout1.xml"),
+        CT.PML_SLIDE_LAYOUT,
+        element("p:sldLayout/p:cSld{name=%s}" % layout_name),
+        package,
+    )
+    master_part.relate_to(layout_part, RT.SLIDE_LAYOUT)
+    layout_part.relate_to(master_part, RT.SLIDE_MASTER)
+    theme_part = XmlPart(
+        PackURI("/ppt/theme/theme1.xml"), CT.OFC_THEME, element("a:theme"), package
+    )
+    master_part.relate_to(theme_part, RT.THEME)
+    return layout_part
+
+
+def _slide_part(package, idx):
+    partname = PackURI("/ppt/slides/slide%d.xml" % idx)
+    return SlidePart(partname, CT.PML_SLIDE, element("p:sld"), package)
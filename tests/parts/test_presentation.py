@@ -9,15 +9,17 @@ from __future__ import absolute_import, print_function
 import pytest
 
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part
 from pptx.opc.packuri import PackURI
 from pptx.package import Package
+from pptx.parts.clone import RelationshipCloner
 from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.presentation import PresentationPart
-from pptx.parts.slide import NotesMasterPart, SlidePart
+from pptx.parts.slide import NotesMasterPart, SlideMasterPart, SlidePart
 from pptx.presentation import Presentation
 from pptx.slide import NotesMaster, Slide, SlideLayout, SlideMaster
 
-from ..unitutil.cxml import element
+from ..unitutil.cxml import element, xml
 from ..unitutil.mock import call, class_mock, instance_mock, method_mock, property_mock
 
 
@@ -101,6 +103,84 @@ class DescribePresentationPart(object):
         assert rId is rId_
         assert slide is slide_
 
+    def it_can_import_slides_from_another_package(self, request):
+        slide_parts_ = [instance_mock(request, SlidePart) for _ in range(2)]
+        new_slide_parts_ = [instance_mock(request, SlidePart) for _ in range(2)]
+        master_part_ = instance_mock(request, SlideMasterPart)
+        cloner_ = instance_mock(request, RelationshipCloner)
+        cloner_.copy_parts.return_value = new_slide_parts_
+        cloner_.copies = [new_slide_parts_[0], master_part_, new_slide_parts_[1]]
+        RelationshipCloner_ = class_mock(
+            request, "pptx.parts.presentation.RelationshipCloner", return_value=cloner_
+        )
+        _add_slide_master_parts_ = method_mock(
+            request, PresentationPart, "_add_slide_master_parts"
+        )
+        prs_part = PresentationPart(
+            PackURI("/ppt/presentation.xml"),
+            None,
+            element("p:presentation/p:sldIdLst/p:sldId{id=256,r:id=rId1}"),
+        )
+        prs_part.rels.add_relationship(RT.SLIDE, None, "rId1")
+
+        slides = prs_part.import_slides(slide_parts_)
+
+        RelationshipCloner_.assert_called_once_with(prs_part)
+        cloner_.copy_parts.assert_called_once_with(slide_parts_)
+        _add_slide_master_parts_.assert_called_once_with([master_part_])
+        assert prs_part.related_parts["rId2"] is new_slide_parts_[0]
+        assert prs_part.related_parts["rId3"] is new_slide_parts_[1]
+        assert prs_part._element.xml == xml(
+            "p:presentation/p:sldIdLst/(p:sldId{id=256,r:id=rId1},p:sldId{id=257,r:"
+            "id=rId2},p:sldId{id=258,r:id=rId3})"
+        )
+        assert slides == [slide_part_.slide for slide_part_ in new_slide_parts_]
+
+    def it_adds_slide_master_parts_with_unique_ids_to_help(self):
+        prs_part = PresentationPart(
+            PackURI("/ppt/presentation.xml"),
+            None,
+            element(
+                "p:presentation/p:sldMasterIdLst/p:sldMasterId{id=2147483648,r:id=rId1}"
+            ),
+        )
+        prs_part.rels.add_relationship(
+            RT.SLIDE_MASTER,
+            SlideMasterPart(
+                None,
+                None,
+                element(
+                    "p:sldMaster/p:sldLayoutIdLst/(p:sldLayoutId{id=2147483649},p:"
+                    "sldLayoutId{id=2147483655})"
+                ),
+            ),
+            "rId1",
+        )
+        master_parts = [
+            SlideMasterPart(
+                None,
+                None,
+                element(
+                    "p:sldMaster/p:sldLayoutIdLst/(p:sldLayoutId{id=2147483649},p:"
+                    "sldLayoutId{id=2147483650})"
+                ),
+            ),
+            SlideMasterPart(None, None, element("p:sldMaster")),
+        ]
+
+        prs_part._add_slide_master_parts(master_parts)
+
+        assert prs_part._element.xml == xml(
+            "p:presentation/p:sldMasterIdLst/(p:sldMasterId{id=2147483648,r:id=rId1}"
+            ",p:sldMasterId{id=2147483656,r:id=rId2},p:sldMasterId{id=2147483659,r:"
+            "id=rId3})"
+        )
+        assert master_parts[0]._element.xml == xml(
+            "p:sldMaster/p:sldLayoutIdLst/(p:sldLayoutId{id=2147483657},p:sldLayout"
+            "Id{id=2147483658})"
+        )
+        assert prs_part.related_parts["rId3"] is master_parts[1]
+
     def it_finds_the_slide_id_of_a_slide_part(self, slide_id_fixture):
         prs_part, slide_part_, expected_value = slide_id_fixture
         _slide_id = prs_part.slide_id(slide_part_)
@@ -116,6 +196,42 @@ class DescribePresentationPart(object):
         slide = prs_part.get_slide(slide_id)
         assert slide == expected_value
 
+    def it_does_not_rename_slide_parts_when_a_slide_was_not_loaded(
+        self, related_parts_prop_
+    ):
+        prs_part = PresentationPart(None, None, None)
+        slide_part = SlidePart(PackURI("/ppt/slides/slide7.xml"), None, None)
+        related_parts_prop_.return_value = {
+            "rId1": slide_part,
+            "rId2": Part(PackURI("/ppt/slides/slide3.xml"), None),
+        }
+
+        prs_part.rename_slide_parts(("rId1", "rId2"))
+
+        assert slide_part.partname == "/ppt/slides/slide7.xml"
+
+    def it_uses_the_next_free_slide_partname_when_partially_loaded(self, package_):
+        prs_elm = element("p:presentation/p:sldIdLst/(p:sldId,p:sldId)")
+        prs_part = PresentationPart(None, None, prs_elm, package_)
+        package_.is_partial = True
+        package_.next_partname.return_value = PackURI("/ppt/slides/slide2.xml")
+
+        partname = prs_part._next_slide_partname
+
+        package_.next_partname.assert_called_once_with("/ppt/slides/slide%d.xml")
+        assert partname == "/ppt/slides/slide2.xml"
+
+    def it_knows_whether_a_related_slide_was_loaded(
+        self, slide_part_, related_parts_prop_
+    ):
+        prs_part = PresentationPart(None, None, None, None)
+        related_parts_prop_.return_value = {
+            "rId1": slide_part_,
+            "rId2": Part(None, None),
+        }
+        assert prs_part.is_loaded_slide("rId1") is True
+        assert prs_part.is_loaded_slide("rId2") is False
+
     def it_knows_the_next_slide_partname_to_help(self, next_fixture):
         prs_part, partname = next_fixture
         assert prs_part._next_slide_partname == partname
@@ -181,9 +297,10 @@ class DescribePresentationPart(object):
         return prs_part, rId, slide_master_
 
     @pytest.fixture
-    def next_fixture(self):
+    def next_fixture(self, package_):
         prs_elm = element("p:presentation/p:sldIdLst/(p:sldId,p:sldId)")
-        prs_part = PresentationPart(None, None, prs_elm)
+        prs_part = PresentationPart(None, None, prs_elm, package_)
+        package_.is_partial = False
         partname = PackURI("/ppt/slides/slide3.xml")
         return prs_part, partname
 
@@ -8,12 +8,17 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from pptx.api import Presentation
 from pptx.chart.data import ChartData
+from pptx.chart.prototype import ChartPrototype
+from pptx.dml.color import ColorFormat, RGBColor
 from pptx.enum.base import EnumValue
 from pptx.media import Video
 from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from pptx.opc.package import Part
 from pptx.opc.packuri import PackURI
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 from pptx.oxml.slide import CT_NotesMaster, CT_NotesSlide, CT_Slide
 from pptx.oxml.theme import CT_OfficeStyleSheet
 from pptx.package import Package
@@ -62,6 +67,51 @@ class DescribeBaseSlidePart(object):
         assert image_part is image_part_
         assert rId is rId_
 
+    def it_knows_the_master_part_it_inherits_from(self):
+        prs = Presentation()
+        slide_part = prs.slides.add_slide(prs.slide_layouts[0]).part
+        master_part = prs.slide_masters[0].part
+        notes_slide_part = slide_part.notes_slide.part
+
+        assert slide_part.master_part is master_part
+        assert prs.slide_layouts[0].part.master_part is master_part
+        assert master_part.master_part is master_part
+        assert notes_slide_part.master_part is prs.notes_master.part
+        assert prs.notes_master.part.master_part is prs.notes_master.part
+
+    def it_provides_theme_colors_read_once_for_its_master(self):
+        prs = Presentation()
+        layout = prs.slide_layouts[0]
+        slide_parts = [prs.slides.add_slide(layout).part for _ in range(2)]
+
+        theme_colors = slide_parts[0].theme_colors
+
+        assert slide_parts[1].theme_colors is theme_colors
+        assert layout.part.theme_colors is theme_colors
+        assert prs.slide_masters[0].part.style_cache["theme_colors"] is theme_colors
+
+    def it_uses_the_color_map_override_of_its_slide(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        clrMapOvr = slide._element.clrMapOvr
+        clrMapOvr.remove(clrMapOvr[0])
+        clrMapOvr.append(
+            parse_xml(
+                '<a:overrideClrMapping %s bg1="dk1" tx1="lt1" bg2="dk2" tx2="lt2" ac'
+                'cent1="accent1" accent2="accent2" accent3="accent3" accent4="accent4'
+                '" accent5="accent5" accent6="accent6" hlink="hlink" folHlink="folHli'
+                'nk"/>' % nsdecls("a")
+            )
+        )
+        color_format = ColorFormat.from_colorchoice_parent(
+            element("a:solidFill/a:schemeClr{val=bg1}")
+        )
+
+        assert slide.part.theme_colors.rgb(color_format) == RGBColor(0, 0, 0)
+        assert prs.slide_masters[0].theme_colors.rgb(color_format) == RGBColor(
+            0xFF, 0xFF, 0xFF
+        )
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -449,6 +499,22 @@ class DescribeSlidePart(object):
         slide_part.relate_to.assert_called_once_with(chart_part_, RT.CHART)
         assert _rId is rId
 
+    def it_can_add_a_chart_part_from_a_prototype(
+        self, request, package_, chart_data_, ChartPart_, chart_part_, relate_to_
+    ):
+        prototype_ = instance_mock(request, ChartPrototype)
+        ChartPart_.new_from_prototype.return_value = chart_part_
+        relate_to_.return_value = "rId42"
+        slide_part = SlidePart(None, None, None, package_)
+
+        rId = slide_part.add_chart_part_from_prototype(prototype_, chart_data_)
+
+        ChartPart_.new_from_prototype.assert_called_once_with(
+            prototype_, chart_data_, package_
+        )
+        relate_to_.assert_called_once_with(chart_part_, RT.CHART)
+        assert rId == "rId42"
+
     def it_can_get_or_add_a_video_part(self, goa_video_fixture):
         slide_part, video_, package_, relate_to_ = goa_video_fixture[:4]
         calls, media_rId, video_rId = goa_video_fixture[4:]
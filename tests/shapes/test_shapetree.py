@@ -8,6 +8,7 @@ import pytest
 
 from pptx.compat import BytesIO
 from pptx.chart.data import ChartData
+from pptx.chart.prototype import ChartPrototype
 from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, MSO_CONNECTOR, PP_PLACEHOLDER
 from pptx.oxml import parse_xml
 from pptx.oxml.shapes.autoshape import CT_Shape
@@ -15,6 +16,7 @@ from pptx.oxml.shapes.groupshape import CT_GroupShape
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.shapes.shared import BaseShapeElement, ST_Direction
 from pptx.media import SPEAKER_IMAGE_BYTES, Video
+from pptx.parts.clone import RelationshipCloner
 from pptx.parts.image import ImagePart
 from pptx.parts.slide import SlidePart
 from pptx.shapes.autoshape import AutoShapeType, Shape
@@ -112,7 +114,12 @@ class Describe_BaseShapes(object):
         assert len(shapes) == expected_count
 
     def it_can_iterate_over_the_shapes_it_contains(self, iter_fixture):
-        shapes, expected_shapes, BaseShapeFactory_, calls, = iter_fixture
+        (
+            shapes,
+            expected_shapes,
+            BaseShapeFactory_,
+            calls,
+        ) = iter_fixture
         assert [s for s in shapes] == expected_shapes
         assert BaseShapeFactory_.call_args_list == calls
 
@@ -309,6 +316,23 @@ class Describe_BaseGroupShapes(object):
         shapes._shape_factory.assert_called_once_with(shapes, graphicFrame)
         assert graphic_frame is graphic_frame_
 
+    def it_can_add_a_chart_from_a_prototype(self, add_chart_fixture, prototype_):
+        shapes, _, x, y, cx, cy, chart_data_ = add_chart_fixture[:7]
+        rId_, graphicFrame, graphic_frame_ = add_chart_fixture[7:]
+        shapes.part.add_chart_part_from_prototype.return_value = rId_
+
+        graphic_frame = shapes.add_chart_from(prototype_, x, y, cx, cy, chart_data_)
+
+        shapes.part.add_chart_part_from_prototype.assert_called_once_with(
+            prototype_, chart_data_
+        )
+        shapes._add_chart_graphicFrame.assert_called_once_with(
+            shapes, rId_, x, y, cx, cy
+        )
+        shapes._recalculate_extents.assert_called_once_with(shapes)
+        shapes._shape_factory.assert_called_once_with(shapes, graphicFrame)
+        assert graphic_frame is graphic_frame_
+
     def it_can_add_a_connector_shape(self, connector_fixture):
         shapes, connector_type, begin_x, begin_y = connector_fixture[:4]
         end_x, end_y, cxnSp_, connector_ = connector_fixture[4:]
@@ -824,6 +848,10 @@ class Describe_BaseGroupShapes(object):
     def picture_(self, request):
         return instance_mock(request, Picture)
 
+    @pytest.fixture
+    def prototype_(self, request):
+        return instance_mock(request, ChartPrototype)
+
     @pytest.fixture
     def _recalculate_extents_(self, request):
         return method_mock(
@@ -1259,6 +1287,57 @@ class DescribeSlideShapes(object):
         shapes.clone_layout_placeholders(slide_layout_)
         assert shapes.clone_placeholder.call_args_list == calls
 
+    def it_can_clone_a_shape(self, request, shape_, RelationshipCloner_, cloner_):
+        _clone_shape_ = method_mock(request, SlideShapes, "_clone_shape")
+        shapes = SlideShapes(None, None)
+        property_mock(request, SlideShapes, "part", return_value="part")
+
+        clone = shapes.clone_shape(shape_, 1, 2, 3, 4)
+
+        RelationshipCloner_.assert_called_once_with("part")
+        _clone_shape_.assert_called_once_with(shape_, cloner_, 1, 2, 3, 4)
+        assert clone is _clone_shape_.return_value
+
+    def it_can_clone_several_shapes_at_once(
+        self, request, RelationshipCloner_, cloner_
+    ):
+        _clone_shape_ = method_mock(
+            request, SlideShapes, "_clone_shape", side_effect=["clone1", "clone2"]
+        )
+        shapes = SlideShapes(None, None)
+        property_mock(request, SlideShapes, "part", return_value="part")
+
+        clones = shapes.clone_shapes(["shape1", "shape2"])
+
+        RelationshipCloner_.assert_called_once_with("part")
+        assert _clone_shape_.call_args_list == [
+            call("shape1", cloner_),
+            call("shape2", cloner_),
+        ]
+        assert clones == ["clone1", "clone2"]
+
+    def it_clones_a_shape_along_with_its_relationships_to_help(
+        self, shape_, cloner_, _shape_factory_
+    ):
+        sp = element(
+            "p:sp/(p:nvSpPr/p:cNvPr{id=2,name=Foo},p:spPr/a:xfrm/(a:off{x=1,y=2}"
+            ",a:ext{cx=3,cy=4}))"
+        )
+        shape_.element = sp
+        shapes = SlideShapes(element("p:spTree/p:nvGrpSpPr/p:cNvPr{id=1}"), None)
+
+        clone = shapes._clone_shape(shape_, cloner_, 10, 20)
+
+        new_sp = shapes._spTree[-1]
+        assert new_sp is not sp
+        cloner_.clone_rels.assert_called_once_with(new_sp, shape_.part)
+        assert new_sp.xml == xml(
+            "p:sp/(p:nvSpPr/p:cNvPr{id=2,name=Cloned shape 1},p:spPr/a:xfrm/(a:off"
+            "{x=10,y=20},a:ext{cx=3,cy=4}))"
+        )
+        _shape_factory_.assert_called_once_with(shapes, new_sp)
+        assert clone is _shape_factory_.return_value
+
     def it_adds_a_video_timing_to_help(self, add_timing_fixture):
         shapes, pic, sld, expected_xml = add_timing_fixture
         shapes._add_video_timing(pic)
@@ -1389,6 +1468,10 @@ class DescribeSlideShapes(object):
     def movie_(self, request):
         return instance_mock(request, Movie)
 
+    @pytest.fixture
+    def cloner_(self, request):
+        return instance_mock(request, RelationshipCloner)
+
     @pytest.fixture
     def _MoviePicElementCreator_(self, request):
         return class_mock(
@@ -1405,6 +1488,12 @@ class DescribeSlideShapes(object):
     def placeholder_(self, request):
         return instance_mock(request, Shape)
 
+    @pytest.fixture
+    def RelationshipCloner_(self, request, cloner_):
+        return class_mock(
+            request, "pptx.shapes.shapetree.RelationshipCloner", return_value=cloner_
+        )
+
     @pytest.fixture
     def shape_(self, request):
         return instance_mock(request, Shape)
@@ -1538,21 +1627,54 @@ class DescribeLayoutPlaceholders(object):
         _LayoutShapeFactory_.assert_called_once_with(sp, placeholders)
         assert placeholder is placeholder_
 
-    def it_can_find_a_placeholder_by_idx_value(self, get_fixture):
-        placeholders, idx, placeholder_ = get_fixture
-        assert placeholders.get(idx) is placeholder_
+    @pytest.mark.parametrize("idx", (0, 1))
+    def it_can_find_a_placeholder_by_idx_value(self, idx, _LayoutShapeFactory_):
+        spTree = element(
+            "p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{idx=0},p:sp/p:nvSpPr/p:nvPr/p:ph{"
+            "idx=1})"
+        )
+        placeholders = LayoutPlaceholders(spTree, None)
+
+        placeholder = placeholders.get(idx)
 
-    def it_returns_default_on_ph_idx_not_found(self, default_fixture):
-        placeholders, default = default_fixture
-        assert placeholders.get(42, default) is default
+        _LayoutShapeFactory_.assert_called_once_with(spTree[idx], placeholders)
+        assert placeholder is _LayoutShapeFactory_.return_value
 
-    # fixtures -------------------------------------------------------
+    def it_returns_default_on_ph_idx_not_found(self):
+        spTree = element("p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{idx=1},p:sp)")
+        placeholders = LayoutPlaceholders(spTree, None)
+        assert placeholders.get(42, "barfoo") == "barfoo"
 
-    @pytest.fixture
-    def default_fixture(self, _iter_):
-        placeholders = LayoutPlaceholders(None, None)
-        default = "barfoo"
-        return placeholders, default
+    def it_reuses_its_placeholder_index(self, _iter_member_elms_):
+        spTree = element(
+            "p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{idx=0},p:sp/p:nvSpPr/p:nvPr/p:ph{"
+            "idx=1})"
+        )
+        _iter_member_elms_.side_effect = lambda: iter(spTree)
+        placeholders = LayoutPlaceholders(spTree, None)
+
+        for idx in (0, 1, 0, 1):
+            assert placeholders.get(idx).element is spTree[idx]
+
+        assert _iter_member_elms_.call_count == 1
+
+    def it_reflects_changes_to_the_placeholders(self):
+        spTree = element(
+            "p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{idx=0},p:sp/p:nvSpPr/p:nvPr/p:ph{"
+            "idx=1})"
+        )
+        placeholders = LayoutPlaceholders(spTree, None)
+        sp_0, sp_1 = spTree[0], spTree[1]
+        assert placeholders.get(0).element is sp_0
+
+        spTree.remove(sp_0)
+        assert placeholders.get(0) is None
+        sp_1.ph.idx = 0
+        assert placeholders.get(0).element is sp_1
+        spTree.append(element("p:sp/p:nvSpPr/p:nvPr/p:ph{idx=3}"))
+        assert placeholders.get(3).element is spTree[1]
+
+    # fixtures -------------------------------------------------------
 
     @pytest.fixture
     def factory_fixture(self, _LayoutShapeFactory_, placeholder_):
@@ -1560,24 +1682,11 @@ class DescribeLayoutPlaceholders(object):
         sp = element("p:sp")
         return placeholders, sp, _LayoutShapeFactory_, placeholder_
 
-    @pytest.fixture(params=[0, 1])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
-        idx = request.param
-        layout_placeholders = LayoutPlaceholders(None, None)
-        _placeholder_ = (placeholder_, placeholder_2_)[idx]
-        placeholder_.element.ph_idx, placeholder_2_.element.ph_idx = 0, 1
-        return layout_placeholders, idx, _placeholder_
-
     # fixture components ---------------------------------------------
 
     @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request,
-            LayoutPlaceholders,
-            "__iter__",
-            return_value=iter([placeholder_, placeholder_2_]),
-        )
+    def _iter_member_elms_(self, request):
+        return method_mock(request, LayoutPlaceholders, "_iter_member_elms")
 
     @pytest.fixture
     def _LayoutShapeFactory_(self, request, placeholder_):
@@ -1596,10 +1705,6 @@ class DescribeLayoutPlaceholders(object):
     def placeholder_(self, request):
         return instance_mock(request, LayoutPlaceholder)
 
-    @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, LayoutPlaceholder)
-
 
 class Describe_MasterShapeFactory(object):
     def it_constructs_a_master_placeholder_for_a_shape_element(self, factory_fixture):
@@ -1702,21 +1807,30 @@ class DescribeMasterPlaceholders(object):
         _MasterShapeFactory_.assert_called_once_with(sp, placeholders)
         assert placeholder is placeholder_
 
-    def it_can_find_a_placeholder_by_type(self, get_fixture):
-        placeholders, ph_type, placeholder_ = get_fixture
-        assert placeholders.get(ph_type) is placeholder_
+    @pytest.mark.parametrize(
+        ("ph_type", "expected_idx"),
+        ((PP_PLACEHOLDER.TITLE, 0), (PP_PLACEHOLDER.BODY, 1)),
+    )
+    def it_can_find_a_placeholder_by_type(
+        self, ph_type, expected_idx, _MasterShapeFactory_
+    ):
+        spTree = element(
+            "p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp/p:nvSpPr/p:nvPr/p:"
+            "ph{type=body,idx=1},p:sp/p:nvSpPr/p:nvPr/p:ph{type=body,idx=2})"
+        )
+        placeholders = MasterPlaceholders(spTree, None)
+
+        placeholder = placeholders.get(ph_type)
 
-    def it_returns_default_on_ph_type_not_found(self, default_fixture):
-        placeholders, default = default_fixture
-        assert placeholders.get(42, default) is default
+        _MasterShapeFactory_.assert_called_once_with(spTree[expected_idx], placeholders)
+        assert placeholder is _MasterShapeFactory_.return_value
 
-    # fixtures -------------------------------------------------------
+    def it_returns_default_on_ph_type_not_found(self):
+        spTree = element("p:spTree/(p:sp/p:nvSpPr/p:nvPr/p:ph{type=title},p:sp)")
+        placeholders = MasterPlaceholders(spTree, None)
+        assert placeholders.get(PP_PLACEHOLDER.BODY, "barfoo") == "barfoo"
 
-    @pytest.fixture
-    def default_fixture(self, _iter_):
-        placeholders = MasterPlaceholders(None, None)
-        default = "barfoo"
-        return placeholders, default
+    # fixtures -------------------------------------------------------
 
     @pytest.fixture
     def factory_fixture(self, _MasterShapeFactory_, placeholder_):
@@ -1724,24 +1838,8 @@ class DescribeMasterPlaceholders(object):
         sp = element("p:sp")
         return placeholders, sp, _MasterShapeFactory_, placeholder_
 
-    @pytest.fixture(params=["title", "body"])
-    def get_fixture(self, request, _iter_, placeholder_, placeholder_2_):
-        ph_type = request.param
-        placeholders = MasterPlaceholders(None, None)
-        _placeholder_ = {"title": placeholder_, "body": placeholder_2_}[ph_type]
-        return placeholders, ph_type, _placeholder_
-
     # fixture components ---------------------------------------------
 
-    @pytest.fixture
-    def _iter_(self, request, placeholder_, placeholder_2_):
-        return method_mock(
-            request,
-            MasterPlaceholders,
-            "__iter__",
-            return_value=iter([placeholder_, placeholder_2_]),
-        )
-
     @pytest.fixture
     def _MasterShapeFactory_(self, request, placeholder_):
         return function_mock(
@@ -1755,10 +1853,6 @@ class DescribeMasterPlaceholders(object):
     def placeholder_(self, request):
         return instance_mock(request, MasterPlaceholder, ph_type="title")
 
-    @pytest.fixture
-    def placeholder_2_(self, request):
-        return instance_mock(request, MasterPlaceholder, ph_type="body")
-
 
 class Describe_MoviePicElementCreator(object):
     def it_creates_a_new_movie_pic_element(self, movie_pic_fixture):
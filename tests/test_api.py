@@ -21,7 +21,13 @@ class DescribePresentation(object):
     def it_opens_default_template_on_no_path_provided(self, call_fixture):
         Package_, path, prs_ = call_fixture
         prs = Presentation()
-        Package_.open.assert_called_once_with(path)
+        Package_.open.assert_called_once_with(path, None, None)
+        assert prs is prs_
+
+    def it_passes_the_worker_count_to_the_package(self, call_fixture):
+        Package_, path, prs_ = call_fixture
+        prs = Presentation(workers=4)
+        Package_.open.assert_called_once_with(path, 4, None)
         assert prs is prs_
 
     # fixtures -------------------------------------------------------
@@ -0,0 +1,147 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.inspect module.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import zipfile
+
+import pytest
+
+from pptx.api import Presentation
+from pptx.compat import BytesIO
+from pptx.inspect import _xml_stats, inspect_package, main, PackageReport
+
+from .unitutil.file import testfile
+
+
+class DescribeInspectPackage(object):
+    def it_reports_the_size_of_each_part(self, pkg_file):
+        report = inspect_package(pkg_file)
+
+        zipf = zipfile.ZipFile(pkg_file)
+        part_infos = dict((p.partname, p) for p in report.parts)
+        assert "/[Content_Types].xml" not in part_infos
+        assert not any(partname.endswith(".rels") for partname in part_infos)
+        info = zipf.getinfo("ppt/presentation.xml")
+        part_info = part_infos["/ppt/presentation.xml"]
+        assert part_info.size == info.file_size
+        assert part_info.compressed_size == info.compress_size
+        assert part_info.content_type == (
+            "application/vnd.openxmlformats-officedocument.presentationml.presen"
+            "tation.main+xml"
+        )
+        assert part_info.element_count is None
+        assert report.size == sum(p.size for p in report.parts)
+
+    def it_counts_the_relationships_targeting_each_part(self, pkg_file):
+        report = inspect_package(pkg_file)
+
+        part_infos = dict((p.partname, p) for p in report.parts)
+        assert part_infos["/ppt/presentation.xml"].reference_count == 1
+        # ---the presentation and each of the 11 layouts refer to the master---
+        assert part_infos["/ppt/slideMasters/slideMaster1.xml"].reference_count == 12
+        assert part_infos["/ppt/media/image1.png"].reference_count == 2
+
+    def it_finds_parts_having_identical_content(self, pkg_file):
+        report = inspect_package(pkg_file)
+        assert report.duplicate_groups == [
+            ["/ppt/slides/slide1.xml", "/ppt/slides/slide2.xml"],
+            ["/ppt/media/image1.png", "/ppt/media/image9.png"],
+        ]
+
+    def it_can_estimate_the_parsed_size_of_xml_parts(self, pkg_file):
+        report = inspect_package(pkg_file, parse=True)
+
+        part_infos = dict((p.partname, p) for p in report.parts)
+        assert part_infos["/ppt/presentation.xml"].element_count > 0
+        assert part_infos["/ppt/presentation.xml"].memory_estimate > 0
+        assert part_infos["/ppt/media/image1.png"].element_count is None
+
+    def it_reports_a_member_having_no_content_type(self, pkg_file):
+        zipf = zipfile.ZipFile(pkg_file, "a")
+        zipf.writestr("[trash]/0001.dat", b"stray")
+        zipf.close()
+        pkg_file.seek(0)
+
+        report = inspect_package(pkg_file, parse=True)
+
+        part_infos = dict((p.partname, p) for p in report.parts)
+        assert part_infos["/[trash]/0001.dat"].content_type is None
+        assert part_infos["/[trash]/0001.dat"].element_count is None
+        assert "/[trash]/0001.dat" in report.format()
+
+    def it_can_run_as_a_script(self, tmpdir, pkg_file, capsys):
+        path = str(tmpdir.join("deck.pptx"))
+        with open(path, "wb") as f:
+            f.write(pkg_file.getvalue())
+
+        assert main([path, "--top", "3"]) == 0
+
+        lines = capsys.readouterr()[0].splitlines()
+        assert lines[0].split() == [
+            "size",
+            "compressed",
+            "refs",
+            "elements",
+            "est.",
+            "memory",
+            "partname",
+        ]
+        assert lines[4].endswith("parts")
+        assert "/ppt/media/image9.png" in lines[-1]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def pkg_file(self):
+        prs = Presentation()
+        for _ in range(2):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide.shapes.add_picture(testfile("monty-truth.png"), 0, 0)
+        stream = BytesIO()
+        prs.save(stream)
+
+        # ---add an orphan copy of the image---
+        zipf = zipfile.ZipFile(stream, "a")
+        zipf.writestr("ppt/media/image9.png", zipf.read("ppt/media/image1.png"))
+        zipf.close()
+        stream.seek(0)
+        return stream
+
+
+class DescribePackageReport(object):
+    def it_formats_its_parts_largest_first(self):
+        report = inspect_package(_minimal_package())
+        lines = report.format().splitlines()
+        part_lines = lines[1:-2]
+        sizes = [int(line.split()[0]) for line in part_lines]
+        assert len(sizes) == len(report.parts)
+        assert sizes == sorted(sizes, reverse=True)
+
+    def it_reports_no_duplicates_when_there_are_none(self):
+        report = PackageReport([], [])
+        assert report.duplicate_groups == []
+        assert report.compressed_size == 0
+
+
+class Describe_xml_stats(object):
+    def it_counts_the_elements_of_xml(self):
+        element_count, memory_estimate = _xml_stats(b'<a x="1"><b>text</b><c/></a>')
+        assert element_count == 3
+        assert memory_estimate > 3 * 120
+
+    def it_does_not_resolve_entities(self):
+        blob = b'<!DOCTYPE a [<!ENTITY e "%s">]><a>&e;&e;&e;&e;</a>' % (b"x" * 10000)
+        element_count, memory_estimate = _xml_stats(blob)
+        assert element_count == 1
+        assert memory_estimate < 10000
+
+
+def _minimal_package():
+    stream = BytesIO()
+    Presentation().save(stream)
+    stream.seek(0)
+    return stream
@@ -0,0 +1,112 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.instrumentation module.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from pptx import instrumentation
+from pptx.api import Presentation
+from pptx.compat import BytesIO
+from pptx.instrumentation import Recorder, _null_span
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+
+from .unitutil.mock import Mock
+
+
+class DescribeInstrumentation(object):
+    def it_is_disabled_by_default(self):
+        assert instrumentation.enabled is False
+        assert instrumentation.span("foo") is _null_span
+
+    def it_reports_each_span_to_the_listener(self):
+        listener = Mock(name="listener")
+        instrumentation.set_listener(listener)
+
+        with instrumentation.span("foo", "/ppt/slides/slide1.xml"):
+            pass
+
+        assert instrumentation.enabled is True
+        name, elapsed, detail = listener.call_args[0]
+        assert name == "foo"
+        assert elapsed >= 0.0
+        assert detail == "/ppt/slides/slide1.xml"
+
+    def it_counts_only_while_enabled(self):
+        instrumentation.count("foo")
+        assert instrumentation.counters() == {}
+
+        with instrumentation.listening(Recorder()):
+            instrumentation.count("foo")
+            instrumentation.count("foo", 2)
+        instrumentation.count("foo")
+
+        assert instrumentation.counters() == {"foo": 3}
+        instrumentation.reset_counters()
+        assert instrumentation.counters() == {}
+
+    def it_restores_the_prior_listener_after_listening(self):
+        prior_listener = Recorder()
+        instrumentation.set_listener(prior_listener)
+
+        with instrumentation.listening(Recorder()) as recorder:
+            assert instrumentation._listener is recorder
+
+        assert instrumentation._listener is prior_listener
+
+    def it_counts_xpath_evaluations(self):
+        element = parse_xml("<a:p %s/>" % nsdecls("a"))
+        with instrumentation.listening(Recorder()):
+            element.xpath("./a:r")
+            element.xpath("./a:br")
+        assert instrumentation.counters() == {"xpath": 2}
+
+    def it_reports_the_phases_of_load_and_save(self):
+        recorder = Recorder()
+
+        with instrumentation.listening(recorder):
+            prs = Presentation()
+            prs.save(BytesIO())
+
+        totals = recorder.totals()
+        for name in (
+            "PackageReader.from_file",
+            "Unmarshaller.unmarshal",
+            "parse_xml",
+            "PackageWriter.write",
+            "serialize",
+            "compress",
+        ):
+            assert totals[name][0] > 0
+        assert totals["PackageReader.from_file"][0] == 1
+        parsed_partnames = [d for n, _, d in recorder.spans if n == "parse_xml"]
+        assert "/ppt/presentation.xml" in parsed_partnames
+        assert instrumentation.counters()["parts_parsed"] == len(parsed_partnames)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(autouse=True)
+    def disable_instrumentation(self):
+        instrumentation.reset_counters()
+        yield
+        instrumentation.set_listener(None)
+        instrumentation.reset_counters()
+
+
+class DescribeRecorder(object):
+    def it_totals_the_spans_reported_to_it(self):
+        recorder = Recorder()
+        recorder("foo", 1.0, None)
+        recorder("bar", 0.5, "/ppt/slides/slide1.xml")
+        recorder("foo", 2.0, None)
+
+        assert recorder.spans == [
+            ("foo", 1.0, None),
+            ("bar", 0.5, "/ppt/slides/slide1.xml"),
+            ("foo", 2.0, None),
+        ]
+        assert recorder.totals() == {"foo": (2, 3.0), "bar": (1, 0.5)}
@@ -8,16 +8,21 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from pptx.api import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.compat import BytesIO
+from pptx.enum.chart import XL_CHART_TYPE
 from pptx.media import Video
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-from pptx.opc.package import Part, _Relationship
+from pptx.opc.package import Part, _Relationship, XmlPart
 from pptx.opc.packuri import PackURI
 from pptx.package import _ImageParts, _MediaParts, Package
 from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.image import Image, ImagePart
 from pptx.parts.media import MediaPart
+from pptx.parts.slide import SlidePart
 
-
+from .unitutil.file import testfile
 from .unitutil.mock import call, class_mock, instance_mock, method_mock, property_mock
 
 
@@ -26,6 +31,101 @@ class DescribePackage(object):
         pkg = Package.open("pptx/templates/default.pptx")
         assert isinstance(pkg.core_properties, CorePropertiesPart)
 
+    def it_can_open_with_only_selected_slides_loaded(self, deck_blob):
+        pkg = Package.open(BytesIO(deck_blob), slides=[1])
+        parts_by_name = dict((part.partname, part) for part in pkg.iter_parts())
+        partnames = set(pkg.iter_partnames())
+
+        assert pkg.is_partial is True
+        assert isinstance(parts_by_name["/ppt/slides/slide2.xml"], SlidePart)
+        assert isinstance(parts_by_name["/ppt/slideLayouts/slideLayout6.xml"], XmlPart)
+        assert isinstance(parts_by_name["/ppt/media/image2.png"], ImagePart)
+        for partname in ("/ppt/slides/slide1.xml", "/ppt/slides/slide3.xml"):
+            assert type(parts_by_name[partname]) is Part
+        for partname in ("/ppt/media/image1.png", "/ppt/charts/chart1.xml"):
+            assert partname not in parts_by_name
+            assert partname in partnames
+
+    def it_avoids_the_partnames_of_items_not_loaded(self, deck_blob):
+        pkg = Package.open(BytesIO(deck_blob), slides=[1])
+        assert pkg.next_image_partname("png") == "/ppt/media/image3.png"
+        assert pkg.next_partname("/ppt/charts/chart%d.xml") == (
+            "/ppt/charts/chart2.xml"
+        )
+
+    def it_can_select_the_slides_to_load_with_a_predicate(self, deck_blob):
+        prs = Package.open(
+            BytesIO(deck_blob), slides=lambda idx: idx != 1
+        ).presentation_part.presentation
+
+        assert [slide.shapes.title.text for slide in prs.slides] == [
+            "Slide 0",
+            "Slide 2",
+        ]
+
+    def it_raises_on_a_selected_slide_index_out_of_range(self, deck_blob):
+        with pytest.raises(IndexError):
+            Package.open(BytesIO(deck_blob), slides=[3])
+
+    def it_saves_the_slides_not_loaded_unchanged(self, deck_blob):
+        prs = Package.open(
+            BytesIO(deck_blob), slides=[1]
+        ).presentation_part.presentation
+        assert len(prs.slides) == 1
+        prs.slides[0].shapes.title.text = "Changed"
+        new_slide = prs.slides.add_slide(prs.slide_layouts[5])
+        new_slide.shapes.title.text = "New"
+        assert new_slide.part.partname == "/ppt/slides/slide4.xml"
+        stream = BytesIO()
+        prs.save(stream)
+
+        original_pkg = Package.open(BytesIO(deck_blob))
+        saved_pkg = Package.open(BytesIO(stream.getvalue()))
+        saved_prs = saved_pkg.presentation_part.presentation
+        assert [slide.shapes.title.text for slide in saved_prs.slides] == [
+            "Slide 0",
+            "Changed",
+            "Slide 2",
+            "New",
+        ]
+        original_blobs = dict((p.partname, p.blob) for p in original_pkg.iter_parts())
+        saved_blobs = dict((p.partname, p.blob) for p in saved_pkg.iter_parts())
+        for partname in (
+            "/ppt/slides/slide1.xml",
+            "/ppt/charts/chart1.xml",
+            "/ppt/media/image1.png",
+        ):
+            assert saved_blobs[partname] == original_blobs[partname]
+        assert sorted(saved_blobs) == sorted(
+            list(original_blobs) + ["/ppt/slides/slide4.xml"]
+        )
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(scope="module")
+    def deck_blob(self):
+        """
+        Three title-only slides, the first with a picture and a chart of its
+        own and the second with a different picture.
+        """
+        prs = Presentation()
+        for idx in range(3):
+            slide = prs.slides.add_slide(prs.slide_layouts[5])
+            slide.shapes.title.text = "Slide %d" % idx
+            if idx < 2:
+                image = ("monty-truth.png", "python-powered.png")[idx]
+                slide.shapes.add_picture(testfile(image), 0, 0)
+            if idx == 0:
+                chart_data = CategoryChartData()
+                chart_data.categories = ["a", "b"]
+                chart_data.add_series("S1", (1, 2))
+                slide.shapes.add_chart(
+                    XL_CHART_TYPE.COLUMN_CLUSTERED, 0, 0, 100, 100, chart_data
+                )
+        stream = BytesIO()
+        prs.save(stream)
+        return stream.getvalue()
+
     def it_can_get_or_add_an_image_part(self, image_part_fixture):
         package, image_file, image_parts_, image_part_ = image_part_fixture
         image_part = package.get_or_add_image_part(image_file)
@@ -0,0 +1,69 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.parallel module.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from pptx.api import Presentation
+from pptx.compat import BytesIO
+from pptx.parallel import _partition, build
+from pptx.util import Inches
+
+from .unitutil.file import testfile
+
+
+def add_titled_slide(prs, spec):
+    slide = prs.slides.add_slide(prs.slide_layouts[5])
+    slide.shapes.title.text = spec
+    slide.shapes.add_picture(testfile("python-icon.jpeg"), Inches(1), Inches(1))
+
+
+class DescribeBuild(object):
+    @pytest.mark.parametrize("workers", (1, 2))
+    def it_builds_the_slides_in_order(self, workers):
+        specs = ["Slide %d" % idx for idx in range(5)]
+
+        prs = build(None, specs, add_titled_slide, workers=workers)
+
+        assert [slide.shapes.title.text for slide in prs.slides] == specs
+
+    def it_shares_the_template_layouts_and_images(self):
+        prs = build(None, ["a", "b", "c"], add_titled_slide, workers=3)
+
+        assert len(prs.slide_masters) == 1
+        assert len(prs.slide_layouts) == 11
+        layout_parts = set(slide.slide_layout.part for slide in prs.slides)
+        assert layout_parts == set([prs.slide_layouts[5].part])
+        image_parts = list(prs.part.package._image_parts)
+        assert len(image_parts) == 1
+
+    def it_keeps_the_template_slides_first(self):
+        template = BytesIO()
+        template_prs = Presentation()
+        template_prs.slides.add_slide(template_prs.slide_layouts[0])
+        template_prs.save(template)
+        template.seek(0)
+
+        prs = build(template, ["x", "y"], add_titled_slide, workers=2)
+
+        slides = list(prs.slides)
+        assert len(slides) == 3
+        assert [s.shapes.title.text for s in slides[1:]] == ["x", "y"]
+
+
+class Describe_partition(object):
+    @pytest.mark.parametrize(
+        ("items", "count", "expected_value"),
+        (
+            ([1, 2, 3, 4, 5], 2, [[1, 2], [3, 4, 5]]),
+            ([1, 2, 3], 3, [[1], [2], [3]]),
+            ([1, 2], 4, [[1], [2]]),
+            ([], 4, []),
+        ),
+    )
+    def it_splits_items_into_contiguous_runs(self, items, count, expected_value):
+        assert _partition(items, count) == expected_value
@@ -12,10 +12,10 @@ from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.presentation import PresentationPart
 from pptx.parts.slide import NotesMasterPart
 from pptx.presentation import Presentation
-from pptx.slide import SlideLayouts, SlideMaster, SlideMasters, Slides
+from pptx.slide import Slide, SlideLayouts, SlideMaster, SlideMasters, Slides
 
 from .unitutil.cxml import element, xml
-from .unitutil.mock import class_mock, instance_mock, property_mock
+from .unitutil.mock import call, class_mock, instance_mock, property_mock
 
 
 class DescribePresentation(object):
@@ -82,6 +82,39 @@ class DescribePresentation(object):
         prs.save(file_)
         prs_part_.save.assert_called_once_with(file_)
 
+    def it_can_extract_the_text_of_its_slides(self, request, slides_prop_):
+        slide_ = instance_mock(request, Slide, has_notes_slide=True)
+        slide_.iter_text.return_value = iter([(2, 0, "foo"), (2, 1, "bar")])
+        slide_.notes_slide.iter_text.return_value = iter([(3, 0, "baz")])
+        slide_2_ = instance_mock(request, Slide, has_notes_slide=False)
+        slide_2_.iter_text.return_value = iter([(4, 0, "foo")])
+        slides_prop_.return_value = [slide_, slide_2_]
+        prs = Presentation(None, None)
+
+        texts = list(prs.extract_text(notes=True))
+
+        assert texts == [
+            (0, 2, 0, "foo"),
+            (0, 2, 1, "bar"),
+            (0, 3, 0, "baz"),
+            (1, 4, 0, "foo"),
+        ]
+
+    def it_can_import_slides_from_another_presentation(self, request, prs_part_):
+        slides_ = [instance_mock(request, Slide) for _ in range(3)]
+        other_prs_ = instance_mock(request, Presentation, slides=slides_)
+        prs_part_.import_slides.return_value = ["slide1", "slide2"]
+        prs = Presentation(None, prs_part_)
+
+        new_slides = prs.import_slides(other_prs_, slides_[1:])
+        all_slides = prs.import_slides(other_prs_)
+
+        assert prs_part_.import_slides.call_args_list == [
+            call([slides_[1].part, slides_[2].part]),
+            call([slide_.part for slide_ in slides_]),
+        ]
+        assert new_slides == all_slides == ["slide1", "slide2"]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -240,6 +273,10 @@ class DescribePresentation(object):
     def Slides_(self, request, slides_):
         return class_mock(request, "pptx.presentation.Slides", return_value=slides_)
 
+    @pytest.fixture
+    def slides_prop_(self, request):
+        return property_mock(request, Presentation, "slides")
+
     @pytest.fixture
     def slides_(self, request):
         return instance_mock(request, Slides)
@@ -6,6 +6,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from pptx.dml.color import ThemeColors
 from pptx.dml.fill import FillFormat
 from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.package import Package
@@ -61,6 +62,32 @@ class Describe_BaseSlide(object):
         _Background_.assert_called_once_with(cSld)
         assert background is background_
 
+    def it_can_clear_the_style_cache_of_its_master(self, request):
+        part_ = instance_mock(request, SlidePart)
+        part_.master_part.style_cache = {"theme_fonts": {}}
+        slide = _BaseSlide(element("p:sld/p:cSld"), part_)
+
+        slide.clear_style_cache()
+
+        assert part_.master_part.style_cache == {}
+
+    def it_can_iterate_the_text_of_its_paragraphs(self):
+        sld = element(
+            'p:sld/p:cSld/p:spTree/p:sp/(p:nvSpPr/p:cNvPr{id=3},p:txBody/a:p/a:r/a:t"f'
+            'oo")'
+        )
+        slide = _BaseSlide(sld, None)
+
+        assert list(slide.iter_text()) == [(3, 0, "foo")]
+
+    def it_provides_access_to_its_theme_colors(self, request):
+        part_ = instance_mock(request, SlidePart)
+        theme_colors_ = instance_mock(request, ThemeColors)
+        part_.theme_colors = theme_colors_
+        slide = _BaseSlide(element("p:sld/p:cSld"), part_)
+
+        assert slide.theme_colors is theme_colors_
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -490,6 +517,16 @@ class DescribeSlides(object):
         slides, expected_value = len_fixture
         assert len(slides) == expected_value
 
+    def it_leaves_out_the_slides_not_loaded(self, prs_part_, part_prop_):
+        sldIdLst = element("p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})")
+        slides = Slides(sldIdLst, None)
+        prs_part_.package.is_partial = True
+        prs_part_.is_loaded_slide.side_effect = lambda rId: rId == "b"
+
+        assert len(slides) == 1
+        assert slides[0] is prs_part_.related_slide.return_value
+        prs_part_.related_slide.assert_called_once_with("b")
+
     def it_can_add_a_new_slide(self, add_fixture):
         slides, slide_layout_, part_ = add_fixture[:3]
         clone_layout_placeholders_, expected_xml, slide_ = add_fixture[3:]
@@ -542,7 +579,7 @@ class DescribeSlides(object):
         return slides, prs_part_, "rId1", slide_
 
     @pytest.fixture
-    def getitem_raises_fixture(self):
+    def getitem_raises_fixture(self, part_prop_):
         sldIdLst = element("p:sldIdLst/p:sldId{r:id=rId1}")
         slides = Slides(sldIdLst, None)
         return slides
@@ -573,13 +610,13 @@ class DescribeSlides(object):
             ("p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})", 2),
         ]
     )
-    def len_fixture(self, request):
+    def len_fixture(self, request, part_prop_):
         sldIdLst_cxml, expected_value = request.param
         slides = Slides(element(sldIdLst_cxml), None)
         return slides, expected_value
 
     @pytest.fixture
-    def raises_fixture(self):
+    def raises_fixture(self, part_prop_):
         slides = Slides(element("p:sldIdLst"), None)
         slide = Slide(element("p:sld"), None)
         return slides, slide
@@ -592,7 +629,9 @@ class DescribeSlides(object):
 
     @pytest.fixture
     def prs_part_(self, request):
-        return instance_mock(request, PresentationPart)
+        prs_part_ = instance_mock(request, PresentationPart)
+        prs_part_.package.is_partial = False
+        return prs_part_
 
     @pytest.fixture
     def slide_(self, request):
@@ -0,0 +1,141 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.split module.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+
+import pytest
+
+from pptx.api import Presentation
+from pptx.compat import BytesIO
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.split import _without_rIds, split
+from pptx.util import Inches
+
+from .unitutil.cxml import element, xml
+from .unitutil.file import testfile
+
+
+class DescribeSplit(object):
+    @pytest.mark.parametrize("workers", (None, 2))
+    def it_writes_each_slide_to_its_own_presentation(self, tmpdir, deck, workers):
+        out_dir = str(tmpdir.join("out"))
+
+        paths = split(deck, out_dir, workers=workers)
+
+        assert paths == [os.path.join(out_dir, "slide%d.pptx" % n) for n in (1, 2, 3)]
+        titles = []
+        for path in paths:
+            prs = Presentation(path)
+            assert len(prs.slides) == 1
+            assert len(prs.slide_layouts) == 11
+            titles.append(prs.slides[0].shapes.title.text)
+        assert titles == ["Slide 0", "Slide 1", "Slide 2"]
+
+    def it_keeps_only_the_parts_its_slide_uses(self, tmpdir, deck):
+        paths = split(deck, str(tmpdir), name="%02d.pptx")
+
+        assert [os.path.basename(path) for path in paths] == [
+            "01.pptx",
+            "02.pptx",
+            "03.pptx",
+        ]
+        first, second = Presentation(paths[0]), Presentation(paths[1])
+        assert len(list(first.part.package._image_parts)) == 1
+        assert first.slides[0].has_notes_slide
+        assert list(second.part.package._image_parts) == []
+        assert not second.slides[0].has_notes_slide
+
+    def it_removes_hyperlinks_to_other_slides(self, tmpdir, deck):
+        path = split(deck, str(tmpdir))[0]
+
+        slide_part = Presentation(path).slides[0].part
+        reltypes = [rel.reltype for rel in slide_part.rels.values()]
+        assert RT.SLIDE not in reltypes
+        assert slide_part._element.xpath("//a:hlinkClick/@r:id") == [""]
+
+    def it_can_drop_the_layouts_the_slide_does_not_use(self, tmpdir, deck):
+        paths = split(deck, str(tmpdir), drop_unused_layouts=True)
+
+        layout_names = []
+        for path in paths:
+            prs = Presentation(path)
+            assert len(prs.slide_masters) == 1
+            assert len(prs.slide_layouts) == 1
+            assert prs.slides[0].slide_layout == prs.slide_layouts[0]
+            layout_names.append(prs.slide_layouts[0].name)
+        assert layout_names == ["Title Only", "Title Only", "Title Slide"]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def deck(self):
+        prs = Presentation()
+        layouts = prs.slide_layouts
+        for idx, layout in enumerate((layouts[5], layouts[5], layouts[0])):
+            slide = prs.slides.add_slide(layout)
+            slide.shapes.title.text = "Slide %d" % idx
+        first_slide = prs.slides[0]
+        first_slide.notes_slide.notes_text_frame.text = "notes"
+        picture = first_slide.shapes.add_picture(
+            testfile("python-icon.jpeg"), Inches(1), Inches(1)
+        )
+        picture.click_action.target_slide = prs.slides[2]
+        stream = BytesIO()
+        prs.save(stream)
+        stream.seek(0)
+        return stream
+
+
+class Describe_without_rIds(object):
+    @pytest.mark.parametrize(
+        ("cxml", "rIds", "expected_cxml"),
+        (
+            (
+                "p:presentation/p:sldIdLst/(p:sldId{id=256,r:id=rId2},p:sldId{id=257,"
+                "r:id=rId3})",
+                ("rId2",),
+                "p:presentation/p:sldIdLst/p:sldId{id=257,r:id=rId3}",
+            ),
+            (
+                "p:sldMaster/p:sldLayoutIdLst/(p:sldLayoutId{r:id=rId1},p:sldLayout"
+                "Id{r:id=rId2})",
+                ("rId1",),
+                "p:sldMaster/p:sldLayoutIdLst/p:sldLayoutId{r:id=rId2}",
+            ),
+        ),
+    )
+    def it_removes_references_to_the_relationships(self, cxml, rIds, expected_cxml):
+        blob = _without_rIds(element(cxml).xml.encode("utf-8"), set(rIds))
+        assert parse_xml(blob).xml == xml(expected_cxml)
+
+    def it_clears_any_other_reference(self):
+        sld = element(
+            "p:sld/p:cSld/p:spTree/p:sp/p:nvSpPr/p:cNvPr/a:hlinkClick{r:id=rId4}"
+        )
+
+        slide = parse_xml(_without_rIds(sld.xml.encode("utf-8"), set(["rId4"])))
+
+        assert slide.xpath("//a:hlinkClick/@r:id") == [""]
+
+    def it_removes_section_entries_for_slides_no_longer_listed(self):
+        blob = (
+            '<p:presentation xmlns:p="http://schemas.openxmlformats.org/presentat'
+            'ionml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDo'
+            'cument/2006/relationships" xmlns:p14="http://schemas.microsoft.com/o'
+            'ffice/powerpoint/2010/main"><p:sldIdLst><p:sldId id="256" r:id="rId2'
+            '"/><p:sldId id="257" r:id="rId3"/></p:sldIdLst><p:extLst><p:ext><p14'
+            ':sectionLst><p14:section><p14:sldIdLst><p14:sldId id="256"/><p14:sld'
+            'Id id="257"/></p14:sldIdLst></p14:section></p14:sectionLst></p:ext><'
+            "/p:extLst></p:presentation>"
+        ).encode("utf-8")
+
+        presentation = parse_xml(_without_rIds(blob, set(["rId3"])))
+
+        section_ids = presentation.xpath("//p:extLst//@id")
+        assert section_ids == ["256"]
@@ -0,0 +1,107 @@
+# encoding: utf-8
+
+"""
+Test suite for pptx.streaming module.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import zipfile
+
+import pytest
+
+from pptx.api import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.compat import BytesIO
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.streaming import PresentationWriter
+
+from .unitutil.file import testfile
+from .unitutil.mock import method_mock
+
+
+class DescribePresentationWriter(object):
+    def it_writes_flushed_and_pending_slides(self, stream):
+        with PresentationWriter(stream) as writer:
+            layout = writer.presentation.slide_layouts[1]
+            for idx in range(4):
+                slide = writer.add_slide(layout)
+                slide.shapes.title.text = "Slide %d" % idx
+                if idx % 2:
+                    writer.flush(slide)
+
+        prs = Presentation(stream)
+        assert [s.shapes.title.text for s in prs.slides] == [
+            "Slide 0",
+            "Slide 1",
+            "Slide 2",
+            "Slide 3",
+        ]
+
+    def it_releases_the_xml_of_a_flushed_slide(self, stream):
+        writer = PresentationWriter(stream)
+        slide = writer.add_slide(writer.presentation.slide_layouts[6])
+        slide_part = slide.part
+
+        writer.flush(slide)
+
+        assert slide_part._element is None
+        writer.close()
+
+    def it_finds_the_shared_parts_only_when_they_can_have_changed(
+        self, request, stream
+    ):
+        writer = PresentationWriter(stream)
+        layout = writer.presentation.slide_layouts[6]
+        _find_shared_parts = method_mock(
+            request,
+            PresentationWriter,
+            "_find_shared_parts",
+            autospec=False,
+            side_effect=writer._find_shared_parts,
+        )
+        for _ in range(3):
+            writer.flush(writer.add_slide(layout))
+        assert _find_shared_parts.call_count == 1
+
+        slide = writer.add_slide(layout)
+        slide.notes_slide.notes_text_frame.text = "notes"
+        notes_master_part = writer.presentation.notes_master.part
+        writer.flush(slide)
+
+        assert _find_shared_parts.call_count == 2
+        assert notes_master_part._element is not None
+        writer.close()
+
+    def it_writes_each_dependent_part_once(self, stream):
+        image_file = testfile("monty-truth.png")
+        with PresentationWriter(stream) as writer:
+            layout = writer.presentation.slide_layouts[6]
+            for idx in range(3):
+                slide = writer.add_slide(layout)
+                slide.shapes.add_picture(image_file, 0, 0)
+                chart_data = CategoryChartData()
+                chart_data.categories = ["Foo", "Bar"]
+                chart_data.add_series("Series 1", (idx, 2))
+                slide.shapes.add_chart(
+                    XL_CHART_TYPE.BAR_CLUSTERED, 0, 0, 100, 100, chart_data
+                )
+                slide.notes_slide.notes_text_frame.text = "Notes %d" % idx
+                writer.flush(slide)
+
+        names = zipfile.ZipFile(stream).namelist()
+        assert len(names) == len(set(names))
+        assert [n for n in names if n.startswith("ppt/media/")] == [
+            "ppt/media/image1.png"
+        ]
+        prs = Presentation(stream)
+        slide = prs.slides[2]
+        chart = [shape for shape in slide.shapes if shape.has_chart][0].chart
+        assert chart.plots[0].series[0].values == (2.0, 2.0)
+        assert slide.notes_slide.notes_text_frame.text == "Notes 2"
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def stream(self):
+        return BytesIO()
@@ -6,6 +6,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from pptx.dml.color import RGBColor
 from pptx.dml.fill import FillFormat
 from pptx.enum.text import MSO_ANCHOR
 from pptx.oxml.ns import qn
@@ -18,6 +19,7 @@ from pptx.table import (
     _ColumnCollection,
     _Row,
     _RowCollection,
+    ColumnFormat,
     Table,
 )
 from pptx.text.text import TextFrame
@@ -61,6 +63,49 @@ class DescribeTable(object):
         table, expected_rows_ = rows_fixture
         assert table.rows is expected_rows_
 
+    def it_can_set_the_values_of_its_cells(self):
+        table = Table(CT_Table.new_tbl(3, 3, 300, 300), None)
+        rows = [["a", 1234.5, 0.25], ["b\nc", None, float("nan")]]
+        formats = [None, ",.1f", ColumnFormat(".0%", bold=True)]
+
+        table.set_values(rows, formats)
+
+        assert [cell.text for cell in table.iter_cells()] == [
+            "a",
+            "1,234.5",
+            "25%",
+            "b\nc",
+            "",
+            "",
+            "",
+            "",
+            "",
+        ]
+        assert table._tbl.xpath("./a:tr/a:tc[3]//a:r/a:rPr/@b") == ["1"]
+        assert table._tbl.xpath("./a:tr/a:tc[position()<3]//a:rPr") == []
+
+    def it_can_set_values_from_an_array_like(self, request):
+        table = Table(CT_Table.new_tbl(2, 2, 200, 200), None)
+        array = instance_mock(request, _ArrayLike)
+        array.tolist.return_value = [[1, 2], [3, 4]]
+
+        table.set_values(array)
+
+        assert [cell.text for cell in table.iter_cells()] == ["1", "2", "3", "4"]
+
+    def it_leaves_cells_of_NA_values_empty(self):
+        table = Table(CT_Table.new_tbl(1, 2, 200, 200), None)
+
+        table.set_values([[_NA(), 42]], [",.1f", None])
+
+        assert [cell.text for cell in table.iter_cells()] == ["", "42"]
+
+    @pytest.mark.parametrize("rows", ([[1], [2], [3]], [[1, 2, 3]]))
+    def it_raises_on_values_beyond_its_extent(self, rows):
+        table = Table(CT_Table.new_tbl(2, 2, 200, 200), None)
+        with pytest.raises(ValueError):
+            table.set_values(rows)
+
     def it_updates_graphic_frame_width_on_width_change(self, dx_fixture):
         table, expected_width = dx_fixture
         table.notify_width_changed()
@@ -132,6 +177,18 @@ class DescribeTable(object):
         return instance_mock(request, CT_TableCell)
 
 
+class DescribeColumnFormat(object):
+    def it_provides_the_rPr_for_its_font(self):
+        column_format = ColumnFormat(
+            italic=False, size=Pt(9), color=RGBColor(0x12, 0x34, 0x56)
+        )
+        rPr = column_format.new_rPr()
+        assert rPr.xml == xml("a:rPr{i=0,sz=900}/a:solidFill/a:srgbClr{val=123456}")
+
+    def it_provides_no_rPr_when_it_has_no_font(self):
+        assert ColumnFormat(",.2f").new_rPr() is None
+
+
 class DescribeTableBooleanProperties(object):
     def it_knows_its_boolean_property_settings(self, boolprop_get_fixture):
         table, boolprop_name, expected_value = boolprop_get_fixture
@@ -660,6 +717,60 @@ class Describe_ColumnCollection(object):
         with pytest.raises(IndexError):
             columns[9]
 
+    @pytest.mark.parametrize(
+        ("idx", "width", "expected_widths"),
+        (
+            (0, None, [100, 100, 200]),
+            (1, 50, [100, 50, 200]),
+            (2, None, [100, 200, 200]),
+        ),
+    )
+    def it_can_insert_a_column(self, request, idx, width, expected_widths):
+        tbl = CT_Table.new_tbl(2, 2, 200, 200)
+        tbl.tblGrid.gridCol_lst[1].w = 200
+        table_ = instance_mock(request, Table)
+        columns = _ColumnCollection(tbl, table_)
+
+        column = columns.insert(idx, width)
+
+        assert column._gridCol is tbl.tblGrid.gridCol_lst[idx]
+        assert [gridCol.w for gridCol in tbl.tblGrid.gridCol_lst] == expected_widths
+        assert [len(tr.tc_lst) for tr in tbl.tr_lst] == [3, 3]
+        table_.notify_width_changed.assert_called_once_with()
+
+    def it_can_delete_a_column(self, request):
+        tbl = CT_Table.new_tbl(2, 3, 300, 200)
+        tbl.tblGrid.gridCol_lst[2].w = 50
+        tbl.tc(1, 2).set_text("x")
+        table_ = instance_mock(request, Table)
+        columns = _ColumnCollection(tbl, table_)
+
+        columns.delete(1)
+
+        assert [gridCol.w for gridCol in tbl.tblGrid.gridCol_lst] == [100, 50]
+        assert [tc.text for tc in tbl.iter_tcs()] == ["", "", "", "x"]
+        table_.notify_width_changed.assert_called_once_with()
+
+    @pytest.mark.parametrize(
+        ("tr_cxml", "method", "idx"),
+        (
+            ("a:tr/(a:tc{gridSpan=2},a:tc{hMerge=1})", "delete", 0),
+            ("a:tr/(a:tc{gridSpan=2},a:tc{hMerge=1})", "delete", 1),
+            ("a:tr/(a:tc{gridSpan=2},a:tc{hMerge=1})", "insert", 1),
+        ),
+    )
+    def it_raises_on_change_within_a_merged_cell(self, tr_cxml, method, idx):
+        tbl = element("a:tbl/(a:tblGrid/(a:gridCol{w=1},a:gridCol{w=1}),%s)" % tr_cxml)
+        columns = _ColumnCollection(tbl, None)
+        with pytest.raises(ValueError):
+            getattr(columns, method)(idx)
+
+    @pytest.mark.parametrize(("method", "idx"), (("insert", 3), ("delete", 2)))
+    def it_raises_on_change_out_of_range(self, method, idx):
+        columns = _ColumnCollection(CT_Table.new_tbl(1, 2, 200, 100), None)
+        with pytest.raises(IndexError):
+            getattr(columns, method)(idx)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(
@@ -791,6 +902,56 @@ class Describe_RowCollection(object):
         with pytest.raises(IndexError):
             rows[9]
 
+    @pytest.mark.parametrize(
+        ("idx", "height", "expected_heights"),
+        (
+            (0, None, [100, 100, 200]),
+            (1, 50, [100, 50, 200]),
+            (2, None, [100, 200, 200]),
+        ),
+    )
+    def it_can_insert_a_row(self, request, idx, height, expected_heights):
+        tbl = CT_Table.new_tbl(2, 2, 200, 200)
+        tbl.tr_lst[1].h = 200
+        table_ = instance_mock(request, Table)
+        rows = _RowCollection(tbl, table_)
+
+        row = rows.insert(idx, height)
+
+        assert row._tr is tbl.tr_lst[idx]
+        assert [tr.h for tr in tbl.tr_lst] == expected_heights
+        assert [len(tr.tc_lst) for tr in tbl.tr_lst] == [2, 2, 2]
+        table_.notify_height_changed.assert_called_once_with()
+
+    def it_can_delete_a_row(self, request):
+        tbl = CT_Table.new_tbl(3, 2, 200, 300)
+        tbl.tc(2, 0).set_text("x")
+        table_ = instance_mock(request, Table)
+        rows = _RowCollection(tbl, table_)
+
+        rows.delete(1)
+
+        assert [tc.text for tc in tbl.iter_tcs()] == ["", "", "x", ""]
+        table_.notify_height_changed.assert_called_once_with()
+
+    @pytest.mark.parametrize(
+        ("method", "idx"), (("delete", 0), ("delete", 1), ("insert", 1))
+    )
+    def it_raises_on_change_within_a_merged_cell(self, method, idx):
+        tbl = element(
+            "a:tbl/(a:tblGrid/a:gridCol{w=1},a:tr{h=1}/a:tc{rowSpan=2},a:tr{h=1}/a:t"
+            "c{vMerge=1})"
+        )
+        rows = _RowCollection(tbl, None)
+        with pytest.raises(ValueError):
+            getattr(rows, method)(idx)
+
+    @pytest.mark.parametrize(("method", "idx"), (("insert", -1), ("delete", 1)))
+    def it_raises_on_change_out_of_range(self, method, idx):
+        rows = _RowCollection(CT_Table.new_tbl(1, 2, 200, 100), None)
+        with pytest.raises(IndexError):
+            getattr(rows, method)(idx)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=["a:tbl", "a:tbl/a:tr", "a:tbl/(a:tr, a:tr, a:tr)"])
@@ -814,3 +975,23 @@ class Describe_RowCollection(object):
         tbl_cxml, expected_len = request.param
         rows = _RowCollection(element(tbl_cxml), None)
         return rows, expected_len
+
+
+class _ArrayLike(object):
+    def tolist(self):
+        raise NotImplementedError
+
+
+class _NA(object):
+    """Behaves like `pandas.NA`, whose comparisons are NA and have no truth."""
+
+    def __ne__(self, other):
+        return self
+
+    def __bool__(self):
+        raise TypeError("boolean value of NA is ambiguous")
+
+    __nonzero__ = __bool__
+
+    def __format__(self, format_spec):
+        raise TypeError("unsupported format string passed to NAType.__format__")
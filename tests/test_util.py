@@ -9,7 +9,7 @@ from __future__ import absolute_import
 import pytest
 
 from pptx.compat import to_unicode
-from pptx.util import Length, Centipoints, Cm, Emu, Inches, Mm, Pt
+from pptx.util import Length, Centipoints, Cm, Emu, Inches, Mm, Pt, lazyproperty
 
 
 def test_to_unicode_raises_on_non_string():
@@ -61,3 +61,33 @@ class DescribeLength(object):
     def units_fixture(self, request):
         emu, units_prop_name, expected_length_in_units = request.param
         return emu, units_prop_name, expected_length_in_units
+
+
+class Describe_lazyproperty(object):
+    def it_computes_the_value_only_on_first_access(self):
+        class Obj(object):
+            calls = 0
+
+            @lazyproperty
+            def foo(self):
+                """Docstring of foo."""
+                Obj.calls += 1
+                return object()
+
+        obj = Obj()
+
+        assert obj.foo is obj.foo
+        assert Obj.calls == 1
+        assert Obj.foo.__doc__ == "Docstring of foo."
+
+    def it_returns_the_first_value_cached_when_threads_race(self):
+        winner = object()
+
+        class Obj(object):
+            @lazyproperty
+            def foo(self):
+                # ---another thread caches its value while this one computes---
+                self._foo = winner
+                return object()
+
+        assert Obj().foo is winner
@@ -6,9 +6,18 @@ Test suite for pptx.text.layout module
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import threading
+
 import pytest
 
-from pptx.text.layout import _BinarySearchTree, _Line, _LineSource, TextFitter
+from pptx.text.layout import (
+    _BinarySearchTree,
+    _Fonts,
+    _Line,
+    _LineSource,
+    _rendered_size,
+    TextFitter,
+)
 
 from ..unitutil.mock import (
     call,
@@ -17,6 +26,7 @@ from ..unitutil.mock import (
     initializer_mock,
     instance_mock,
     method_mock,
+    Mock,
     property_mock,
 )
 
@@ -281,9 +291,52 @@ class Describe_LineSource(object):
         assert all((a == b) for a, b in zip(expected, line_source))
 
 
+class Describe_Fonts(object):
+    def it_loads_each_font_only_once_across_threads(self, request, monkeypatch):
+        monkeypatch.setattr(_Fonts, "fonts", {})
+        truetype_ = function_mock(request, "pptx.text.layout.ImageFont.truetype")
+        fonts = []
+
+        def get_font():
+            fonts.append(_Fonts.font("foo.ttf", 12))
+
+        threads = [threading.Thread(target=get_font) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        truetype_.assert_called_once_with("foo.ttf", 12)
+        assert fonts == [truetype_.return_value] * 8
+
+
+class Describe_rendered_size(object):
+    def it_measures_text_with_getsize_when_available(self, request):
+        font_ = Mock(spec=["getsize"])
+        font_.getsize.return_value = (144, 36)
+        _Fonts_font_ = method_mock(
+            request, _Fonts, "font", autospec=False, return_value=font_
+        )
+
+        extents = _rendered_size("Typical", 18, "foo.ttf")
+
+        _Fonts_font_.assert_called_once_with("foo.ttf", 18)
+        font_.getsize.assert_called_once_with("Typical")
+        assert extents == (1828800, 457200)
+
+    def it_measures_text_with_getbbox_when_getsize_is_gone(self, request):
+        font_ = Mock(spec=["getbbox"])
+        font_.getbbox.return_value = (2, 4, 144, 36)
+        method_mock(request, _Fonts, "font", autospec=False, return_value=font_)
+
+        extents = _rendered_size("Typical", 18, "foo.ttf")
+
+        font_.getbbox.assert_called_once_with("Typical")
+        assert extents == (1828800, 457200)
+
+
 # produces different results on Linux, fails Travis-CI
 
-# from pptx.text.layout import _rendered_size
 # from ..unitutil.file import testfile
 # class Describe_rendered_size(object):
 
@@ -6,15 +6,29 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from pptx.api import Presentation
+from pptx.chart.data import CategoryChartData
 from pptx.compat import is_unicode
-from pptx.dml.color import ColorFormat
+from pptx.dml.color import ColorFormat, RGBColor
 from pptx.dml.fill import FillFormat
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.enum.dml import MSO_THEME_COLOR
 from pptx.enum.lang import MSO_LANGUAGE_ID
+from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE, MSO_UNDERLINE, PP_ALIGN
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.opc.package import Part
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 from pptx.shapes.autoshape import Shape
-from pptx.text.text import Font, _Hyperlink, _Paragraph, _Run, TextFrame
+from pptx.text.text import (
+    EffectiveFont,
+    Font,
+    _Hyperlink,
+    _Paragraph,
+    _Run,
+    TextFrame,
+)
 from pptx.util import Inches, Pt
 
 from ..oxml.unitdata.text import a_p, a_t, an_hlinkClick, an_r, an_rPr
@@ -838,7 +852,7 @@ class Describe_Paragraph(object):
 
     def it_provides_access_to_the_default_paragraph_font(self, paragraph, Font_):
         font = paragraph.font
-        Font_.assert_called_once_with(paragraph._defRPr)
+        Font_.assert_called_once_with(paragraph._defRPr, paragraph)
         assert font == Font_.return_value
 
     def it_knows_its_indentation_level(self, level_get_fixture):
@@ -1176,7 +1190,7 @@ class Describe_Run(object):
     def it_provides_access_to_its_font(self, font_fixture):
         run, rPr, Font_, font_ = font_fixture
         font = run.font
-        Font_.assert_called_once_with(rPr)
+        Font_.assert_called_once_with(rPr, run)
         assert font == font_
 
     def it_provides_access_to_a_hyperlink_proxy(self, hyperlink_fixture):
@@ -1253,3 +1267,170 @@ class Describe_Run(object):
     @pytest.fixture
     def hlink_(self, request):
         return instance_mock(request, _Hyperlink)
+
+
+class DescribeEffectiveFont(object):
+    """Unit-test suite for `pptx.text.text.EffectiveFont` objects."""
+
+    def it_provides_PowerPoint_defaults_for_values_not_found(self):
+        font = EffectiveFont({}, {"+mn-lt": "Calibri"})
+
+        assert font.size == Pt(18)
+        assert font.bold is False
+        assert font.italic is False
+        assert font.underline is False
+        assert font.name == "Calibri"
+        assert font.color is None
+
+    @pytest.mark.parametrize(
+        ("values", "expected_value"),
+        (
+            ({"name": "Arial"}, "Arial"),
+            ({"name": "+mj-lt"}, "Calibri Light"),
+            ({"name": "+mj-ea"}, None),
+        ),
+    )
+    def it_replaces_a_theme_font_reference_with_its_typeface(
+        self, values, expected_value
+    ):
+        theme_fonts = {"+mj-lt": "Calibri Light", "+mn-lt": "Calibri"}
+        assert EffectiveFont(values, theme_fonts).name == expected_value
+
+    @pytest.mark.parametrize(
+        ("u", "expected_value"),
+        (
+            (MSO_UNDERLINE.NONE, False),
+            (MSO_UNDERLINE.SINGLE_LINE, True),
+            (MSO_UNDERLINE.WAVY_LINE, MSO_UNDERLINE.WAVY_LINE),
+        ),
+    )
+    def it_knows_its_underline_setting(self, u, expected_value):
+        assert EffectiveFont({"underline": u}, {}).underline == expected_value
+
+    def it_provides_the_solid_color_of_the_text(self):
+        fill = element("a:solidFill/a:srgbClr{val=123456}")
+        assert EffectiveFont({"fill": fill}, {}).color.rgb == RGBColor(0x12, 0x34, 0x56)
+        assert EffectiveFont({"fill": element("a:noFill")}, {}).color is None
+
+
+class DescribeEffectiveTextProperties(object):
+    """Resolution of `font.effective` and `paragraph.effective_props`."""
+
+    def it_resolves_placeholder_text_from_the_master_text_styles(self, prs):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = "Title"
+        body = slide.placeholders[1].text_frame
+        body.text = "Level 0"
+        body.add_paragraph().text = "Level 1"
+        body.paragraphs[1].level = 1
+
+        title_font = slide.shapes.title.text_frame.paragraphs[0].runs[0].font
+        title_props = slide.shapes.title.text_frame.paragraphs[0].effective_props
+        assert title_font.effective.size == Pt(44)
+        assert title_font.effective.name == "Calibri"
+        assert title_props.alignment == PP_ALIGN.CENTER
+        assert [p.runs[0].font.effective.size for p in body.paragraphs] == [
+            Pt(32),
+            Pt(28),
+        ]
+        assert body.paragraphs[1].effective_props.level == 1
+
+    def it_gives_priority_to_the_values_nearest_the_text(self, prs):
+        layout = prs.slide_layouts[1]
+        layout_body = layout.placeholders[1]._element.txBody
+        layout_body.insert(
+            1,
+            parse_xml(
+                "<a:lstStyle %s>" % nsdecls("a") + _LVL1_SZ_4000 + "</a:lstStyle>"
+            ),
+        )
+        slide = prs.slides.add_slide(layout)
+        text_frame = slide.placeholders[1].text_frame
+        text_frame.text = "run"
+        paragraph = text_frame.paragraphs[0]
+        assert paragraph.runs[0].font.effective.size == Pt(40)
+
+        paragraph.font.italic = True
+        run_font = paragraph.runs[0].font
+        run_font.size = Pt(10)
+
+        assert run_font.effective.size == Pt(10)
+        assert run_font.effective.italic is True
+        assert paragraph.font.effective.size == Pt(40)
+
+    def it_resolves_shape_text_from_the_presentation_and_shape_style(self, prs):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        textbox = slide.shapes.add_textbox(0, 0, Inches(1), Inches(1))
+        textbox.text_frame.text = "text box"
+        autoshape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, 1, 1)
+        autoshape.text_frame.text = "autoshape"
+
+        textbox_font = textbox.text_frame.paragraphs[0].runs[0].font.effective
+        autoshape_font = autoshape.text_frame.paragraphs[0].runs[0].font.effective
+        assert textbox_font.size == Pt(18)
+        assert textbox_font.name == "Calibri"
+        assert autoshape_font.name == "Calibri"
+        assert autoshape_font.color.theme_color == MSO_THEME_COLOR.LIGHT_1
+
+    def it_caches_inherited_values_on_the_master(self, prs):
+        layout = prs.slide_layouts[5]
+        slides = [prs.slides.add_slide(layout) for _ in range(3)]
+        for slide in slides:
+            slide.shapes.title.text = "Title"
+        style_cache = prs.slide_masters[0].part.style_cache
+
+        slides[0].shapes.title.text_frame.paragraphs[0].runs[0].font.effective
+        cached_items = dict(style_cache)
+        for slide in slides[1:]:
+            slide.shapes.title.text_frame.paragraphs[0].runs[0].font.effective
+
+        assert len(cached_items) == 2
+        assert style_cache == cached_items
+
+    def and_it_sees_a_list_style_change_once_the_cache_is_cleared(self, prs):
+        layout = prs.slide_layouts[1]
+        slide = prs.slides.add_slide(layout)
+        text_frame = slide.placeholders[1].text_frame
+        text_frame.text = "run"
+        font = text_frame.paragraphs[0].runs[0].font
+        assert font.effective.size == Pt(32)
+
+        layout.placeholders[1]._element.txBody.insert(
+            1,
+            parse_xml(
+                "<a:lstStyle %s>" % nsdecls("a") + _LVL1_SZ_4000 + "</a:lstStyle>"
+            ),
+        )
+        layout.clear_style_cache()
+
+        assert font.effective.size == Pt(40)
+
+    def it_resolves_chart_text_without_a_master(self, prs):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        chart_data = CategoryChartData()
+        chart_data.categories = ["a", "b"]
+        chart_data.add_series("Series 1", (1, 2))
+        chart = slide.shapes.add_chart(
+            XL_CHART_TYPE.COLUMN_CLUSTERED, 0, 0, Inches(4), Inches(3), chart_data
+        ).chart
+        text_frame = chart.chart_title.text_frame
+        text_frame.text = "Title"
+        run = text_frame.paragraphs[0].runs[0]
+        run.font.size = Pt(24)
+
+        assert run.font.effective.size == Pt(24)
+        assert run.font.effective.name is None
+        assert text_frame.paragraphs[0].effective_props.alignment == PP_ALIGN.LEFT
+
+    def but_it_raises_for_a_font_not_in_a_run_or_paragraph(self):
+        with pytest.raises(ValueError):
+            Font(element("a:rPr")).effective
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def prs(self):
+        return Presentation()
+
+
+_LVL1_SZ_4000 = '<a:lvl1pPr><a:defRPr sz="4000"/></a:lvl1pPr>'
@@ -9,8 +9,7 @@ import sys
 
 from lxml import etree
 
-from pptx.oxml import oxml_parser
-
+from pptx.oxml import thread_parser
 
 _thisdir = os.path.split(__file__)[0]
 test_file_dir = os.path.abspath(os.path.join(_thisdir, "..", "test_files"))
@@ -36,7 +35,7 @@ def parse_xml_file(file_):
     """
     Return ElementTree for XML contained in *file_*
     """
-    return etree.parse(file_, oxml_parser)
+    return etree.parse(file_, thread_parser.parser)
 
 
 def snippet_seq(name, offset=0, count=sys.maxsize):